@@ -5,19 +5,25 @@ Implements LRU eviction and time-to-live for cached items.
 NASA Rule 10 Compliant: All functions ≤60 LOC
 """
 
-from typing import Any, Optional, Dict
+import heapq
+import time
+from typing import Any, Optional, Dict, List, Tuple
 from dataclasses import dataclass
-from datetime import datetime, timedelta
 from collections import OrderedDict
 from loguru import logger
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
-    """Cache entry with value and expiration time."""
+    """Cache entry with value and expiration time.
+
+    Slotted: no per-entry __dict__, which roughly halves bookkeeping per key.
+    expires_at is a time.monotonic() deadline, so wall-clock jumps do not
+    expire or resurrect entries.
+    """
 
     value: Any
-    expires_at: datetime
+    expires_at: float
 
 
 class MemoryCache:
@@ -39,6 +45,11 @@ class MemoryCache:
         self.ttl_seconds = ttl_seconds
         self.max_size = max_size
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        # Min-heap of (expires_at, key) so cleanup_expired() pops only the
+        # expired entries instead of scanning the whole cache. Overwritten,
+        # deleted and evicted keys leave stale heap items that are skipped
+        # on pop and dropped when the heap is compacted.
+        self._expiry_heap: List[Tuple[float, str]] = []
 
         logger.info(
             f"MemoryCache initialized (TTL={ttl_seconds}s, max_size={max_size})"
@@ -63,7 +74,7 @@ class MemoryCache:
         entry = self._cache[key]
 
         # Check expiration
-        if datetime.now() > entry.expires_at:
+        if time.monotonic() > entry.expires_at:
             del self._cache[key]
             logger.debug(f"Cache miss (expired): {key}")
             return None
@@ -86,7 +97,7 @@ class MemoryCache:
             raise ValueError("Key must be string")
 
         ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
-        expires_at = datetime.now() + timedelta(seconds=ttl)
+        expires_at = time.monotonic() + ttl
 
         # Evict oldest if at capacity
         if len(self._cache) >= self.max_size and key not in self._cache:
@@ -97,6 +108,9 @@ class MemoryCache:
         # Add/update entry
         self._cache[key] = CacheEntry(value=value, expires_at=expires_at)
         self._cache.move_to_end(key)
+        heapq.heappush(self._expiry_heap, (expires_at, key))
+        if len(self._expiry_heap) > 2 * len(self._cache) + 64:
+            self._compact_expiry_heap()
         logger.debug(f"Cache set: {key} (TTL={ttl}s)")
 
     def delete(self, key: str) -> bool:
@@ -123,6 +137,7 @@ class MemoryCache:
         """Clear all cache entries."""
         count = len(self._cache)
         self._cache.clear()
+        self._expiry_heap.clear()
         logger.info(f"Cache cleared ({count} entries)")
 
     def get_stats(self) -> Dict[str, Any]:
@@ -146,15 +161,26 @@ class MemoryCache:
         Returns:
             Number of entries removed
         """
-        now = datetime.now()
-        expired_keys = [
-            key for key, entry in self._cache.items() if now > entry.expires_at
+        now = time.monotonic()
+        heap = self._expiry_heap
+        removed = 0
+
+        while heap and now > heap[0][0]:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Skip stale heap items: key gone, or re-set with a newer expiry
+            if entry is not None and entry.expires_at == expires_at:
+                del self._cache[key]
+                removed += 1
+
+        if removed:
+            logger.info(f"Cleaned up {removed} expired entries")
+
+        return removed
+
+    def _compact_expiry_heap(self) -> None:
+        """Rebuild the expiry heap from live entries, dropping stale items."""
+        self._expiry_heap = [
+            (entry.expires_at, key) for key, entry in self._cache.items()
         ]
-
-        for key in expired_keys:
-            del self._cache[key]
-
-        if expired_keys:
-            logger.info(f"Cleaned up {len(expired_keys)} expired entries")
-
-        return len(expired_keys)
+        heapq.heapify(self._expiry_heap)
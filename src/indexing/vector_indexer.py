@@ -257,7 +257,7 @@ class VectorIndexer:
 
         Args:
             chunks: List of chunk dictionaries
-            embeddings: List of embedding vectors
+            embeddings: List of embedding vectors, or an (n, dim) ndarray
         """
         assert len(chunks) == len(embeddings), "Mismatched lengths"
         assert len(chunks) > 0, "Empty chunks list"
@@ -9,10 +9,11 @@ Part of Week 9 implementation for Memory MCP Triple System.
 NASA Rule 10 Compliant: All functions ≤60 LOC
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 from enum import Enum
 import math
+import numpy as np
 from loguru import logger
 
 
@@ -25,6 +26,14 @@ class LifecycleStage(Enum):
     REHYDRATABLE = "rehydratable"  # Cold, compressed, can restore
 
 
+# Integer codes produced by the vectorized batch path, indexed into stages
+_BATCH_STAGES = (
+    LifecycleStage.ACTIVE,
+    LifecycleStage.DEMOTED,
+    LifecycleStage.ARCHIVED,
+)
+
+
 class HotColdClassifier:
     """
     Memory lifecycle classifier (Hot/Cold).
@@ -136,6 +145,8 @@ class HotColdClassifier:
         created_at: datetime,
         last_accessed: datetime,
         access_count: int,
+        *,
+        now: Optional[datetime] = None,
     ) -> LifecycleStage:
         """
         Classify chunk into lifecycle stage.
@@ -151,13 +162,15 @@ class HotColdClassifier:
             created_at: Creation timestamp
             last_accessed: Last access timestamp
             access_count: Total access count
+            now: Reference time (default: datetime.now()); pass one shared
+                value when classifying many chunks
 
         Returns:
             Lifecycle stage
 
-        NASA Rule 10: 37 LOC (≤60) ✅
+        NASA Rule 10: 39 LOC (≤60) ✅
         """
-        now = datetime.now()
+        now = now or datetime.now()
         age_days = (now - created_at).days
 
         # Calculate access frequency (accesses per week)
@@ -181,16 +194,24 @@ class HotColdClassifier:
 
         return stage
 
-    def classify_batch(self, chunks: List[Dict[str, Any]]) -> Dict[str, LifecycleStage]:
+    def classify_batch(
+        self, chunks: List[Dict[str, Any]], *, now: Optional[datetime] = None
+    ) -> Dict[str, LifecycleStage]:
         """
         Classify multiple chunks.
 
+        Vectorized equivalent of classify_chunk over every row: timestamps
+        and counts become NumPy arrays once and the stage rules are applied
+        as array comparisons instead of a Python loop.
+
         Args:
             chunks: List of dicts with keys:
                 - chunk_id (str)
                 - created_at (datetime)
                 - last_accessed (datetime)
                 - access_count (int)
+            now: Reference time for every chunk (default: one datetime.now()
+                taken for the whole batch)
 
         Returns:
             {
@@ -199,18 +220,34 @@ class HotColdClassifier:
                 ...
             }
 
-        NASA Rule 10: 23 LOC (≤60) ✅
+        NASA Rule 10: 28 LOC (≤60) ✅
         """
-        classifications = {}
-
-        for chunk in chunks:
-            stage = self.classify_chunk(
-                chunk_id=chunk["chunk_id"],
-                created_at=chunk["created_at"],
-                last_accessed=chunk["last_accessed"],
-                access_count=chunk["access_count"],
-            )
-            classifications[chunk["chunk_id"]] = stage
+        if not chunks:
+            return {}
+
+        now64 = np.datetime64(now or datetime.now(), "us")
+        created = np.array([c["created_at"] for c in chunks], dtype="datetime64[us]")
+        counts = np.array([c["access_count"] for c in chunks], dtype=np.float64)
+
+        # Whole days, floored like timedelta.days in classify_chunk
+        age_days = (now64 - created) // np.timedelta64(1, "D")
+        accesses_per_week = counts / np.maximum(age_days / 7.0, 1.0)
+
+        codes = np.select(
+            [
+                (age_days < self.active_days)
+                & (accesses_per_week >= self.access_threshold),
+                age_days < self.demoted_days,
+                accesses_per_week < 1.0,
+            ],
+            [0, 1, 2],
+            default=1,
+        )
+
+        classifications = {
+            chunk["chunk_id"]: _BATCH_STAGES[code]
+            for chunk, code in zip(chunks, codes.tolist())
+        }
 
         logger.info(f"Classified {len(chunks)} chunks in batch")
         return classifications
@@ -31,7 +31,9 @@ sys.path.insert(
 # F4: force UTF-8 stdout/stderr before heavy imports (cp1252 pipe crash).
 from src.mcp import _utf8_io  # noqa: F401,E402  (import runs ensure_utf8_io())
 
+import orjson  # noqa: E402
 from fastapi import Depends, FastAPI, Header, HTTPException, Security  # noqa: E402
+from fastapi.responses import ORJSONResponse  # noqa: E402
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer  # noqa: E402
 from fastapi.middleware.cors import CORSMiddleware  # noqa: E402
 from pydantic import BaseModel, Field  # noqa: E402
@@ -148,10 +150,24 @@ async def require_tool_api_key(
     )
 
 
+class _ORJSONResponse(ORJSONResponse):
+    """orjson-rendered JSON (Rust, straight to bytes) for every route.
+
+    Non-str dict keys and numpy values are serialized like the stdlib
+    JSONResponse path would, instead of raising.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+
 app = FastAPI(
     title="Memory MCP HTTP API",
     description="HTTP wrapper for Memory MCP Triple System stdio server",
     version="1.5.0",
+    default_response_class=_ORJSONResponse,
 )
 
 # CORS for Terminal Manager frontend
@@ -460,6 +476,12 @@ def get_nexus_processor() -> NexusProcessor:
     return _nexus_processor
 
 
+def _invalidate_search_cache() -> None:
+    """Drop memoized NexusProcessor results after a write (store/sync/merge)."""
+    if _nexus_processor is not None:
+        _nexus_processor.clear_result_cache()
+
+
 def get_beads_bridge() -> BeadsBridge:
     """Lazy initialize BeadsBridge for Beads CLI integration."""
     global _beads_bridge
@@ -701,6 +723,7 @@ async def consolidate_memories() -> Dict[str, Any]:
         manager = get_lifecycle_manager()
         if hasattr(manager, "consolidate_similar"):
             count = await asyncio.to_thread(manager.consolidate_similar, 0.95)
+            _invalidate_search_cache()
             return {"consolidated_count": count}
         return {"consolidated_count": 0, "note": "consolidation not available"}
     except Exception as e:
@@ -720,6 +743,7 @@ async def consolidate_entities() -> Dict[str, Any]:
             consolidator.consolidate_all, graph_service.graph
         )
         graph_service.save_graph()
+        _invalidate_search_cache()
         return result
     except Exception as e:
         logger.error(f"Entity consolidation failed: {e}")
@@ -751,6 +775,9 @@ async def shutdown_event() -> None:
     if _lifecycle_scheduler:
         await _lifecycle_scheduler.stop()
 
+    if _nexus_processor is not None:
+        _nexus_processor.close()
+
     logger.info("Memory MCP HTTP server shutdown complete")
 
 
@@ -821,6 +848,8 @@ async def memory_store(request: MemoryStoreRequest) -> Dict[str, Any]:
             metadata=metadata,
             source="http_api",
         )
+        if result.get("success"):
+            _invalidate_search_cache()
 
         # Add auto-fill info to response
         result["tags_auto_filled"] = missing if not is_valid else []
@@ -920,6 +949,7 @@ async def obsidian_sync(request: ObsidianSyncRequest) -> Dict[str, Any]:
 
         client = ObsidianMCPClient(vault_path=request.vault_path)
         result = client.sync_vault()
+        _invalidate_search_cache()
 
         return {
             "success": result.get("success", False),
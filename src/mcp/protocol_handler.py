@@ -151,3 +151,5 @@ def main():
         response = process_message(message)
         if response:
             _write_stdio_response(response, framed)
+    if _nexus_tool is not None:
+        _nexus_tool.close()
@@ -249,6 +249,7 @@ def handle_memory_store(
                 ],
                 "isError": True,
             }
+        tool.invalidate_search_cache()
 
         returned_meta = result.get("metadata", enriched_metadata)
         tagging_info = f"Tagged: WHO={returned_meta['agent_name']}, PROJECT={returned_meta['project']}"
@@ -715,6 +716,7 @@ def handle_obsidian_sync(
             }
 
         result = tool.obsidian_client.sync_vault(file_extensions)
+        tool.invalidate_search_cache()
 
         tool.log_event(
             "chunk_added",
@@ -7,9 +7,11 @@ Extracted from stdio_server.py as part of MEM-CLEAN-003.
 NASA Rule 10 Compliant: All functions <=60 LOC
 """
 
+import copy
 import os
 import sqlite3
 import threading
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 import yaml
@@ -376,6 +378,16 @@ class NexusSearchTool:
             self._nexus_processor = self._init_nexus_processor()
         return self._nexus_processor
 
+    def invalidate_search_cache(self) -> None:
+        """Drop memoized search results after a write (store/sync)."""
+        if self._nexus_processor is not None:
+            self._nexus_processor.clear_result_cache()
+
+    def close(self) -> None:
+        """Release the NexusProcessor's recall workers, if it was created."""
+        if self._nexus_processor is not None:
+            self._nexus_processor.close()
+
     def _init_nexus_processor(self) -> Optional[NexusProcessor]:
         """Initialize NexusProcessor with Vector + Graph + Bayesian + Reranker."""
         try:
@@ -529,8 +541,23 @@ class NexusSearchTool:
         return formatted
 
 
+# libyaml's C loader parses ~10x faster than the pure-Python SafeLoader.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=8)
+def _parse_config_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML config once per (path, mtime, size); edits re-parse."""
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
 def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
-    """Load configuration from YAML file."""
+    """Load configuration from YAML file.
+
+    The parse is cached per file, modification time and size (HTTP handlers
+    call this per request); each caller gets its own deep copy to mutate.
+    """
     if config_path is None:
         config_path = Path(__file__).parent.parent.parent / "config" / "memory-mcp.yaml"
     else:
@@ -538,10 +565,9 @@ def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
     if not config_path.exists():
         raise FileNotFoundError(f"Config not found: {config_path}")
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
-
-    return config
+    stat = config_path.stat()
+    config = _parse_config_file(str(config_path), stat.st_mtime_ns, stat.st_size)
+    return copy.deepcopy(config)
 
 
 def apply_migrations(config: Dict[str, Any]) -> None:
@@ -12,6 +12,9 @@ MemoryLifecycleManager.__init__) for the duration of the call. RLock is used so
 that if one guarded method ever calls another on the same thread it re-enters
 rather than self-deadlocking. This module imports nothing from the memory
 package, so it is safe to import from any of the mixins without a cycle.
+
+A guarded call also drops the manager's memoized stage stats, since the
+mutation may have moved chunks between stages.
 """
 
 import functools
@@ -23,6 +26,9 @@ def guarded_mutation(method):
     @functools.wraps(method)
     def wrapper(self, *args, **kwargs):
         with self._mutation_lock:
-            return method(self, *args, **kwargs)
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self._stage_stats_cache = None
 
     return wrapper
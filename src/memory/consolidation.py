@@ -5,13 +5,16 @@ Extracted from lifecycle_manager.py for modularity.
 NASA Rule 10 Compliant: All functions <=60 LOC
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import numpy as np
 from loguru import logger
 
 from ._mutation_lock import guarded_mutation
 
+# Rows of the cosine matrix computed per matmul in _candidate_pairs.
+SIMILARITY_BLOCK_ROWS = 1024
+
 
 class ConsolidationMixin:
     """
@@ -44,11 +47,15 @@ class ConsolidationMixin:
         return consolidated_count
 
     def _get_active_chunks(self) -> Optional[Dict]:
-        """Get all active chunks with embeddings."""
+        """Get ids and embeddings of all active chunks.
+
+        Documents and metadatas are not fetched here; only the few chunks
+        that pass the similarity threshold need them (_get_chunk_contents).
+        """
         try:
             active_chunks = self.vector_indexer.collection.get(
                 where={"stage": "active"},
-                include=["documents", "embeddings", "metadatas"],
+                include=["embeddings"],
             )
         except Exception as e:
             logger.error(f"Failed to query active chunks: {e}")
@@ -66,65 +73,68 @@ class ConsolidationMixin:
 
         return active_chunks
 
+    def _get_chunk_contents(self, chunk_ids: List[str]) -> Dict[str, tuple]:
+        """Fetch (document, metadata) for the given chunk ids, keyed by id."""
+        result = self.vector_indexer.collection.get(
+            ids=chunk_ids, include=["documents", "metadatas"]
+        )
+        metadatas = result.get("metadatas") or [{}] * len(result["ids"])
+        return {
+            chunk_id: (document, metadata or {})
+            for chunk_id, document, metadata in zip(
+                result["ids"], result["documents"], metadatas
+            )
+        }
+
     def _find_and_merge_similar(self, active_chunks: Dict, threshold: float) -> int:
         """Find and merge similar chunk pairs."""
         chunk_ids = active_chunks["ids"]
-        documents = active_chunks["documents"]
-        embeddings = active_chunks["embeddings"]
-        metadatas = active_chunks["metadatas"]
 
-        consolidated_count = 0
-        processed = set()
+        # F9: cosine similarities come from blocked matmuls thresholded in
+        # NumPy, so Python only visits pairs that can merge, in row-major
+        # (i, j) order - the same greedy merge order as the N^2 loop.
+        pairs = self._candidate_pairs(active_chunks["embeddings"], threshold)
+        if not pairs:
+            return 0
 
-        # F9: compute all pairwise cosine similarities in one matmul instead of
-        # N^2 per-pair Python calls. Greedy merge order/semantics are unchanged;
-        # the loop just reads sim_matrix[i, j] instead of recomputing.
-        sim_matrix = self._pairwise_cosine(embeddings)
+        candidates = sorted({chunk_ids[k] for i, j, _ in pairs for k in (i, j)})
+        contents = self._get_chunk_contents(candidates)
 
-        for i in range(len(chunk_ids)):
-            if chunk_ids[i] in processed:
+        # Greedy assignment: each surviving chunk i absorbs every later j
+        # above threshold that has not already been absorbed. Each cluster is
+        # then merged in one pass, so absorbing several chunks into one keeps
+        # all of their text instead of each pair merge overwriting the last.
+        clusters: Dict[str, List[str]] = {}
+        processed = set()
+        for i, j, _ in pairs:
+            id1, id2 = chunk_ids[i], chunk_ids[j]
+            if id1 in processed or id2 in processed:
                 continue
+            if id1 not in contents or id2 not in contents:
+                continue  # deleted since the embedding scan
+            clusters.setdefault(id1, []).append(id2)
+            processed.add(id2)
 
-            for j in range(i + 1, len(chunk_ids)):
-                if chunk_ids[j] in processed:
-                    continue
-
-                similarity = float(sim_matrix[i, j])
-
-                if similarity >= threshold:
-                    self._merge_chunk_pair(
-                        chunk_ids[i],
-                        chunk_ids[j],
-                        documents[i],
-                        documents[j],
-                        metadatas[i],
-                        metadatas[j],
-                        similarity,
-                    )
-                    processed.add(chunk_ids[j])
-                    consolidated_count += 1
+        for anchor_id, member_ids in clusters.items():
+            self._merge_cluster(anchor_id, member_ids, contents)
 
-        return consolidated_count
+        return len(processed)
 
-    def _merge_chunk_pair(
-        self,
-        id1: str,
-        id2: str,
-        doc1: str,
-        doc2: str,
-        meta1: Dict,
-        meta2: Dict,
-        similarity: float,
+    def _merge_cluster(
+        self, anchor_id: str, member_ids: List[str], contents: Dict[str, tuple]
     ):
-        """Merge two similar chunks."""
-        merged_text, merged_metadata = self._merge_chunks(doc1, doc2, meta1, meta2)
+        """Merge member chunks into the anchor chunk, then delete them."""
+        cluster = [contents[chunk_id] for chunk_id in [anchor_id, *member_ids]]
+        merged_text, merged_metadata = self._merge_chunks(
+            [doc for doc, _ in cluster], [meta for _, meta in cluster]
+        )
         merged_embedding = None
         if hasattr(self, "_embed_text"):
             merged_embedding = self._embed_text(merged_text)
 
-        # Update first chunk
+        # Update anchor chunk
         update_args = {
-            "ids": [id1],
+            "ids": [anchor_id],
             "documents": [merged_text],
             "metadatas": [merged_metadata],
         }
@@ -132,22 +142,43 @@ class ConsolidationMixin:
             update_args["embeddings"] = [merged_embedding]
         self.vector_indexer.collection.update(**update_args)
 
-        # Delete second chunk
-        self.vector_indexer.collection.delete(ids=[id2])
+        # Delete absorbed chunks
+        self.vector_indexer.collection.delete(ids=member_ids)
 
-        logger.debug(f"Consolidated {id2} into {id1} (similarity: {similarity:.2f})")
+        logger.debug(f"Consolidated {member_ids} into {anchor_id}")
 
     @staticmethod
-    def _pairwise_cosine(embeddings) -> "np.ndarray":
-        """Full cosine-similarity matrix for a list of embeddings (one matmul).
-
-        Zero-norm rows yield 0 similarity, matching _calculate_similarity.
-        """
+    def _normalize_rows(embeddings) -> "np.ndarray":
+        """L2-normalize embedding rows; zero-norm rows stay zero."""
         E = np.asarray(embeddings, dtype=float)
         norms = np.linalg.norm(E, axis=1)
         safe = np.where(norms == 0, 1.0, norms)
-        En = E / safe[:, None]
-        return En @ En.T
+        return E / safe[:, None]
+
+    @classmethod
+    def _candidate_pairs(
+        cls, embeddings, threshold: float, block_rows: int = SIMILARITY_BLOCK_ROWS
+    ) -> List[Tuple[int, int, float]]:
+        """(i, j, cosine) for i < j with cosine >= threshold, row-major order.
+
+        Computed block_rows rows at a time, so peak memory is
+        block_rows x N similarities instead of the full N x N matrix.
+        """
+        En = cls._normalize_rows(embeddings)
+        pairs: List[Tuple[int, int, float]] = []
+        for start in range(0, len(En), block_rows):
+            block = En[start : start + block_rows] @ En.T
+            rows, cols = np.nonzero(block >= threshold)
+            keep = cols > rows + start
+            rows, cols = rows[keep], cols[keep]
+            pairs.extend(
+                zip(
+                    (rows + start).tolist(),
+                    cols.tolist(),
+                    block[rows, cols].tolist(),
+                )
+            )
+        return pairs
 
     def _calculate_similarity(
         self, embedding1: List[float], embedding2: List[float]
@@ -176,43 +207,32 @@ class ConsolidationMixin:
 
     def _merge_chunks(
         self,
-        text1: str,
-        text2: str,
-        metadata1: Dict[str, Any],
-        metadata2: Dict[str, Any],
+        texts: List[str],
+        metadatas: List[Dict[str, Any]],
     ) -> tuple:
         """
-        Merge two chunks into one.
+        Merge a cluster of chunks into one.
 
         Args:
-            text1: First chunk text
-            text2: Second chunk text
-            metadata1: First chunk metadata
-            metadata2: Second chunk metadata
+            texts: Chunk texts, anchor chunk first
+            metadatas: Chunk metadatas, in the same order
 
         Returns:
             (merged_text, merged_metadata)
         """
         # Combine text
-        merged_text = f"{text1}\n\n{text2}"
-
-        # Merge metadata (union of tags, max scores, newer timestamp)
-        merged_metadata = metadata1.copy()
-
-        # Merge tags
-        tags1 = set(metadata1.get("tags", []))
-        tags2 = set(metadata2.get("tags", []))
-        merged_metadata["tags"] = list(tags1 | tags2)
+        merged_text = "\n\n".join(texts)
 
-        # Take max score
-        score1 = metadata1.get("score", 0)
-        score2 = metadata2.get("score", 0)
-        merged_metadata["score"] = max(score1, score2)
-
-        # Take newer timestamp
-        ts1 = metadata1.get("last_accessed", "")
-        ts2 = metadata2.get("last_accessed", "")
-        merged_metadata["last_accessed"] = max(ts1, ts2)
+        # Merge metadata (union of tags, max scores, newer timestamp), one
+        # C-level union/max over the whole cluster rather than pair by pair
+        merged_metadata = metadatas[0].copy()
+        merged_metadata["tags"] = list(
+            set().union(*(m.get("tags", []) for m in metadatas))
+        )
+        merged_metadata["score"] = max(m.get("score", 0) for m in metadatas)
+        merged_metadata["last_accessed"] = max(
+            m.get("last_accessed", "") for m in metadatas
+        )
 
         # Add consolidation marker
         merged_metadata["consolidated"] = True
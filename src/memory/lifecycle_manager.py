@@ -15,11 +15,16 @@ Refactored: Extracted stage transitions and consolidation into separate modules.
 See: stage_transitions.py, consolidation.py
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime
 import ast
-import json
+import os
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import numpy as np
+import orjson
 from loguru import logger
 
 # Import mixins for modular architecture (ISS-006 fix)
@@ -33,6 +38,30 @@ from ._mutation_lock import guarded_mutation
 # worth the loss; only larger documents are compressed down to this length.
 SUMMARY_MAX_LEN = 200
 
+# Source files kept in the rekindle read cache (see _read_full_text).
+READ_CACHE_SIZE = 16
+
+# Embedding vectors accepted from callers; stored internally as float32.
+EmbeddingLike = Union[List[float], np.ndarray]
+
+# Concurrent source-file reads when rekindling several chunks at once.
+REKINDLE_READ_WORKERS = 8
+
+# Seconds get_stage_stats() results are reused by monitoring endpoints.
+STAGE_STATS_TTL_SECONDS = 5.0
+
+
+def _read_text(file_path: str) -> str:
+    """Read a UTF-8 text file."""
+    with open(file_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+@lru_cache(maxsize=READ_CACHE_SIZE)
+def _read_text_cached(file_path: str, mtime_ns: int, size: int) -> str:
+    """_read_text memoized on the file's identity; mtime/size key edits."""
+    return _read_text(file_path)
+
 
 class MemoryLifecycleManager(StageTransitionsMixin, ConsolidationMixin):
     """
@@ -71,6 +100,10 @@ class MemoryLifecycleManager(StageTransitionsMixin, ConsolidationMixin):
         # instead of self-deadlocking.
         self._mutation_lock = threading.RLock()
 
+        # (monotonic deadline, stats) memo for get_stage_stats; guarded
+        # mutations drop it so this process never serves its own stale counts.
+        self._stage_stats_cache: Optional[Tuple[float, Dict[str, int]]] = None
+
         # Stage configuration
         self.stages = {
             "active": 1.0,
@@ -104,11 +137,11 @@ class MemoryLifecycleManager(StageTransitionsMixin, ConsolidationMixin):
     #   _archive_chunks_batch, make_rehydratable
     # Consolidation methods extracted to ConsolidationMixin:
     # - consolidate_similar, _get_active_chunks, _find_and_merge_similar,
-    #   _merge_chunk_pair, _calculate_similarity, _merge_chunks
+    #   _merge_cluster, _calculate_similarity, _merge_chunks
     # This reduces lifecycle_manager.py from ~614 LOC to ~280 LOC (54% reduction)
 
     @guarded_mutation
-    def rekindle_archived(self, query_embedding: List[float], chunk_id: str) -> bool:
+    def rekindle_archived(self, query_embedding: EmbeddingLike, chunk_id: str) -> bool:
         """
         Rekindle archived chunk (rehydrate full text).
 
@@ -122,32 +155,67 @@ class MemoryLifecycleManager(StageTransitionsMixin, ConsolidationMixin):
         Returns:
             True if rekindled successfully, False otherwise
         """
-        # Retrieve summary and metadata
-        summary, metadata_str = self._get_archived_data(chunk_id)
-        if not summary:
-            return False
-
-        # Extract file path
-        file_path = self._extract_file_path(metadata_str)
-        if not file_path:
-            logger.warning(f"No file_path in metadata for chunk {chunk_id}")
-            return False
-
-        # Rehydrate full text from file
-        full_text = self._read_full_text(file_path)
-        if not full_text:
-            return False
-
-        # Re-index and promote
-        self._reindex_and_promote(
-            chunk_id, full_text, file_path, query_embedding, metadata_str
-        )
+        return chunk_id in self.rekindle_many(query_embedding, [chunk_id])
+
+    @guarded_mutation
+    def rekindle_many(
+        self, query_embedding: EmbeddingLike, chunk_ids: List[str]
+    ) -> List[str]:
+        """
+        Rekindle several archived chunks in one pass.
+
+        Source files are read concurrently, texts are embedded in one batch,
+        and all chunks are re-indexed with a single index_chunks/update call.
 
-        # Clean up KV store
-        self._cleanup_archived_keys(chunk_id)
+        Args:
+            query_embedding: Fallback embedding if document re-embedding is unavailable
+            chunk_ids: Chunk IDs to rekindle
 
-        logger.info(f"Rekindled chunk {chunk_id} → active")
-        return True
+        Returns:
+            IDs of the chunks that were rekindled
+        """
+        targets = self._resolve_rekindle_targets(chunk_ids)
+        if not targets:
+            return []
+
+        texts = self._read_full_texts([file_path for _, file_path, _ in targets])
+        rekindled = [
+            (chunk_id, texts[file_path], file_path, metadata)
+            for chunk_id, file_path, metadata in targets
+            if texts.get(file_path)
+        ]
+        if not rekindled:
+            return []
+
+        # One contiguous float32 buffer instead of a list of Python floats;
+        # Chroma takes ndarrays directly.
+        fallback = np.ascontiguousarray(query_embedding, dtype=np.float32)
+        self._reindex_and_promote_many(rekindled, fallback)
+
+        rekindled_ids = [chunk_id for chunk_id, _, _, _ in rekindled]
+        for chunk_id in rekindled_ids:
+            self._cleanup_archived_keys(chunk_id)
+            logger.info(f"Rekindled chunk {chunk_id} → active")
+        return rekindled_ids
+
+    def _resolve_rekindle_targets(
+        self, chunk_ids: List[str]
+    ) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """Resolve (chunk_id, file_path, metadata) for rekindlable chunks."""
+        targets = []
+        for chunk_id in dict.fromkeys(chunk_ids):
+            summary, metadata_str = self._get_archived_data(chunk_id)
+            if not summary:
+                continue
+
+            # Parse metadata once; path extraction and promotion both reuse it
+            metadata = self._metadata_from_string(metadata_str or "")
+            file_path = self._extract_file_path(metadata_str, metadata)
+            if not file_path:
+                logger.warning(f"No file_path in metadata for chunk {chunk_id}")
+                continue
+            targets.append((chunk_id, file_path, metadata))
+        return targets
 
     def _get_archived_data(self, chunk_id: str) -> tuple[Optional[str], Optional[str]]:
         """Retrieve summary and metadata from KV store."""
@@ -168,7 +236,9 @@ class MemoryLifecycleManager(StageTransitionsMixin, ConsolidationMixin):
 
         return summary, metadata_str
 
-    def _extract_file_path(self, metadata_str: Optional[str]) -> Optional[str]:
+    def _extract_file_path(
+        self, metadata_str: Optional[str], metadata: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
         """Extract file path from archived metadata.
 
         Production stores metadata as JSON (see _archive_chunks_batch); legacy
@@ -176,7 +246,8 @@ class MemoryLifecycleManager(StageTransitionsMixin, ConsolidationMixin):
         return None (rekindle then fails cleanly) instead of fabricating a
         /default/path.md - silently rehydrating the wrong file was the E8 bug.
         """
-        metadata = self._metadata_from_string(metadata_str or "")
+        if metadata is None:
+            metadata = self._metadata_from_string(metadata_str or "")
         if metadata.get("file_path"):
             return str(metadata["file_path"])
         if metadata:
@@ -204,10 +275,20 @@ class MemoryLifecycleManager(StageTransitionsMixin, ConsolidationMixin):
         return None
 
     def _read_full_text(self, file_path: str) -> Optional[str]:
-        """Read full text from file."""
+        """Read full text from file.
+
+        Reads are cached per (path, mtime, size), so rekindling several chunks
+        archived from one source file reads it once, and an edited file is
+        re-read. If the file cannot be stat'ed, open() reports why.
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            stat = None
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return f.read()
+            if stat is None:
+                return _read_text(file_path)
+            return _read_text_cached(file_path, stat.st_mtime_ns, stat.st_size)
         except FileNotFoundError:
             logger.error(f"File not found: {file_path}")
             return None
@@ -215,32 +296,39 @@ class MemoryLifecycleManager(StageTransitionsMixin, ConsolidationMixin):
             logger.error(f"Failed to read file {file_path}: {e}")
             return None
 
-    def _reindex_and_promote(
+    def _read_full_texts(self, file_paths: List[str]) -> Dict[str, Optional[str]]:
+        """Read distinct source files concurrently; blocking reads release the GIL."""
+        unique_paths = list(dict.fromkeys(file_paths))
+        if len(unique_paths) == 1:
+            return {unique_paths[0]: self._read_full_text(unique_paths[0])}
+
+        workers = min(REKINDLE_READ_WORKERS, len(unique_paths))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return dict(zip(unique_paths, pool.map(self._read_full_text, unique_paths)))
+
+    def _reindex_and_promote_many(
         self,
-        chunk_id: str,
-        full_text: str,
-        file_path: str,
-        query_embedding: List[float],
-        metadata_str: Optional[str] = None,
+        rekindled: List[Tuple[str, str, str, Optional[Dict[str, Any]]]],
+        query_embedding: np.ndarray,
     ):
-        """Re-index chunk and promote to active."""
+        """Re-index (chunk_id, text, file_path, metadata) rows and promote to active."""
         now = datetime.utcnow()
-        metadata = self._metadata_from_string(metadata_str or "")
-        metadata.update(
-            {
-                "stage": "active",
-                "score_multiplier": 1.0,
-                "last_accessed": now.isoformat(),
-                "last_accessed_ts": now.timestamp(),
-                "rekindled_at": now.isoformat(),
-                "rekindled_at_ts": now.timestamp(),
-            }
-        )
-
-        embedding = self._embed_text(full_text, fallback_embedding=query_embedding)
+        now_iso, now_ts = now.isoformat(), now.timestamp()
+        promotion = {
+            "stage": "active",
+            "score_multiplier": 1.0,
+            "last_accessed": now_iso,
+            "last_accessed_ts": now_ts,
+            "rekindled_at": now_iso,
+            "rekindled_at_ts": now_ts,
+        }
 
-        self.vector_indexer.index_chunks(
-            chunks=[
+        ids, chunks, metadatas = [], [], []
+        for chunk_id, full_text, file_path, metadata in rekindled:
+            metadata = {**(metadata or {}), **promotion}
+            ids.append(chunk_id)
+            metadatas.append(metadata)
+            chunks.append(
                 {
                     "id": chunk_id,
                     "text": full_text,
@@ -248,11 +336,13 @@ class MemoryLifecycleManager(StageTransitionsMixin, ConsolidationMixin):
                     "chunk_index": 0,
                     "metadata": metadata,
                 }
-            ],
-            embeddings=[embedding],
-        )
+            )
 
-        self.vector_indexer.collection.update(ids=[chunk_id], metadatas=[metadata])
+        embeddings = self._embed_texts(
+            [chunk["text"] for chunk in chunks], fallback_embedding=query_embedding
+        )
+        self.vector_indexer.index_chunks(chunks=chunks, embeddings=embeddings)
+        self.vector_indexer.collection.update(ids=ids, metadatas=metadatas)
 
     def _cleanup_archived_keys(self, chunk_id: str):
         """Clean up KV store keys."""
@@ -266,9 +356,9 @@ class MemoryLifecycleManager(StageTransitionsMixin, ConsolidationMixin):
         if not metadata_str:
             return {}
         try:
-            parsed = json.loads(metadata_str)
+            parsed = orjson.loads(metadata_str)
             return parsed if isinstance(parsed, dict) else {}
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             try:
                 parsed = ast.literal_eval(metadata_str)
                 return parsed if isinstance(parsed, dict) else {}
@@ -276,7 +366,7 @@ class MemoryLifecycleManager(StageTransitionsMixin, ConsolidationMixin):
                 return {}
 
     def _embed_text(
-        self, text: str, fallback_embedding: Optional[List[float]] = None
+        self, text: str, fallback_embedding: Optional[EmbeddingLike] = None
     ) -> Optional[List[float]]:
         """Embed document text, falling back only when no embedder is available."""
         if self.embedding_pipeline is not None:
@@ -291,6 +381,24 @@ class MemoryLifecycleManager(StageTransitionsMixin, ConsolidationMixin):
                 logger.warning(f"Document re-embedding failed, using fallback: {e}")
         return self._embedding_to_list(fallback_embedding)
 
+    def _embed_texts(
+        self, texts: List[str], fallback_embedding: Optional[EmbeddingLike] = None
+    ) -> np.ndarray:
+        """Embed documents into one contiguous float32 (n, dim) matrix.
+
+        Several texts are embedded with one batched encode() call; a single
+        text, or a failed batch, goes through _embed_text per document.
+        """
+        rows = None
+        if self.embedding_pipeline is not None and len(texts) > 1:
+            try:
+                rows = self.embedding_pipeline.encode(texts)
+            except Exception as e:
+                logger.warning(f"Batch re-embedding failed, embedding one by one: {e}")
+        if rows is None:
+            rows = [self._embed_text(text, fallback_embedding) for text in texts]
+        return np.ascontiguousarray(rows, dtype=np.float32).reshape(len(texts), -1)
+
     @staticmethod
     def _embedding_to_list(embedding: Any) -> Optional[List[float]]:
         """Normalize ndarray/list embeddings to a plain vector list."""
@@ -304,12 +412,15 @@ class MemoryLifecycleManager(StageTransitionsMixin, ConsolidationMixin):
 
     # Consolidation methods provided by ConsolidationMixin:
     # consolidate_similar, _get_active_chunks, _find_and_merge_similar,
-    # _merge_chunk_pair, _calculate_similarity, _merge_chunks
+    # _merge_cluster, _calculate_similarity, _merge_chunks
 
     def get_stage_stats(self) -> Dict[str, int]:
         """
         Get statistics for each lifecycle stage.
 
+        Counts are memoized for STAGE_STATS_TTL_SECONDS; any guarded mutation
+        on this manager invalidates them.
+
         Returns:
             {
                 'active': count,
@@ -319,48 +430,44 @@ class MemoryLifecycleManager(StageTransitionsMixin, ConsolidationMixin):
                 'total': count
             }
         """
+        cached = self._stage_stats_cache
+        if cached is not None and time.monotonic() < cached[0]:
+            return dict(cached[1])
+
+        stats = self._count_stages()
+        self._stage_stats_cache = (time.monotonic() + STAGE_STATS_TTL_SECONDS, stats)
+
+        logger.info(f"Stage stats: {stats}")
+        return dict(stats)
+
+    def _count_stages(self) -> Dict[str, int]:
+        """Count chunks per stage in the vector and KV stores."""
         stats = {
             "active": 0,
             "demoted": 0,
             "archived": 0,
             "rehydratable": 0,
-            "total": 0,
         }
 
-        # Count active and demoted (in vector store)
+        # Count active and demoted (in vector store). include=[] returns ids
+        # only, so Chroma does not serialize documents/metadatas just to count.
         try:
             for stage in ["active", "demoted"]:
-                chunks = self.vector_indexer.collection.get(where={"stage": stage})
+                chunks = self.vector_indexer.collection.get(
+                    where={"stage": stage}, include=[]
+                )
                 stats[stage] = len(chunks.get("ids", []))
         except Exception as e:
             logger.error(f"Failed to query vector store: {e}")
 
-        # Count archived and rehydratable (in KV store)
-        # KVStore exposes list_keys(prefix), not keys()
-        archived_keys = [
-            key
-            for key in self.kv_store.list_keys("archived:")
-            if key.startswith("archived:") and ":metadata" not in key
-        ]
-        stats["archived"] = len(archived_keys)
-
-        rehydratable_keys = [
-            key
-            for key in self.kv_store.list_keys("rehydratable:")
-            if key.startswith("rehydratable:") and ":metadata" not in key
-        ]
-        stats["rehydratable"] = len(rehydratable_keys)
-
-        stats["total"] = sum(
-            [
-                stats["active"],
-                stats["demoted"],
-                stats["archived"],
-                stats["rehydratable"],
-            ]
-        )
+        # Count archived and rehydratable (in KV store) inside SQLite over a
+        # key-index range, instead of listing every key into Python
+        for stage in ["archived", "rehydratable"]:
+            stats[stage] = self.kv_store.count_keys(
+                f"{stage}:", exclude_suffix=":metadata"
+            )
 
-        logger.info(f"Stage stats: {stats}")
+        stats["total"] = sum(stats.values())
         return stats
 
     # Helper methods
@@ -6,12 +6,17 @@ NASA Rule 10 Compliant: All functions <=60 LOC
 """
 
 from typing import Dict, Optional
-import json
+import orjson
 from datetime import datetime, timedelta
 from loguru import logger
 
 from ._mutation_lock import guarded_mutation
 
+# Chunks per collection.update() call. One call per chunk pays a Chroma
+# transaction each; a few hundred per call amortizes that without holding
+# the collection long enough to stall concurrent reads.
+UPDATE_BATCH_SIZE = 250
+
 
 class StageTransitionsMixin:
     """
@@ -42,7 +47,9 @@ class StageTransitionsMixin:
         cutoff = datetime.utcnow() - timedelta(days=threshold)
         cutoff_ts = cutoff.timestamp()
 
-        # Query chunks with last_accessed_ts > threshold (float for ChromaDB $lt)
+        # Query chunks with last_accessed_ts > threshold (float for ChromaDB $lt).
+        # The predicate runs inside Chroma and only metadatas come back; never
+        # fetch all chunks and filter here, or pull documents/embeddings.
         try:
             stale_chunks = self.vector_indexer.collection.get(
                 where={
@@ -63,27 +70,30 @@ class StageTransitionsMixin:
             logger.info("No chunks to demote")
             return 0
 
+        now = datetime.utcnow()
+        demotion = {
+            "stage": "demoted",
+            "score_multiplier": 0.5,
+            "demoted_at": now.isoformat(),
+            "demoted_at_ts": now.timestamp(),
+        }
         metadatas = stale_chunks.get("metadatas", []) or [{}] * len(chunk_ids)
-        for idx, chunk_id in enumerate(chunk_ids):
+        new_metadatas = [{**(m or {}), **demotion} for m in metadatas]
+
+        demoted = 0
+        for start in range(0, len(chunk_ids), UPDATE_BATCH_SIZE):
+            batch_ids = chunk_ids[start : start + UPDATE_BATCH_SIZE]
             try:
-                _now = datetime.utcnow()
-                metadata = dict(metadatas[idx] or {})
-                metadata.update(
-                    {
-                        "stage": "demoted",
-                        "score_multiplier": 0.5,
-                        "demoted_at": _now.isoformat(),
-                        "demoted_at_ts": _now.timestamp(),
-                    }
-                )
                 self.vector_indexer.collection.update(
-                    ids=[chunk_id], metadatas=[metadata]
+                    ids=batch_ids,
+                    metadatas=new_metadatas[start : start + UPDATE_BATCH_SIZE],
                 )
+                demoted += len(batch_ids)
             except Exception as e:
-                logger.error(f"Failed to demote chunk {chunk_id}: {e}")
+                logger.error(f"Failed to demote {len(batch_ids)} chunks: {e}")
 
-        logger.info(f"Demoted {len(chunk_ids)} chunks (>{threshold} days old)")
-        return len(chunk_ids)
+        logger.info(f"Demoted {demoted} chunks (>{threshold} days old)")
+        return demoted
 
     @guarded_mutation
     def archive_demoted_chunks(self, threshold_days: Optional[int] = None) -> int:
@@ -134,38 +144,47 @@ class StageTransitionsMixin:
             return None
 
     def _archive_chunks_batch(self, old_chunks: Dict) -> int:
-        """Archive a batch of chunks."""
-        archived_count = 0
-
-        for i, chunk_id in enumerate(old_chunks["ids"]):
-            full_text = old_chunks["documents"][i]
-            metadata = old_chunks["metadatas"][i]
-            now = datetime.utcnow()
-            metadata = dict(metadata or {})
-            metadata.update(
-                {
-                    "stage": "archived",
-                    "archived_at": now.isoformat(),
-                    "archived_at_ts": now.timestamp(),
-                }
-            )
+        """Archive a batch of chunks.
 
-            # Compress and store
-            summary = self._summarize(full_text)
-            self.kv_store.set(f"archived:{chunk_id}", summary)
-            self.kv_store.set(
-                f"archived:{chunk_id}:metadata",
-                json.dumps(metadata, sort_keys=True, default=str),
+        All summaries and metadata go to the KV store in one set_many()
+        transaction, then the chunks leave the vector store in one delete().
+        Nothing is deleted unless the KV write succeeded, because the summary
+        is all that survives archival.
+        """
+        chunk_ids = list(old_chunks["ids"])
+        now = datetime.utcnow()
+        archival = {
+            "stage": "archived",
+            "archived_at": now.isoformat(),
+            "archived_at_ts": now.timestamp(),
+        }
+
+        pairs = []
+        for i, chunk_id in enumerate(chunk_ids):
+            metadata = {**(old_chunks["metadatas"][i] or {}), **archival}
+            pairs.append(
+                (f"archived:{chunk_id}", self._summarize(old_chunks["documents"][i]))
+            )
+            pairs.append(
+                (
+                    f"archived:{chunk_id}:metadata",
+                    orjson.dumps(
+                        metadata, default=str, option=orjson.OPT_SORT_KEYS
+                    ).decode(),
+                )
             )
 
-            # Delete from vector store
-            try:
-                self.vector_indexer.collection.delete(ids=[chunk_id])
-                archived_count += 1
-            except Exception as e:
-                logger.error(f"Failed to delete chunk {chunk_id}: {e}")
+        if not self.kv_store.set_many(pairs):
+            logger.error(f"Failed to store {len(chunk_ids)} archived summaries")
+            return 0
 
-        return archived_count
+        try:
+            self.vector_indexer.collection.delete(ids=chunk_ids)
+        except Exception as e:
+            logger.error(f"Failed to delete {len(chunk_ids)} archived chunks: {e}")
+            return 0
+
+        return len(chunk_ids)
 
     @guarded_mutation
     def make_rehydratable(self, threshold_days: Optional[int] = None) -> int:
@@ -182,38 +201,35 @@ class StageTransitionsMixin:
         """
         threshold = threshold_days or self.rehydrate_threshold
 
-        # Query archived chunks from KV store
-        archived_keys = [
-            key
-            for key in self.kv_store.list_keys("archived:")
-            if ":metadata" not in key
-        ]
-
-        rehydratable_count = 0
-        for key in archived_keys:
-            chunk_id = key.replace("archived:", "")
+        # Page through archived metadata keys only (suffix filtered in
+        # SQLite); summaries are fetched just for the chunks that are due
+        cutoff = (datetime.utcnow() - timedelta(days=threshold)).timestamp()
+        prefix, suffix = "archived:", ":metadata"
+        pairs, moved = [], []
+        for meta_key, metadata_str in self.kv_store.scan_items(prefix, suffix):
+            chunk_id = meta_key[len(prefix) : -len(suffix)]
 
             # Check archival age
-            metadata_str = self.kv_store.get(f"archived:{chunk_id}:metadata")
-            if not metadata_str:
-                continue
-
             metadata = self._load_archived_metadata(metadata_str)
             archived_at_ts = metadata.get("archived_at_ts")
-            if archived_at_ts is None:
+            if archived_at_ts is None or float(archived_at_ts) >= cutoff:
                 continue
 
-            cutoff = (datetime.utcnow() - timedelta(days=threshold)).timestamp()
-            if float(archived_at_ts) < cutoff:
-                # Mark as rehydratable in metadata
-                self.kv_store.set(
-                    f"rehydratable:{chunk_id}",
-                    self.kv_store.get(f"archived:{chunk_id}"),
-                )
-                self.kv_store.set(f"rehydratable:{chunk_id}:metadata", metadata_str)
-                self.kv_store.delete(f"archived:{chunk_id}")
-                self.kv_store.delete(f"archived:{chunk_id}:metadata")
-                rehydratable_count += 1
+            summary = self.kv_store.get(f"{prefix}{chunk_id}")
+            if summary is None:
+                continue
+            pairs.append((f"rehydratable:{chunk_id}", summary))
+            pairs.append((f"rehydratable:{chunk_id}:metadata", metadata_str))
+            moved.append(chunk_id)
+
+        # Copy first, then drop the archived keys only if the copy landed
+        if moved and not self.kv_store.set_many(pairs):
+            logger.error(f"Failed to mark {len(moved)} chunks rehydratable")
+            return 0
+        for chunk_id in moved:
+            self.kv_store.delete(f"archived:{chunk_id}")
+            self.kv_store.delete(f"archived:{chunk_id}:metadata")
+        rehydratable_count = len(moved)
 
         logger.info(
             f"Made {rehydratable_count} chunks rehydratable "
@@ -225,8 +241,8 @@ class StageTransitionsMixin:
     def _load_archived_metadata(metadata_str: str) -> Dict:
         """Load archived metadata from JSON, with legacy fallback."""
         try:
-            return json.loads(metadata_str)
-        except (TypeError, json.JSONDecodeError):
+            return orjson.loads(metadata_str)
+        except (TypeError, orjson.JSONDecodeError):
             if metadata_str and "archived_at" in metadata_str:
                 raw_value = metadata_str.split("archived_at", 1)[1].split(",", 1)[0]
                 raw_value = raw_value.strip(": '\"")
@@ -5,10 +5,11 @@ Detects interaction mode (execution, planning, brainstorming) from query pattern
 """
 
 import re
-from typing import Tuple
+from functools import lru_cache
+from typing import Dict, List, Tuple
 from loguru import logger
 
-from .mode_profile import ModeProfile, EXECUTION, PLANNING, BRAINSTORMING
+from .mode_profile import ModeProfile, EXECUTION, PLANNING, BRAINSTORMING, PROFILES
 
 
 # ISS-030 FIX: validate imports at module load time. Use explicit raises, not
@@ -31,6 +32,133 @@ def _validate_mode_profiles() -> None:
 _validate_mode_profiles()
 
 
+# Pattern sets are module constants compiled once at import. Every pattern
+# starts with \b<word>; _PATTERN_INDEX keys them by that word so one pass over
+# the query's words tries only patterns that can start there (see _match_counts).
+
+# Execution patterns (imperative, factual)
+EXECUTION_PATTERNS = (
+    r"\bwhat\s+is\b",
+    r"\bwhat\s+are\b",
+    r"\bhow\s+do\s+i\b",
+    r"\bhow\s+to\b",
+    r"\bshow\s+me\b",
+    r"\bget\b",
+    r"\bfind\b",
+    r"\bfetch\b",
+    r"\btell\s+me\b",
+    r"\bexplain\b",
+    r"\bdescribe\b",
+)
+
+# Planning patterns (conditional, comparative)
+PLANNING_PATTERNS = (
+    r"\bwhat\s+should\b",
+    r"\bhow\s+can\s+i\b",
+    r"\bhow\s+should\b",
+    r"\bwhat\s+approach\b",
+    r"\bwhat\s+are\s+the\s+options\b",
+    r"\bdesign\b",
+    r"\bplan\b",
+    r"\bstrategy\b",
+    r"\brecommend\b",
+    r"\bcompare\b",
+    r"\bwhich\s+is\s+better\b",
+    r"\bshould\s+i\b",
+    r"\bwhen\s+should\b",
+    r"\bwhat\s+if\s+i\b",
+)
+
+# Brainstorming patterns (creative, exploratory)
+BRAINSTORMING_PATTERNS = (
+    r"\bwhat\s+if\b",
+    r"\bcould\s+we\b",
+    r"\bimagine\b",
+    r"\bexplore\b",
+    r"\bwhat\s+are\s+all\b",
+    r"\bwhat\s+other\b",
+    r"\blist\s+all\b",
+    r"\bbrainstorm\b",
+    r"\bideas\s+for\b",
+    r"\bpossibilities\s+for\b",
+)
+
+
+_LEADING_WORD_RE = re.compile(r"^\\b(\w+)")
+_WORD_RE = re.compile(r"\w+")
+
+
+def _build_pattern_index() -> Dict[str, Tuple[Tuple[str, int, "re.Pattern[str]"], ...]]:
+    """Map each pattern's leading word to its (mode, pattern id, regex) entries."""
+    index: Dict[str, List[Tuple[str, int, "re.Pattern[str]"]]] = {}
+    mode_patterns = (
+        ("execution", EXECUTION_PATTERNS),
+        ("planning", PLANNING_PATTERNS),
+        ("brainstorming", BRAINSTORMING_PATTERNS),
+    )
+    for mode, patterns in mode_patterns:
+        for pattern_id, pattern in enumerate(patterns):
+            leading = _LEADING_WORD_RE.match(pattern)
+            if leading is None:
+                raise ValueError(f"mode pattern must start with \\b<word>: {pattern}")
+            index.setdefault(leading.group(1), []).append(
+                (mode, pattern_id, re.compile(pattern))
+            )
+    return {word: tuple(entries) for word, entries in index.items()}
+
+
+_PATTERN_INDEX = _build_pattern_index()
+
+# Confidence by number of distinct matching patterns: 0, 1, 2+
+_CONFIDENCE_BY_MATCHES = (0.0, 0.85, 1.0)
+
+
+def _resolve_mode(counts: Dict[str, int]) -> Tuple[str, float]:
+    """Highest-confidence mode (first in counts order on ties) and confidence."""
+    best_mode, best_level = "execution", 0
+    for mode, count in counts.items():
+        level = min(count, 2)
+        if level > best_level:
+            best_mode, best_level = mode, level
+    return best_mode, _CONFIDENCE_BY_MATCHES[best_level]
+
+
+def _match_counts(query: str) -> Dict[str, int]:
+    """
+    Count distinct matching patterns per mode in one pass over the query.
+
+    Each word is looked up in _PATTERN_INDEX and only the patterns that
+    start with it are tried, anchored at that word. Overlapping patterns
+    (e.g. "what should" and "should i") each count once.
+
+    Args:
+        query: Lowercase query string
+
+    Returns:
+        {mode: number of distinct patterns matched}
+    """
+    matched = set()
+    for word in _WORD_RE.finditer(query):
+        for mode, pattern_id, pattern in _PATTERN_INDEX.get(word.group(), ()):
+            if pattern.match(query, word.start()):
+                matched.add((mode, pattern_id))
+
+    counts = {"execution": 0, "planning": 0, "brainstorming": 0}
+    for mode, _ in matched:
+        counts[mode] += 1
+    return counts
+
+
+# Distinct lowercased queries whose classification is memoized.
+DETECT_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=DETECT_CACHE_SIZE)
+def _classify(query: str) -> Tuple[str, float]:
+    """Memoized (mode, confidence) for a lowercased, stripped query."""
+    return _resolve_mode(_match_counts(query))
+
+
 class ModeDetector:
     """
     Pattern-based mode detector.
@@ -43,52 +171,9 @@ class ModeDetector:
 
     def __init__(self) -> None:
         """Initialize mode detector with pattern definitions."""
-        # Execution patterns (imperative, factual)
-        self.execution_patterns = [
-            r"\bwhat\s+is\b",
-            r"\bwhat\s+are\b",
-            r"\bhow\s+do\s+i\b",
-            r"\bhow\s+to\b",
-            r"\bshow\s+me\b",
-            r"\bget\b",
-            r"\bfind\b",
-            r"\bfetch\b",
-            r"\btell\s+me\b",
-            r"\bexplain\b",
-            r"\bdescribe\b",
-        ]
-
-        # Planning patterns (conditional, comparative)
-        self.planning_patterns = [
-            r"\bwhat\s+should\b",
-            r"\bhow\s+can\s+i\b",
-            r"\bhow\s+should\b",
-            r"\bwhat\s+approach\b",
-            r"\bwhat\s+are\s+the\s+options\b",
-            r"\bdesign\b",
-            r"\bplan\b",
-            r"\bstrategy\b",
-            r"\brecommend\b",
-            r"\bcompare\b",
-            r"\bwhich\s+is\s+better\b",
-            r"\bshould\s+i\b",
-            r"\bwhen\s+should\b",
-            r"\bwhat\s+if\s+i\b",
-        ]
-
-        # Brainstorming patterns (creative, exploratory)
-        self.brainstorming_patterns = [
-            r"\bwhat\s+if\b",
-            r"\bcould\s+we\b",
-            r"\bimagine\b",
-            r"\bexplore\b",
-            r"\bwhat\s+are\s+all\b",
-            r"\bwhat\s+other\b",
-            r"\blist\s+all\b",
-            r"\bbrainstorm\b",
-            r"\bideas\s+for\b",
-            r"\bpossibilities\s+for\b",
-        ]
+        self.execution_patterns = EXECUTION_PATTERNS
+        self.planning_patterns = PLANNING_PATTERNS
+        self.brainstorming_patterns = BRAINSTORMING_PATTERNS
 
         logger.info("ModeDetector initialized")
 
@@ -114,16 +199,9 @@ class ModeDetector:
 
         query_lower = query.lower().strip()
 
-        # Score each mode
-        scores = {
-            "execution": self._score_execution_patterns(query_lower),
-            "planning": self._score_planning_patterns(query_lower),
-            "brainstorming": self._score_brainstorming_patterns(query_lower),
-        }
-
-        # Find mode with highest score
-        detected_mode = max(scores, key=lambda x: scores[x])
-        confidence = scores[detected_mode]
+        # Score each mode from one pass over the query, keep the highest;
+        # repeated queries are answered from the _classify cache
+        detected_mode, confidence = _classify(query_lower)
 
         # Fallback to execution if confidence too low
         if confidence < 0.7:
@@ -133,11 +211,7 @@ class ModeDetector:
             return EXECUTION, 0.5
 
         # Return detected mode
-        profile = {
-            "execution": EXECUTION,
-            "planning": PLANNING,
-            "brainstorming": BRAINSTORMING,
-        }[detected_mode]
+        profile = PROFILES[detected_mode]
 
         logger.debug(
             f"Detected mode: {detected_mode} " f"(confidence: {confidence:.2f})"
@@ -155,19 +229,7 @@ class ModeDetector:
         Returns:
             Confidence score (0.0-1.0)
         """
-        matches = 0
-
-        for pattern in self.execution_patterns:
-            if re.search(pattern, query):
-                matches += 1
-
-        # Normalize score (1 match = 0.85, 2+ matches = 1.0)
-        if matches == 0:
-            return 0.0
-        elif matches == 1:
-            return 0.85
-        else:
-            return 1.0
+        return self._count_to_score(_match_counts(query)["execution"])
 
     def _score_planning_patterns(self, query: str) -> float:
         """
@@ -179,19 +241,7 @@ class ModeDetector:
         Returns:
             Confidence score (0.0-1.0)
         """
-        matches = 0
-
-        for pattern in self.planning_patterns:
-            if re.search(pattern, query):
-                matches += 1
-
-        # Normalize score (1 match = 0.85, 2+ matches = 1.0)
-        if matches == 0:
-            return 0.0
-        elif matches == 1:
-            return 0.85
-        else:
-            return 1.0
+        return self._count_to_score(_match_counts(query)["planning"])
 
     def _score_brainstorming_patterns(self, query: str) -> float:
         """
@@ -203,16 +253,9 @@ class ModeDetector:
         Returns:
             Confidence score (0.0-1.0)
         """
-        matches = 0
-
-        for pattern in self.brainstorming_patterns:
-            if re.search(pattern, query):
-                matches += 1
-
-        # Normalize score (1 match = 0.85, 2+ matches = 1.0)
-        if matches == 0:
-            return 0.0
-        elif matches == 1:
-            return 0.85
-        else:
-            return 1.0
+        return self._count_to_score(_match_counts(query)["brainstorming"])
+
+    @staticmethod
+    def _count_to_score(matches: int) -> float:
+        """Normalize score (1 match = 0.85, 2+ matches = 1.0)."""
+        return _CONFIDENCE_BY_MATCHES[min(matches, 2)]
@@ -5,8 +5,9 @@ Insight #5: Mode awareness > prompt cleverness.
 Different modes need different retrieval strategies.
 """
 
-from dataclasses import dataclass
-from typing import Dict
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+from typing import Mapping
 
 # ISS-030 FIX: Explicit exports for import validation
 __all__ = [
@@ -19,7 +20,7 @@ __all__ = [
 ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModeProfile:
     """
     Mode-specific configuration profile.
@@ -75,6 +76,20 @@ class ModeProfile:
         if not 0.0 <= self.randomness <= 1.0:
             raise ValueError(f"randomness must be in [0.0, 1.0], got {self.randomness}")
 
+    @classmethod
+    def _unchecked(cls, **values: object) -> "ModeProfile":
+        """
+        Build a profile without running __post_init__ validation.
+
+        Only for the predefined module-level profiles, whose values are
+        known-valid constants; user-constructed profiles go through
+        ModeProfile(...) and are always validated.
+        """
+        profile = object.__new__(cls)
+        for field in fields(cls):
+            object.__setattr__(profile, field.name, values[field.name])
+        return profile
+
     @property
     def total_size(self) -> int:
         """Total results (core + extended)."""
@@ -83,7 +98,7 @@ class ModeProfile:
 
 # Predefined Mode Profiles
 
-EXECUTION = ModeProfile(
+EXECUTION = ModeProfile._unchecked(
     name="execution",
     core_size=5,
     extended_size=0,  # Precision only (no extended)
@@ -100,7 +115,7 @@ Use for: "What is X?", "How do I X?", imperative queries.
 Focus: Correct answers quickly.
 """
 
-PLANNING = ModeProfile(
+PLANNING = ModeProfile._unchecked(
     name="planning",
     core_size=5,
     extended_size=15,  # 5 + 15 = 20 total
@@ -117,7 +132,7 @@ Use for: "What should I X?", "How can I X?", conditional queries.
 Focus: Explore options, compare alternatives.
 """
 
-BRAINSTORMING = ModeProfile(
+BRAINSTORMING = ModeProfile._unchecked(
     name="brainstorming",
     core_size=5,
     extended_size=25,  # 5 + 25 = 30 total
@@ -134,12 +149,14 @@ Use for: "What if X?", "Could we X?", creative queries.
 Focus: Maximum coverage, creative connections.
 """
 
-# Profile registry
-PROFILES: Dict[str, ModeProfile] = {
-    "execution": EXECUTION,
-    "planning": PLANNING,
-    "brainstorming": BRAINSTORMING,
-}
+# Profile registry (read-only view; profiles are shared, immutable singletons)
+PROFILES: Mapping[str, ModeProfile] = MappingProxyType(
+    {
+        "execution": EXECUTION,
+        "planning": PLANNING,
+        "brainstorming": BRAINSTORMING,
+    }
+)
 
 
 def get_profile(name: str) -> ModeProfile:
@@ -155,9 +172,9 @@ def get_profile(name: str) -> ModeProfile:
     Raises:
         ValueError: If mode name not found
     """
-    if name not in PROFILES:
+    try:
+        return PROFILES[name]
+    except KeyError:
         raise ValueError(
             f"Unknown mode: {name}. " f"Valid modes: {', '.join(PROFILES.keys())}"
-        )
-
-    return PROFILES[name]
+        ) from None
@@ -7,8 +7,9 @@ NASA Rule 10 Compliant: All functions <=60 LOC
 MEM-CHUNK-002: Added Lost-in-the-Middle mitigation strategies.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Mapping
 from enum import Enum
+from types import MappingProxyType
 import numpy as np
 from loguru import logger
 
@@ -29,6 +30,19 @@ class LostInMiddleMitigation(Enum):
     REVERSE_MIDDLE = "reverse_middle"
 
 
+# Column of each tier in the (vector, graph, bayesian) score components.
+_TIER_COLUMNS = {"vector": 0, "hipporag": 1, "bayesian": 2}
+
+# Core/extended split per mode (read-only; unknown modes use execution)
+_MODE_CONFIGS: Mapping[str, Mapping[str, int]] = MappingProxyType(
+    {
+        "execution": MappingProxyType({"core_k": 5, "extended_k": 0}),
+        "planning": MappingProxyType({"core_k": 5, "extended_k": 15}),
+        "brainstorming": MappingProxyType({"core_k": 5, "extended_k": 25}),
+    }
+)
+
+
 class ProcessingUtilsMixin:
     """
     Mixin providing utility methods for NexusProcessor.
@@ -54,47 +68,79 @@ class ProcessingUtilsMixin:
             + self.weights.get("bayesian", 0.2) * bayesian_score
         )
 
+    def _calculate_hybrid_scores(self, components: np.ndarray) -> np.ndarray:
+        """Vectorized _calculate_hybrid_score over (n, 3) rows of
+        (vector, graph, bayesian) scores; one matrix-vector product."""
+        weights = np.array(
+            [
+                self.weights.get("vector", 0.4),
+                self.weights.get("hipporag", 0.4),
+                self.weights.get("bayesian", 0.2),
+            ],
+            dtype=float,
+        )
+        return components @ weights
+
+    @staticmethod
+    def _score_components(candidates: List[Dict[str, Any]]) -> np.ndarray:
+        """(n, 3) array of (vector, graph, bayesian) scores per candidate.
+
+        A candidate without any per-tier score contributes its base score to
+        the column of its own tier.
+        """
+        components = np.array(
+            [
+                [
+                    float(c.get("vector_score", 0.0)),
+                    float(c.get("graph_score", 0.0)),
+                    float(c.get("bayesian_score", 0.0)),
+                ]
+                for c in candidates
+            ],
+            dtype=float,
+        ).reshape(-1, 3)
+        for i in np.flatnonzero(~components.any(axis=1)):
+            column = _TIER_COLUMNS.get(candidates[i].get("tier"))
+            if column is not None:
+                components[i, column] = float(candidates[i].get("score", 0.0))
+        return components
+
     def _normalize_candidates_by_tier(
         self, candidates: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
-        """Normalize raw tier scores before cross-tier weighted fusion."""
-        max_by_tier: Dict[str, float] = {}
-        for candidate in candidates:
-            tier = candidate.get("tier", "vector")
-            score = max(0.0, float(candidate.get("score", 0.0)))
-            max_by_tier[tier] = max(max_by_tier.get(tier, 0.0), score)
-
-        normalized = []
-        for candidate in candidates:
-            item = dict(candidate)
-            tier = item.get("tier", "vector")
-            raw_score = float(item.get("score", 0.0))
-            item["raw_score"] = raw_score
-            item["score"] = self._normalize_tier_score(tier, raw_score, max_by_tier)
-            normalized.append(item)
-        return normalized
+        """Normalize raw tier scores before cross-tier weighted fusion.
 
-    @staticmethod
-    def _normalize_tier_score(
-        tier: str, raw_score: float, max_by_tier: Dict[str, float]
-    ) -> float:
-        """Normalize one score to [0,1], scaling raw PPR within graph tier."""
-        if tier == "hipporag":
-            max_score = max_by_tier.get(tier, 0.0)
-            if max_score > 0:
-                return max(0.0, min(1.0, raw_score / max_score))
-        return max(0.0, min(1.0, raw_score))
-
-    def _get_mode_config(self, mode: str) -> Dict[str, int]:
+        Scores are clamped to [0, 1]; raw PPR scores of the graph tier are
+        first scaled by the tier's best score. Computed column-wise.
+        """
+        raw = np.fromiter(
+            (float(c.get("score", 0.0)) for c in candidates),
+            dtype=float,
+            count=len(candidates),
+        )
+        is_graph = np.fromiter(
+            (c.get("tier", "vector") == "hipporag" for c in candidates),
+            dtype=bool,
+            count=len(candidates),
+        )
+        scaled = raw.copy()
+        graph_max = raw[is_graph].max(initial=0.0)
+        if graph_max > 0:
+            scaled[is_graph] /= graph_max
+        scores = np.clip(scaled, 0.0, 1.0)
+
+        return [
+            {**candidate, "raw_score": raw_score, "score": score}
+            for candidate, raw_score, score in zip(
+                candidates, raw.tolist(), scores.tolist()
+            )
+        ]
+
+    def _get_mode_config(self, mode: str) -> Mapping[str, int]:
         """Get mode-specific core/extended split configuration."""
-        configs = {
-            "execution": {"core_k": 5, "extended_k": 0},
-            "planning": {"core_k": 5, "extended_k": 15},
-            "brainstorming": {"core_k": 5, "extended_k": 25},
-        }
-        return configs.get(mode, configs["execution"])
+        return _MODE_CONFIGS.get(mode, _MODE_CONFIGS["execution"])
 
-    def _split_core_extended(self, results: List[Dict], config: Dict) -> tuple:
+    def _split_core_extended(self, results: List[Dict], config: Mapping) -> tuple:
         """Split results into core and extended."""
         core = results[: config["core_k"]]
         extended = results[config["core_k"] : config["core_k"] + config["extended_k"]]
@@ -108,16 +154,22 @@ class ProcessingUtilsMixin:
         mode: str,
         budget: int,
     ) -> Dict[str, Any]:
-        """Finalize compression with budget enforcement and metrics."""
-        # Enforce token budget
-        total_tokens, truncated = self._enforce_token_budget(core, extended, budget)
+        """Finalize compression with budget enforcement and metrics.
+
+        core and extended are the leading slices of all_results (see
+        _split_core_extended), so every result is tokenized exactly once.
+        """
+        lengths = self._token_lengths(all_results)
+        n_core = len(core)
 
-        if truncated:
-            extended = truncated
-            total_tokens = sum(len(r.get("text", "").split()) for r in core + extended)
+        # Enforce token budget
+        total_tokens, kept = self._enforce_token_budget(
+            lengths[:n_core], lengths[n_core : n_core + len(extended)], budget
+        )
+        extended = extended[:kept]
 
         # Calculate compression ratio
-        original = sum(len(r.get("text", "").split()) for r in all_results)
+        original = int(lengths.sum())
         ratio = total_tokens / original if original > 0 else 1.0
 
         logger.info(
@@ -133,6 +185,15 @@ class ProcessingUtilsMixin:
             "mode": mode,
         }
 
+    @staticmethod
+    def _token_lengths(results: List[Dict[str, Any]]) -> np.ndarray:
+        """Whitespace token count of each result's text."""
+        return np.fromiter(
+            (len(r.get("text", "").split()) for r in results),
+            dtype=np.int64,
+            count=len(results),
+        )
+
     def _calculate_cosine_similarity(self, text1: str, text2: str) -> float:
         """
         B3.2 FIX: Calculate cosine similarity between two texts.
@@ -155,8 +216,10 @@ class ProcessingUtilsMixin:
         # Use embeddings for accurate cosine similarity
         if self.embedding_pipeline is not None:
             try:
-                emb1 = self.embedding_pipeline.encode_single(text1)
-                emb2 = self.embedding_pipeline.encode_single(text2)
+                # Both texts in one batched forward pass
+                emb1, emb2 = np.asarray(
+                    self.embedding_pipeline.encode([text1, text2]), dtype=np.float32
+                )
 
                 # Actual cosine similarity: dot(a,b) / (|a| * |b|)
                 dot_product = np.dot(emb1, emb2)
@@ -183,50 +246,41 @@ class ProcessingUtilsMixin:
 
     def _enforce_token_budget(
         self,
-        core: List[Dict[str, Any]],
-        extended: List[Dict[str, Any]],
+        core_lengths: np.ndarray,
+        extended_lengths: np.ndarray,
         token_budget: int,
     ) -> tuple:
         """
         Enforce token budget by truncating extended.
 
         Args:
-            core: Core results (never truncated)
-            extended: Extended results (truncate if needed)
+            core_lengths: Token count per core result (never truncated)
+            extended_lengths: Token count per extended result, in rank order
             token_budget: Maximum tokens
 
         Returns:
-            (total_tokens, truncated_extended)
+            (total_tokens, number of leading extended results kept)
         """
         # Calculate core tokens (never truncated)
-        core_tokens = sum(len(r.get("text", "").split()) for r in core)
+        core_tokens = int(core_lengths.sum())
 
         if core_tokens >= token_budget:
             logger.warning(
                 f"Core alone exceeds budget ({core_tokens} > {token_budget})"
             )
-            return core_tokens, []
-
-        # Calculate available budget for extended
-        available = token_budget - core_tokens
-        extended_tokens = 0
-        truncated = []
-
-        for result in extended:
-            result_tokens = len(result.get("text", "").split())
-
-            if extended_tokens + result_tokens <= available:
-                truncated.append(result)
-                extended_tokens += result_tokens
-            else:
-                logger.debug(
-                    f"Truncated extended at {len(truncated)} results "
-                    f"(budget exceeded)"
-                )
-                break
+            return core_tokens, 0
 
-        total_tokens = core_tokens + extended_tokens
-        return total_tokens, truncated
+        # Extended is kept as a rank-order prefix. Running totals never
+        # decrease, so the cutoff is one binary search over the cumsum.
+        cumulative = np.cumsum(extended_lengths)
+        kept = int(
+            np.searchsorted(cumulative, token_budget - core_tokens, side="right")
+        )
+        if kept < len(extended_lengths):
+            logger.debug(f"Truncated extended at {kept} results (budget exceeded)")
+
+        extended_tokens = int(cumulative[kept - 1]) if kept else 0
+        return core_tokens + extended_tokens, kept
 
     def _empty_result(self, mode: str) -> Dict[str, Any]:
         """
@@ -296,15 +350,10 @@ class ProcessingUtilsMixin:
         NASA Rule 10: 20 LOC
         """
         n = len(results)
-        reordered = []
-
-        # First half: odd positions (0, 2, 4, ...)
-        for i in range(0, n, 2):
-            reordered.append(results[i])
 
-        # Second half: even positions reversed (n-1, n-3, ...)
-        for i in range(n - 1 if n % 2 == 0 else n - 2, 0, -2):
-            reordered.append(results[i])
+        # First half: odd positions (0, 2, 4, ...); second half: even
+        # positions reversed (..., 5, 3, 1)
+        reordered = results[0::2] + results[1::2][::-1]
 
         logger.debug(f"Lost-in-middle EDGES reorder: {n} items")
         return reordered
@@ -322,15 +371,11 @@ class ProcessingUtilsMixin:
         """
         n = len(results)
         mid = (n + 1) // 2
-        top_half = results[:mid]
-        bottom_half = results[mid:]
 
-        reordered = []
-        for i in range(max(len(top_half), len(bottom_half))):
-            if i < len(top_half):
-                reordered.append(top_half[i])
-            if i < len(bottom_half):
-                reordered.append(bottom_half[i])
+        # Top half fills the even slots, bottom half the odd ones
+        reordered = [None] * n
+        reordered[0::2] = results[:mid]
+        reordered[1::2] = results[mid:]
 
         logger.debug(f"Lost-in-middle INTERLEAVE reorder: {n} items")
         return reordered
@@ -351,12 +396,7 @@ class ProcessingUtilsMixin:
         if n <= 3:
             return results
 
-        first = [results[0]]
-        last = [results[-1]]
-        middle = results[1:-1]
-        middle_reversed = list(reversed(middle))
-
-        reordered = first + middle_reversed + last
+        reordered = [results[0], *results[-2:0:-1], results[-1]]
         logger.debug(f"Lost-in-middle REVERSE_MIDDLE reorder: {n} items")
         return reordered
 
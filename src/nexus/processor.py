@@ -15,13 +15,47 @@ Refactored: Extracted tier queries and utilities into separate modules.
 See: tier_queries.py, processing_utils.py
 """
 
-from typing import List, Dict, Any, Optional
+import heapq
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from hashlib import blake2b
+from typing import List, Dict, Any, Optional, Tuple
+import numpy as np
 from loguru import logger
 
 # Import mixins for modular architecture (ISS-004 fix)
 from .tier_queries import TierQueryMixin
 from .processing_utils import ProcessingUtilsMixin, LostInMiddleMitigation
 
+# Upper bound recall waits on the Bayesian tier (its engine enforces its own
+# 1s inference timeout; this also covers entity extraction and feedback).
+RECALL_BAYESIAN_TIMEOUT_S = 2.0
+
+# Recall worker pools, sized for concurrent callers on a shared processor:
+# vector + HippoRAG take two workers per recall; Bayesian has its own pool so
+# a query abandoned after the timeout never occupies a fast-tier worker.
+RECALL_POOL_WORKERS = 8
+BAYESIAN_POOL_WORKERS = 4
+
+# Pipeline results are reused for identical requests within this window, so
+# repeated queries skip recall..compress without serving long-stale context.
+RESULT_CACHE_SIZE = 256
+RESULT_CACHE_TTL_SECONDS = 5.0
+
+# Per-tier score field and source bit used when fusing recall rows
+_TIER_FIELDS = {
+    "vector": ("vector_score", 1),
+    "hipporag": ("graph_score", 2),
+    "bayesian": ("bayesian_score", 4),
+}
+# Sorted tier names for every combination of source bits
+_SOURCE_TIERS_BY_MASK = tuple(
+    tuple(sorted(tier for tier, (_, bit) in _TIER_FIELDS.items() if mask & bit))
+    for mask in range(8)
+)
+
 
 class NexusProcessor(TierQueryMixin, ProcessingUtilsMixin):
     """
@@ -50,6 +84,7 @@ class NexusProcessor(TierQueryMixin, ProcessingUtilsMixin):
         rerank_top_k: int = 30,
         rerank_enabled: bool = True,
         lost_in_middle_mitigation: LostInMiddleMitigation = LostInMiddleMitigation.EDGES,
+        embedding_cache_size: int = 8192,
     ) -> None:
         """
         Initialize Nexus Processor with all 3 tier services.
@@ -68,6 +103,7 @@ class NexusProcessor(TierQueryMixin, ProcessingUtilsMixin):
             rerank_top_k: Number of candidates to pass through reranker (default: 30)
             rerank_enabled: Enable/disable reranking step (default: True)
             lost_in_middle_mitigation: Strategy for mitigating lost-in-middle (MEM-CHUNK-002)
+            embedding_cache_size: Max candidate embeddings kept for reuse (default: 8192)
         """
         self.vector_indexer = vector_indexer
         self.graph_query_engine = graph_query_engine
@@ -82,15 +118,38 @@ class NexusProcessor(TierQueryMixin, ProcessingUtilsMixin):
         self.rerank_enabled = rerank_enabled
         self.lost_in_middle_mitigation = lost_in_middle_mitigation  # MEM-CHUNK-002
         self.weights = weights or {"vector": 0.4, "hipporag": 0.4, "bayesian": 0.2}
+        self._init_shared_state(embedding_cache_size)
 
         rerank_status = "enabled" if (reranker and rerank_enabled) else "disabled"
         feedback_status = "enabled" if bayesian_graph_sync else "disabled"
-        mitigation_status = lost_in_middle_mitigation.value
         logger.info(
             f"NexusProcessor initialized with weights: {self.weights}, "
             f"rerank: {rerank_status}, bayesian_feedback: {feedback_status}, "
-            f"lost_in_middle: {mitigation_status}"
+            f"lost_in_middle: {lost_in_middle_mitigation.value}"
+        )
+
+    def _init_shared_state(self, embedding_cache_size: int) -> None:
+        """Embedding/result LRU caches and recall pool, reused across queries."""
+        self.embedding_cache_size = embedding_cache_size
+        self._embedding_cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        # key -> (monotonic deadline, result)
+        self._result_cache: OrderedDict[tuple, Tuple[float, Dict]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._recall_pool = ThreadPoolExecutor(
+            RECALL_POOL_WORKERS, thread_name_prefix="nexus-recall"
         )
+        self._bayesian_pool = ThreadPoolExecutor(
+            BAYESIAN_POOL_WORKERS, thread_name_prefix="nexus-bayesian"
+        )
+
+    def close(self) -> None:
+        """Release the recall worker threads (idempotent).
+
+        Queued tier queries are cancelled and running ones finish in the
+        background; recall() must not be called afterwards.
+        """
+        self._recall_pool.shutdown(wait=False, cancel_futures=True)
+        self._bayesian_pool.shutdown(wait=False, cancel_futures=True)
 
     def process(
         self,
@@ -137,8 +196,8 @@ class NexusProcessor(TierQueryMixin, ProcessingUtilsMixin):
                 )
                 return rlm_result
 
-        # Execute 5-step pipeline
-        result, stats = self._execute_pipeline(query, mode, top_k, token_budget)
+        # Execute 5-step pipeline (reused for RESULT_CACHE_TTL_SECONDS)
+        result, stats = self._execute_pipeline_cached(query, mode, top_k, token_budget)
 
         # Add timing metadata
         result["pipeline_stats"] = stats
@@ -176,6 +235,54 @@ class NexusProcessor(TierQueryMixin, ProcessingUtilsMixin):
             logger.warning(f"RLM exploration failed: {exc}")
             return None
 
+    def clear_result_cache(self) -> None:
+        """Drop memoized process() results, e.g. after new memories are stored."""
+        with self._cache_lock:
+            self._result_cache.clear()
+
+    def _execute_pipeline_cached(
+        self, query: str, mode: str, top_k: int, token_budget: int
+    ) -> tuple[Dict[str, Any], Dict[str, Any]]:
+        """_execute_pipeline memoized per request for RESULT_CACHE_TTL_SECONDS.
+
+        Callers always get their own result and candidate dicts (see
+        _copy_result); a hit reports {"cache_hit": True} in place of
+        per-step timings. A hit skips recall entirely, so the Bayesian tier's
+        graph feedback (_apply_bayesian_feedback) runs only on misses. Write
+        paths call clear_result_cache() so stored memories are searchable
+        immediately.
+        """
+        digest = blake2b(query.encode("utf-8"), digest_size=16).digest()
+        key = (digest, mode, top_k, token_budget, self.rerank_enabled)
+        with self._cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is not None and time.monotonic() < cached[0]:
+                self._result_cache.move_to_end(key)
+                return self._copy_result(cached[1]), {"cache_hit": True}
+
+        result, stats = self._execute_pipeline(query, mode, top_k, token_budget)
+        snapshot = self._copy_result(result)
+        with self._cache_lock:
+            deadline = time.monotonic() + RESULT_CACHE_TTL_SECONDS
+            self._result_cache[key] = (deadline, snapshot)
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        return result, stats
+
+    @staticmethod
+    def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a result down to its candidate dicts.
+
+        Candidates' nested values (metadata, score_breakdown) are shared and
+        must be treated as read-only; every field the pipeline or a caller
+        sets lives on the top-level dicts, so no deep copy is needed.
+        """
+        copied = dict(result)
+        for section in ("core", "extended"):
+            copied[section] = [dict(c) for c in result.get(section, [])]
+        return copied
+
     def _execute_pipeline(
         self, query: str, mode: str, top_k: int, token_budget: int
     ) -> tuple[Dict[str, Any], Dict[str, Any]]:
@@ -281,20 +388,16 @@ class NexusProcessor(TierQueryMixin, ProcessingUtilsMixin):
                     "vector_score": 0.0,
                     "graph_score": 0.0,
                     "bayesian_score": 0.0,
-                    "source_tiers": set(),
+                    "source_tiers": 0,  # bit mask until finalized below
                 },
             )
 
-            tier = candidate.get("tier", "vector")
-            score = float(candidate.get("score", 0.0))
-            entry["source_tiers"].add(tier)
-
-            if tier == "vector":
-                entry["vector_score"] = max(entry["vector_score"], score)
-            elif tier == "hipporag":
-                entry["graph_score"] = max(entry["graph_score"], score)
-            elif tier == "bayesian":
-                entry["bayesian_score"] = max(entry["bayesian_score"], score)
+            tier_field = _TIER_FIELDS.get(candidate.get("tier", "vector"))
+            if tier_field is not None:
+                field, bit = tier_field
+                score = float(candidate.get("score", 0.0))
+                entry[field] = max(entry[field], score)
+                entry["source_tiers"] |= bit
 
             if not entry.get("text") and candidate.get("text"):
                 entry["text"] = candidate["text"]
@@ -311,7 +414,7 @@ class NexusProcessor(TierQueryMixin, ProcessingUtilsMixin):
             entry["score"] = final_score
             entry["hybrid_score"] = final_score
             entry["tier"] = "hybrid"
-            entry["source_tiers"] = sorted(entry["source_tiers"])
+            entry["source_tiers"] = list(_SOURCE_TIERS_BY_MASK[entry["source_tiers"]])
             combined.append(entry)
 
         return combined
@@ -440,21 +543,30 @@ class NexusProcessor(TierQueryMixin, ProcessingUtilsMixin):
                 - tier: "vector" | "hipporag" | "bayesian"
                 - metadata: Additional metadata
         """
-        candidates = []
+        # Tier queries are I/O bound (Chroma, graph, Bayesian engine), so run
+        # them concurrently; recall latency becomes max(tier), not sum(tier).
+        pool = self._recall_pool
+        vector_future = pool.submit(self._query_vector_tier, query, top_k)
+        hipporag_future = pool.submit(self._query_hipporag_tier, query, top_k)
+        bayesian_future = self._bayesian_pool.submit(
+            self._query_bayesian_tier, query, top_k
+        )
 
-        # Query Vector tier
-        vector_results = self._query_vector_tier(query, top_k)
-        candidates.extend(vector_results)
-        logger.debug(f"Vector tier: {len(vector_results)} results")
+        vector_results = self._top_k_by_score(vector_future.result(), top_k)
+        hipporag_results = self._top_k_by_score(hipporag_future.result(), top_k)
+        try:
+            # A straggling Bayesian query finishes in the background
+            bayesian_results = bayesian_future.result(timeout=RECALL_BAYESIAN_TIMEOUT_S)
+        except FuturesTimeoutError:
+            bayesian_results = None
 
-        # Query HippoRAG tier
-        hipporag_results = self._query_hipporag_tier(query, top_k)
-        candidates.extend(hipporag_results)
+        candidates = vector_results + hipporag_results
+        logger.debug(f"Vector tier: {len(vector_results)} results")
         logger.debug(f"HippoRAG tier: {len(hipporag_results)} results")
 
-        # Query Bayesian tier (optional, may return None)
-        bayesian_results = self._query_bayesian_tier(query, top_k)
+        # Bayesian tier is optional and may return None
         if bayesian_results:
+            bayesian_results = self._top_k_by_score(bayesian_results, top_k)
             candidates.extend(bayesian_results)
             logger.debug(f"Bayesian tier: {len(bayesian_results)} results")
         else:
@@ -463,6 +575,19 @@ class NexusProcessor(TierQueryMixin, ProcessingUtilsMixin):
         logger.info(f"Recall: {len(candidates)} total candidates from all tiers")
         return candidates
 
+    @staticmethod
+    def _top_k_by_score(
+        results: List[Dict[str, Any]], top_k: int
+    ) -> List[Dict[str, Any]]:
+        """Bound a tier to its top_k highest-scoring results.
+
+        Engines are asked for top_k but not all of them honour it; a bounded
+        heap keeps this O(n log top_k) and preserves tier order on ties.
+        """
+        if len(results) <= top_k:
+            return results
+        return heapq.nlargest(top_k, results, key=lambda r: r.get("score", 0.0))
+
     def _candidate_confidence(self, candidate: Dict[str, Any]) -> float:
         """Confidence used for filtering = strongest single-tier evidence.
 
@@ -492,11 +617,16 @@ class NexusProcessor(TierQueryMixin, ProcessingUtilsMixin):
         Returns:
             Filtered list (confidence >= threshold)
         """
-        filtered = [
-            c
-            for c in candidates
-            if self._candidate_confidence(c) >= self.confidence_threshold
-        ]
+        # Same rule as _candidate_confidence, evaluated column-wise over the
+        # (n, 3) tier-score array shared with rank()
+        scores = np.fromiter(
+            (float(c.get("score", 0.0)) for c in candidates),
+            dtype=float,
+            count=len(candidates),
+        )
+        confidence = np.maximum(self._score_components(candidates).max(axis=1), scores)
+        keep = np.flatnonzero(confidence >= self.confidence_threshold)
+        filtered = [candidates[i] for i in keep]
 
         logger.debug(
             f"Filter: {len(candidates) - len(filtered)} candidates "
@@ -511,7 +641,8 @@ class NexusProcessor(TierQueryMixin, ProcessingUtilsMixin):
 
         P0-1 FIX: Pre-compute embeddings once, then compare vectors.
         Old: O(n^2) embedding calls (re-encoded per pair).
-        New: O(n) embeddings + O(n^2) dot products (50x faster).
+        New: exact duplicates dropped by hash first, then O(n) embeddings
+        of the survivors + one similarity matmul.
 
         Args:
             candidates: List of candidates from filter
@@ -533,8 +664,9 @@ class NexusProcessor(TierQueryMixin, ProcessingUtilsMixin):
                 seen_texts[text] = i
                 exact_unique_indices.append(i)
 
-        if not exact_unique_indices:
-            return []
+        if len(exact_unique_indices) == 1:
+            # Nothing left to compare: skip the encode and similarity matrix
+            return [candidates[exact_unique_indices[0]]]
 
         # Pre-compute all embeddings in one batch (O(n) encoding)
         unique_texts = [texts[i] for i in exact_unique_indices]
@@ -559,21 +691,30 @@ class NexusProcessor(TierQueryMixin, ProcessingUtilsMixin):
         self,
         candidates: List[Dict[str, Any]],
         exact_unique_indices: List[int],
-        embeddings: List[List[float]],
+        embeddings: Any,
     ) -> List[Dict[str, Any]]:
-        """Compare pre-computed vectors to remove near-duplicates (O(n^2) dot products)."""
-        final_indices = []
-        for i, idx in enumerate(exact_unique_indices):
-            is_duplicate = False
-            for j in final_indices:
-                sim = self._cosine_from_vectors(embeddings[i], embeddings[j])
-                if sim >= self.dedup_threshold:
-                    is_duplicate = True
-                    break
-            if not is_duplicate:
-                final_indices.append(i)
-
-        return [candidates[exact_unique_indices[i]] for i in final_indices]
+        """Remove near-duplicates of earlier kept candidates (cosine >= threshold).
+
+        embeddings is the (n, d) batch from encode(), as an array or row lists.
+        All pairwise cosines come from one matmul of L2-normalized rows; the
+        greedy keep-first pass then only reads boolean rows. The gram matrix is
+        computed in float32: half the bandwidth of float64, and its error is
+        far below what the similarity threshold can resolve.
+        """
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        # Zero vectors stay zero, i.e. cosine 0 against everything
+        unit = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+        too_similar = (unit @ unit.T) >= self.dedup_threshold
+
+        # Only rows with an earlier near-duplicate need the greedy check; the
+        # rest are kept outright. Rows are visited in order, so kept[:i] is
+        # final when row i is decided.
+        kept = np.ones(len(exact_unique_indices), dtype=bool)
+        for i in np.flatnonzero(np.tril(too_similar, k=-1).any(axis=1)):
+            kept[i] = not (too_similar[i, :i] & kept[:i]).any()
+
+        return [candidates[exact_unique_indices[i]] for i in np.flatnonzero(kept)]
 
     def _batch_encode_texts(self, texts: List[str]) -> Optional[Any]:
         """Pre-compute embeddings for all texts in one batch call."""
@@ -581,21 +722,37 @@ class NexusProcessor(TierQueryMixin, ProcessingUtilsMixin):
         if self.embedding_pipeline is None:
             return None
         try:
-            return self.embedding_pipeline.encode(texts)
+            return self._encode_cached(texts)
         except Exception as e:
             logger.warning(f"Batch encoding failed: {e}")
             return None
 
-    @staticmethod
-    def _cosine_from_vectors(vec_a, vec_b) -> float:
-        """Cosine similarity from pre-computed vectors. No re-encoding."""
-        import numpy as np
+    def _encode_cached(self, texts: List[str]) -> np.ndarray:
+        """(n, d) float32 embeddings, encoding only texts not seen recently.
+
+        Vectors are kept in an LRU keyed by a 16-byte blake2b digest of the
+        text; all misses go to the pipeline in one batched encode() call.
+        """
+        keys = [blake2b(t.encode("utf-8"), digest_size=16).digest() for t in texts]
+        cache = self._embedding_cache
+        with self._cache_lock:
+            vectors = {k: cache[k] for k in keys if k in cache}
+            for key in vectors:
+                cache.move_to_end(key)
+        misses = {k: t for k, t in zip(keys, texts) if k not in vectors}
+
+        if misses:
+            encoded = np.asarray(
+                self.embedding_pipeline.encode(list(misses.values())),
+                dtype=np.float32,
+            )
+            with self._cache_lock:
+                for key, vector in zip(misses, encoded):
+                    vectors[key] = cache[key] = vector.copy()
+                while len(cache) > self.embedding_cache_size:
+                    cache.popitem(last=False)
 
-        norm_a = np.linalg.norm(vec_a)
-        norm_b = np.linalg.norm(vec_b)
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-        return float(np.dot(vec_a, vec_b) / (norm_a * norm_b))
+        return np.stack([vectors[k] for k in keys])
 
     def rank(self, candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -611,26 +768,12 @@ class NexusProcessor(TierQueryMixin, ProcessingUtilsMixin):
             return []
 
         candidates = self._normalize_candidates_by_tier(candidates)
-        for candidate in candidates:
-            vector_score = float(candidate.get("vector_score", 0.0))
-            graph_score = float(candidate.get("graph_score", 0.0))
-            bayesian_score = float(candidate.get("bayesian_score", 0.0))
-
-            if not any([vector_score, graph_score, bayesian_score]):
-                tier = candidate.get("tier")
-                base_score = float(candidate.get("score", 0.0))
-                if tier == "vector":
-                    vector_score = base_score
-                elif tier == "hipporag":
-                    graph_score = base_score
-                elif tier == "bayesian":
-                    bayesian_score = base_score
+        components = self._score_components(candidates)
+        hybrid = self._calculate_hybrid_scores(components)
 
-            final_score = self._calculate_hybrid_score(
-                vector_score=vector_score,
-                graph_score=graph_score,
-                bayesian_score=bayesian_score,
-            )
+        for candidate, (vector_score, graph_score, bayesian_score), final_score in zip(
+            candidates, components.tolist(), hybrid.tolist()
+        ):
             candidate["score"] = final_score
             candidate["hybrid_score"] = final_score
             candidate["score_breakdown"] = {
@@ -639,10 +782,9 @@ class NexusProcessor(TierQueryMixin, ProcessingUtilsMixin):
                 "bayesian": bayesian_score,
             }
 
-        # Sort by hybrid score (descending)
-        ranked = sorted(
-            candidates, key=lambda x: x.get("hybrid_score", 0.0), reverse=True
-        )
+        # Sort by hybrid score (descending); stable, so ties keep input order
+        order = np.argsort(-hybrid, kind="stable")
+        ranked = [candidates[i] for i in order]
 
         logger.info(
             f"Rank: Top score = {ranked[0].get('hybrid_score', 0.0):.3f} "
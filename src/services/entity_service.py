@@ -7,7 +7,8 @@ Provides entity extraction, filtering, and graph integration.
 NASA Rule 10 Compliant: All functions ≤60 LOC
 """
 
-from typing import List, Dict, Any, Optional, Set
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Sequence, Set, Tuple
 import re
 from loguru import logger
 from difflib import SequenceMatcher
@@ -15,13 +16,32 @@ import networkx as nx
 
 from .graph_service import GraphService
 
-_MODEL_CACHE: Dict[str, Any] = {}
+_MODEL_CACHE: Dict[Tuple[str, Tuple[str, ...]], Any] = {}
 
+# Entity ID normalization: spaces -> "_", dots dropped. Built once at import
+# so per-entity normalization is a single str.translate pass.
+_ENTITY_ID_TABLE = str.maketrans({" ": "_", ".": None})
 
-def load_spacy_model(model_name: str = "en_core_web_sm"):
-    """Load spaCy model with auto-download and caching. Lazy imports spacy."""
-    if model_name in _MODEL_CACHE:
-        return _MODEL_CACHE[model_name]
+
+def normalize_entity_id(text: str) -> str:
+    """Normalize entity text to a graph node ID (lowercase, no spaces/dots)."""
+    return text.lower().translate(_ENTITY_ID_TABLE)
+
+
+def load_spacy_model(model_name: str = "en_core_web_sm", disable: Sequence[str] = ()):
+    """
+    Load spaCy model with auto-download and caching. Lazy imports spacy.
+
+    Args:
+        model_name: spaCy model name
+        disable: Pipeline components to disable at load time (e.g. tagger,
+            parser). spaCy fixes the pipeline at load, so selection must
+            happen here; models are cached per (name, disabled set).
+    """
+    disable = tuple(sorted(disable))
+    cache_key = (model_name, disable)
+    if cache_key in _MODEL_CACHE:
+        return _MODEL_CACHE[cache_key]
 
     try:
         import spacy
@@ -31,13 +51,13 @@ def load_spacy_model(model_name: str = "en_core_web_sm"):
         return None
 
     try:
-        nlp = spacy.load(model_name)
+        nlp = spacy.load(model_name, disable=list(disable))
     except OSError:
         logger.info("Downloading spaCy model: %s", model_name)
         spacy_download(model_name)
-        nlp = spacy.load(model_name)
+        nlp = spacy.load(model_name, disable=list(disable))
 
-    _MODEL_CACHE[model_name] = nlp
+    _MODEL_CACHE[cache_key] = nlp
     return nlp
 
 
@@ -64,20 +84,53 @@ class EntityService:
         "LOC",  # Non-GPE locations, mountain ranges, bodies of water
     }
 
-    def __init__(self, model_name: str = "en_core_web_sm"):
+    # Components NER does not need in en_core_web_* models. Dropping them
+    # leaves tokenizer + ner, which is all extract_entities() reads.
+    NER_ONLY_DISABLE = ("tagger", "parser", "attribute_ruler", "lemmatizer")
+
+    # Per-instance memo of extract_entities() keyed by text
+    EXTRACT_CACHE_SIZE = 2048
+
+    def __init__(
+        self, model_name: str = "en_core_web_sm", spacy_disable: Sequence[str] = ()
+    ):
         """
         Initialize EntityService with spaCy model.
 
         Args:
             model_name: spaCy model name (default: en_core_web_sm)
+            spacy_disable: Pipeline components to skip at load time
+                (see NER_ONLY_DISABLE for the NER-only selection)
         """
-        self.nlp = load_spacy_model(model_name)
+        # Per-instance so cached results never leak across models
+        self._extract_cached = lru_cache(maxsize=self.EXTRACT_CACHE_SIZE)(
+            self._extract_uncached
+        )
+        self.nlp = load_spacy_model(model_name, disable=spacy_disable)
         logger.info(f"Loaded spaCy model: {model_name}")
 
+    @property
+    def nlp(self):
+        """Loaded spaCy pipeline (None when spaCy is unavailable)."""
+        return self._nlp
+
+    @nlp.setter
+    def nlp(self, value) -> None:
+        """Swap the pipeline and invalidate cached extractions."""
+        self._nlp = value
+        self.clear_cache()
+
+    def clear_cache(self) -> None:
+        """Drop memoized extract_entities() results."""
+        self._extract_cached.cache_clear()
+
     def extract_entities(self, text: str) -> List[Dict[str, Any]]:
         """
         Extract all entities from text.
 
+        Results are memoized per text; callers receive fresh dict copies so
+        mutating them cannot poison the cache.
+
         Args:
             text: Input text to analyze
 
@@ -87,30 +140,34 @@ class EntityService:
         if not text or not text.strip():
             return []
 
-        if self.nlp is None:
-            return self._regex_extract_entities(text)
-
         try:
-            doc = self.nlp(text)
-
-            entities = []
-            for ent in doc.ents:
-                entities.append(
-                    {
-                        "text": ent.text,
-                        "type": ent.label_,
-                        "start": ent.start_char,
-                        "end": ent.end_char,
-                    }
-                )
-
-            logger.debug(f"Extracted {len(entities)} entities from text")
-            return entities
-
+            cached = self._extract_cached(text)
         except Exception as e:
             logger.error(f"Failed to extract entities: {e}")
             return []
 
+        return [dict(ent) for ent in cached]
+
+    def _extract_uncached(self, text: str) -> Tuple[Dict[str, Any], ...]:
+        """Run NER (or the regex fallback) on text; raises on pipeline errors."""
+        if self.nlp is None:
+            return tuple(self._regex_extract_entities(text))
+
+        doc = self.nlp(text)
+
+        entities = tuple(
+            {
+                "text": ent.text,
+                "type": ent.label_,
+                "start": ent.start_char,
+                "end": ent.end_char,
+            }
+            for ent in doc.ents
+        )
+
+        logger.debug(f"Extracted {len(entities)} entities from text")
+        return entities
+
     # Compiled regex patterns for fallback NER
     _DATE_RE = re.compile(
         r"\b(?:January|February|March|April|May|June|July|August|"
@@ -401,7 +458,7 @@ class EntityService:
         Returns:
             Normalized text (lowercase, no spaces)
         """
-        return text.lower().replace(" ", "_").replace(".", "")
+        return normalize_entity_id(text)
 
 
 class EntityConsolidator:
@@ -69,6 +69,10 @@ class GraphNodeManager:
             logger.error(f"Failed to add entity {entity_id}: {e}")
             return False
 
+    def has_node(self, node_id: str) -> bool:
+        """Check node existence (hash lookup, no attribute copy)."""
+        return node_id in self.graph
+
     def get_node(self, node_id: str) -> Optional[Dict[str, Any]]:
         """Get node data by ID."""
         if node_id not in self.graph:
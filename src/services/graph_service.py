@@ -102,6 +102,9 @@ class GraphService:
             self._node_manager.add_entity(entity_id, entity_type, metadata)
         )
 
+    def has_node(self, node_id: str) -> bool:
+        return self._node_manager.has_node(node_id)
+
     def get_node(self, node_id: str) -> Optional[Dict[str, Any]]:
         return self._node_manager.get_node(node_id)
 
@@ -263,6 +266,17 @@ class GraphService:
             return True
         return False
 
+    def reset(self) -> None:
+        """
+        Remove all nodes and edges in place.
+
+        Components share self.graph, so clearing it (rather than replacing
+        it) keeps them consistent. Marks the graph dirty so the next save
+        persists the empty state.
+        """
+        self.graph.clear()
+        self._persistence.mark_dirty()
+
     def get_graph(self) -> nx.DiGraph:
         """Return underlying NetworkX graph."""
         return self.graph
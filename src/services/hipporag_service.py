@@ -8,11 +8,14 @@ NASA Rule 10 Compliant: All functions ≤60 LOC
 """
 
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Sequence, Tuple, TYPE_CHECKING
 from loguru import logger
 
 from .graph_service import GraphService
-from .entity_service import EntityService
+from .entity_service import EntityService, normalize_entity_id
+
+if TYPE_CHECKING:
+    from .graph_query_engine import GraphQueryEngine
 
 
 @dataclass
@@ -45,13 +48,20 @@ class HippoRagService:
     Uses Personalized PageRank on knowledge graph for context-aware retrieval.
     """
 
-    def __init__(self, graph_service: GraphService, entity_service: EntityService):
+    def __init__(
+        self,
+        graph_service: GraphService,
+        entity_service: EntityService,
+        graph_query_engine: Optional["GraphQueryEngine"] = None,
+    ):
         """
         Initialize HippoRAG service with dependencies.
 
         Args:
             graph_service: GraphService instance for graph operations
             entity_service: EntityService instance for entity extraction
+            graph_query_engine: PPR/multi-hop engine (default: a
+                GraphQueryEngine over graph_service)
 
         Raises:
             ValueError: If dependencies are None or invalid
@@ -66,9 +76,11 @@ class HippoRagService:
         self.entity_service = entity_service
 
         # Initialize graph query engine (Day 2)
-        from .graph_query_engine import GraphQueryEngine
+        if graph_query_engine is None:
+            from .graph_query_engine import GraphQueryEngine
 
-        self.graph_query_engine = GraphQueryEngine(graph_service)
+            graph_query_engine = GraphQueryEngine(graph_service)
+        self.graph_query_engine = graph_query_engine
 
         logger.info("HippoRagService initialized")
 
@@ -120,13 +132,13 @@ class HippoRagService:
             return []
 
     def _run_ppr_and_rank(
-        self, query_nodes: List[str], alpha: float, top_k: int
+        self, query_nodes: Sequence[str], alpha: float, top_k: int
     ) -> List[Tuple[str, float]]:
         """
         Run Personalized PageRank and rank chunks.
 
         Args:
-            query_nodes: List of query node IDs
+            query_nodes: Query node IDs
             alpha: PPR damping factor
             top_k: Number of results to return
 
@@ -150,14 +162,14 @@ class HippoRagService:
         return ranked_chunks
 
     def _format_retrieval_results(
-        self, ranked_chunks: List[Tuple[str, float]], query_nodes: List[str]
+        self, ranked_chunks: List[Tuple[str, float]], query_nodes: Sequence[str]
     ) -> List[RetrievalResult]:
         """
         Format ranked chunks as RetrievalResult objects.
 
         Args:
             ranked_chunks: List of (chunk_id, score) tuples
-            query_nodes: List of query entity IDs
+            query_nodes: Query entity IDs
 
         Returns:
             List of RetrievalResult objects
@@ -174,14 +186,14 @@ class HippoRagService:
                 text=chunk_text,
                 score=float(score),
                 rank=rank,
-                entities=query_nodes,
+                entities=list(query_nodes),
                 metadata=node_data.get("metadata", {}),
             )
             results.append(result)
 
         return results
 
-    def _extract_query_entities(self, query: str) -> List[str]:
+    def _extract_query_entities(self, query: str) -> Tuple[str, ...]:
         """
         Extract entities from query using EntityService.
 
@@ -189,49 +201,49 @@ class HippoRagService:
             query: Query text
 
         Returns:
-            List of normalized entity IDs
+            Tuple of normalized entity IDs (immutable; callers only iterate)
         """
         if not query or not query.strip():
             logger.debug("Empty query provided")
-            return []
+            return ()
 
         try:
             # Extract entities using spaCy NER
             entities = self.entity_service.extract_entities(query)
 
             # Normalize entity texts to IDs
-            entity_ids = [self._normalize_entity_text(ent["text"]) for ent in entities]
+            entity_ids = tuple(
+                self._normalize_entity_text(ent["text"]) for ent in entities
+            )
 
             logger.debug(f"Extracted {len(entity_ids)} entities from query")
             return entity_ids
 
         except Exception as e:
             logger.error(f"Failed to extract query entities: {e}")
-            return []
+            return ()
 
-    def _match_entities_to_nodes(self, entities: List[str]) -> List[str]:
+    def _match_entities_to_nodes(self, entities: Sequence[str]) -> Tuple[str, ...]:
         """
         Match extracted entities to graph nodes.
 
+        Uses GraphService.has_node (a hash lookup on the graph's node index)
+        rather than get_node, which copies every node's attributes.
+
         Args:
-            entities: List of normalized entity IDs
+            entities: Normalized entity IDs
 
         Returns:
-            List of matched node IDs
+            Tuple of matched node IDs, in input order
         """
-        matched_nodes = []
-
-        for entity_id in entities:
-            # Check for exact match in graph
-            node = self.graph_service.get_node(entity_id)
-
-            if node is not None:
-                matched_nodes.append(entity_id)
-                logger.debug(f"Exact match found: {entity_id}")
-            else:
-                logger.debug(f"No match for entity: {entity_id}")
+        has_node = self.graph_service.has_node
+        matched_nodes = tuple(
+            entity_id for entity_id in entities if has_node(entity_id)
+        )
 
-        logger.debug(f"Matched {len(matched_nodes)} entities to graph nodes")
+        logger.debug(
+            f"Matched {len(matched_nodes)}/{len(entities)} entities to graph nodes"
+        )
         return matched_nodes
 
     def _normalize_entity_text(self, text: str) -> str:
@@ -244,9 +256,9 @@ class HippoRagService:
         Returns:
             Normalized text (lowercase, no spaces)
         """
-        return text.lower().replace(" ", "_").replace(".", "")
+        return normalize_entity_id(text)
 
-    def _match_query_tokens_to_nodes(self, query: str) -> List[str]:
+    def _match_query_tokens_to_nodes(self, query: str) -> Tuple[str, ...]:
         """
         Fallback seed selection when NER extracts no entities.
 
@@ -258,10 +270,10 @@ class HippoRagService:
             query: User query text
 
         Returns:
-            List of matched node IDs (empty if none match)
+            Tuple of matched node IDs (empty if none match)
         """
         if not query or not query.strip():
-            return []
+            return ()
 
         candidates: List[str] = []
         seen = set()
@@ -317,7 +329,7 @@ class HippoRagService:
             logger.error(f"Multi-hop retrieve failed: {e}")
             return []
 
-    def _get_query_nodes(self, query: str) -> List[str]:
+    def _get_query_nodes(self, query: str) -> Tuple[str, ...]:
         """
         Extract entities from query and match to graph nodes.
 
@@ -325,7 +337,7 @@ class HippoRagService:
             query: User query text
 
         Returns:
-            List of matched node IDs
+            Tuple of matched node IDs
         """
         query_entities = self._extract_query_entities(query)
         query_nodes = self._match_entities_to_nodes(query_entities)
@@ -337,12 +349,12 @@ class HippoRagService:
 
         if not query_nodes:
             logger.warning(f"No query entities found in graph: {query}")
-            return []
+            return ()
 
         return query_nodes
 
     def _expand_entities_multi_hop(
-        self, query_nodes: List[str], max_hops: int
+        self, query_nodes: Sequence[str], max_hops: int
     ) -> List[str]:
         """
         Expand entities using multi-hop search.
@@ -9,6 +9,7 @@ NASA Rule 10 Compliant: All functions <=60 LOC
 
 import os
 import time
+from operator import itemgetter
 from typing import List, Dict, Any, Optional, Tuple
 from loguru import logger
 
@@ -20,6 +21,10 @@ os.environ["WANDB_DISABLED"] = "true"
 os.environ["WANDB_MODE"] = "disabled"
 os.environ["WANDB_SILENT"] = "true"
 
+# Sort keys; every document has the score set just before it is sorted
+_RERANK_SCORE = itemgetter("rerank_score")
+_FINAL_SCORE = itemgetter("final_score")
+
 
 class RerankerService:
     """
@@ -160,7 +165,7 @@ class RerankerService:
             scored_docs.append(doc_copy)
 
         # Sort by rerank score (descending)
-        scored_docs.sort(key=lambda x: x.get("rerank_score", 0), reverse=True)
+        scored_docs.sort(key=_RERANK_SCORE, reverse=True)
 
         stats["rerank_ms"] = int((time.time() - start) * 1000)
         stats["rerank_input_count"] = len(documents)
@@ -218,7 +223,7 @@ class RerankerService:
             doc["score_breakdown"]["rerank"] = rerank
 
         # Re-sort by final score
-        documents.sort(key=lambda x: x.get("final_score", 0), reverse=True)
+        documents.sort(key=_FINAL_SCORE, reverse=True)
         return documents
 
     def _sigmoid(self, x: float) -> float:
@@ -12,19 +12,48 @@ NASA Rule 10 Compliant: All functions <=60 LOC
 import json
 import sqlite3
 import threading
+import uuid
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Tuple
 from loguru import logger
 
-
 # Canonical on-disk filename for the KV/observations/sessions store.
 # The auto-capture hooks (post_tool_handler, session_start_handler, stop_handler)
 # and the MCP runtime (service_wiring, http_server) MUST agree on this name, or
 # writes land in one file and reads come from another (the empty-timeline bug).
 DEFAULT_DB_NAME = "agent_kv.db"
 
+# SQLite's special path for a RAM-only database.
+IN_MEMORY_DB = ":memory:"
+
+# Per-connection tuning applied after journal_mode. In WAL mode
+# synchronous=NORMAL only fsyncs at checkpoints (still durable against
+# application crashes), so single-row set()/delete() no longer pay an fsync
+# per commit. Temp tables/indices stay in RAM; reads go through a 256 MiB mmap.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Rows per page for scan_items(); the store lock is released between pages.
+SCAN_PAGE_SIZE = 500
+
+
+def _prefix_upper_bound(prefix: str) -> Optional[str]:
+    """
+    Smallest string greater than every string starting with prefix.
+
+    Returns None when no such bound exists (prefix is all U+10FFFF), in which
+    case every key >= prefix matches.
+    """
+    stripped = prefix.rstrip(chr(0x10FFFF))
+    if not stripped:
+        return None
+    return stripped[:-1] + chr(ord(stripped[-1]) + 1)
+
 
 class KVStore:
     """
@@ -49,12 +78,21 @@ class KVStore:
         Initialize KV store with SQLite backend.
 
         Args:
-            db_path: Path to SQLite database file
+            db_path: Path to SQLite database file, or ":memory:" for a
+                RAM-only store (no file, no fsync; lost on close)
 
-        NASA Rule 10: 11 LOC (<=60)
+        NASA Rule 10: 17 LOC (<=60)
         """
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.in_memory = str(db_path) == IN_MEMORY_DB
+        if self.in_memory:
+            # Connections are thread-local; a plain ":memory:" connection
+            # would give each thread its own empty database. A named
+            # shared-cache URI makes them all see the same one.
+            self._db_uri = f"file:kvstore-{uuid.uuid4().hex}?mode=memory&cache=shared"
+        else:
+            self._db_uri = None
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         self._lock = threading.RLock()
         self._local = threading.local()
@@ -64,12 +102,17 @@ class KVStore:
         """
         Get or create thread-local database connection.
 
-        NASA Rule 10: 10 LOC (<=60)
+        NASA Rule 10: 22 LOC (<=60)
         """
         if not hasattr(self._local, "conn") or self._local.conn is None:
-            self._local.conn = sqlite3.connect(
-                str(self.db_path), check_same_thread=False, timeout=30.0
-            )
+            if self._db_uri:
+                self._local.conn = sqlite3.connect(
+                    self._db_uri, uri=True, check_same_thread=False, timeout=30.0
+                )
+            else:
+                self._local.conn = sqlite3.connect(
+                    str(self.db_path), check_same_thread=False, timeout=30.0
+                )
             self._local.conn.row_factory = sqlite3.Row
             # WAL: the capture hooks open/close this file on every tool call
             # while the long-lived MCP server holds it open. WAL lets readers
@@ -79,6 +122,8 @@ class KVStore:
                 self._local.conn.execute("PRAGMA journal_mode=WAL")
             except sqlite3.Error:
                 pass  # WAL unavailable (e.g. :memory:) -- rollback journal is fine
+            for pragma in _CONNECTION_PRAGMAS:
+                self._local.conn.execute(pragma)
         return self._local.conn
 
     @contextmanager
@@ -288,6 +333,60 @@ class KVStore:
             logger.error(f"KV set failed for key '{key}': {e}")
             return False
 
+    def set_many(
+        self, pairs: Iterable[Tuple[str, Any]], ttl: Optional[int] = None
+    ) -> bool:
+        """
+        Set many key-value pairs in a single transaction.
+
+        One BEGIN/COMMIT and one prepared statement for the whole batch,
+        instead of a transaction per set() call.
+
+        Args:
+            pairs: Iterable of (key, value) tuples (dict/list values are
+                JSON-serialized, as in set())
+            ttl: Time-to-live in seconds applied to every pair (None = never)
+
+        Returns:
+            True if all pairs were written, False otherwise (nothing written)
+
+        NASA Rule 10: 33 LOC (<=60)
+        """
+        now = datetime.now().isoformat()
+        expires_at = None
+        if ttl is not None:
+            expires_at = (datetime.now() + timedelta(seconds=ttl)).isoformat()
+
+        rows = [
+            (
+                key,
+                json.dumps(value) if isinstance(value, (dict, list)) else value,
+                now,
+                now,
+                expires_at,
+            )
+            for key, value in pairs
+        ]
+
+        try:
+            with self._transaction() as cursor:
+                cursor.executemany(
+                    """
+                    INSERT INTO kv_store (key, value, created_at, updated_at, expires_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(key) DO UPDATE SET
+                        value = excluded.value,
+                        updated_at = excluded.updated_at,
+                        expires_at = excluded.expires_at
+                """,
+                    rows,
+                )
+            return True
+
+        except sqlite3.Error as e:
+            logger.error(f"KV set_many failed for {len(rows)} keys: {e}")
+            return False
+
     def delete(self, key: str) -> bool:
         """
         Delete key-value pair.
@@ -309,6 +408,22 @@ class KVStore:
             logger.error(f"KV delete failed for key '{key}': {e}")
             return False
 
+    @staticmethod
+    def _prefix_clause(prefix: str) -> Tuple[str, Tuple[str, ...]]:
+        """
+        WHERE clause and params selecting keys that start with prefix.
+
+        Half-open range [prefix, upper) is an index range scan on the key
+        PRIMARY KEY index. LIKE cannot use it under the default BINARY
+        collation and would also treat % and _ inside the prefix as wildcards.
+        """
+        if not prefix:
+            return "1", ()
+        upper = _prefix_upper_bound(prefix)
+        if upper is None:
+            return "key >= ?", (prefix,)
+        return "key >= ? AND key < ?", (prefix, upper)
+
     def keys(self, prefix: str = "") -> List[str]:
         """
         List all keys with optional prefix filter.
@@ -319,24 +434,97 @@ class KVStore:
         Returns:
             List of matching keys
 
-        NASA Rule 10: 22 LOC (<=60)
+        NASA Rule 10: 12 LOC (<=60)
         """
+        where, params = self._prefix_clause(prefix)
         try:
             with self._transaction() as cursor:
-                if prefix:
-                    cursor.execute(
-                        "SELECT key FROM kv_store WHERE key LIKE ? ORDER BY key",
-                        (f"{prefix}%",),
-                    )
-                else:
-                    cursor.execute("SELECT key FROM kv_store ORDER BY key")
-
+                cursor.execute(
+                    f"SELECT key FROM kv_store WHERE {where} ORDER BY key", params
+                )
                 return [row["key"] for row in cursor.fetchall()]
 
         except sqlite3.Error as e:
             logger.error(f"KV list_keys failed: {e}")
             return []
 
+    def scan_items(
+        self, prefix: str = "", suffix: str = "", page_size: int = SCAN_PAGE_SIZE
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Iterate unexpired (key, value) pairs in key order, one page at a time.
+
+        Pages are read with keyset pagination (key > last key seen), each in
+        its own short transaction, so a large keyspace is neither loaded at
+        once nor holds the store lock for the whole scan.
+
+        Args:
+            prefix: Key prefix filter (e.g., "archived:") (optional)
+            suffix: Only keys ending with this (e.g., ":metadata") (optional)
+            page_size: Rows fetched per page
+
+        Yields:
+            (key, value) tuples ordered by key
+
+        NASA Rule 10: 27 LOC (<=60)
+        """
+        where, params = self._prefix_clause(prefix)
+        if suffix:
+            where += " AND substr(key, -?) = ?"
+            params += (len(suffix), suffix)
+        where += " AND (expires_at IS NULL OR expires_at > ?)"
+        params += (datetime.now().isoformat(),)
+
+        last_key = None
+        while True:
+            page_where, page_params = where, params
+            if last_key is not None:
+                page_where += " AND key > ?"
+                page_params += (last_key,)
+            try:
+                with self._transaction() as cursor:
+                    cursor.execute(
+                        f"SELECT key, value FROM kv_store WHERE {page_where} "
+                        "ORDER BY key LIMIT ?",
+                        page_params + (page_size,),
+                    )
+                    rows = [(row["key"], row["value"]) for row in cursor.fetchall()]
+            except sqlite3.Error as e:
+                logger.error(f"KV scan_items failed: {e}")
+                return
+            yield from rows
+            if len(rows) < page_size:
+                return
+            last_key = rows[-1][0]
+
+    def count_keys(self, prefix: str = "", exclude_suffix: str = "") -> int:
+        """
+        Count keys with optional prefix filter, counted inside SQLite.
+
+        Args:
+            prefix: Key prefix filter (e.g., "archived:") (optional)
+            exclude_suffix: Skip keys ending with this (e.g., ":metadata")
+
+        Returns:
+            Number of matching keys
+
+        NASA Rule 10: 17 LOC (<=60)
+        """
+        where, params = self._prefix_clause(prefix)
+        if exclude_suffix:
+            where += " AND substr(key, -?) != ?"
+            params += (len(exclude_suffix), exclude_suffix)
+        try:
+            with self._transaction() as cursor:
+                cursor.execute(
+                    f"SELECT COUNT(*) AS count FROM kv_store WHERE {where}", params
+                )
+                return int(cursor.fetchone()["count"])
+
+        except sqlite3.Error as e:
+            logger.error(f"KV count_keys failed: {e}")
+            return 0
+
     def list_keys(self, prefix: str = "") -> List[str]:
         """Backwards-compatible alias for keys()."""
         return self.keys(prefix)
@@ -422,9 +610,21 @@ class KVStore:
         Returns:
             True if stored successfully
         """
+        return self.store_observations([obs_dict])
+
+    def store_observations(self, obs_dicts: Iterable[Dict[str, Any]]) -> bool:
+        """Store many observations in a single transaction.
+
+        Args:
+            obs_dicts: Observation.to_dict() outputs
+
+        Returns:
+            True if all were stored, False otherwise (nothing stored)
+        """
+        rows = [self._observation_row(obs) for obs in obs_dicts]
         try:
             with self._transaction() as cursor:
-                cursor.execute(
+                cursor.executemany(
                     """
                     INSERT OR REPLACE INTO observations
                     (observation_id, session_id, obs_type, concept,
@@ -432,26 +632,31 @@ class KVStore:
                      why, entities, created_at)
                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                    (
-                        obs_dict["observation_id"],
-                        obs_dict["session_id"],
-                        obs_dict["obs_type"],
-                        obs_dict["concept"],
-                        obs_dict["tool_name"],
-                        obs_dict["content"],
-                        json.dumps(obs_dict.get("metadata", {})),
-                        obs_dict.get("who", "auto-capture:1.0.0"),
-                        obs_dict.get("project", ""),
-                        obs_dict.get("why", "observation"),
-                        json.dumps(obs_dict.get("entities", [])),
-                        obs_dict.get("created_at", datetime.now().isoformat()),
-                    ),
+                    rows,
                 )
             return True
         except sqlite3.Error as e:
-            logger.error(f"store_observation failed: {e}")
+            logger.error(f"store_observations failed for {len(rows)} rows: {e}")
             return False
 
+    @staticmethod
+    def _observation_row(obs_dict: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Column values of one observation, in INSERT order."""
+        return (
+            obs_dict["observation_id"],
+            obs_dict["session_id"],
+            obs_dict["obs_type"],
+            obs_dict["concept"],
+            obs_dict["tool_name"],
+            obs_dict["content"],
+            json.dumps(obs_dict.get("metadata", {})),
+            obs_dict.get("who", "auto-capture:1.0.0"),
+            obs_dict.get("project", ""),
+            obs_dict.get("why", "observation"),
+            json.dumps(obs_dict.get("entities", [])),
+            obs_dict.get("created_at", datetime.now().isoformat()),
+        )
+
     def get_observations(
         self,
         session_id: Optional[str] = None,
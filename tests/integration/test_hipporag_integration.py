@@ -408,8 +408,8 @@ class TestRetrievalQuality:
         # Multi-word phrase normalizes to a single node id.
         assert "united_states" in hippo._match_query_tokens_to_nodes("United States")
         # No graph match and empty query -> empty list.
-        assert hippo._match_query_tokens_to_nodes("Nonexistent Thing") == []
-        assert hippo._match_query_tokens_to_nodes("") == []
+        assert hippo._match_query_tokens_to_nodes("Nonexistent Thing") == ()
+        assert hippo._match_query_tokens_to_nodes("") == ()
 
     def test_ranking_quality(self, integrated_system):
         """Test results are ranked by relevance."""
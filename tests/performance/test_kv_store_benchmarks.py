@@ -0,0 +1,114 @@
+"""
+Performance benchmarks for the KV store (Tier 1) hot paths.
+
+Pins the WAL/pragma, prefix range scan and executemany batching changes to
+measured budgets. Uses pytest-benchmark pedantic mode so each round measures
+only the hot call, with fixtures/setup kept out of the timed region.
+
+Run:
+    pytest tests/performance/test_kv_store_benchmarks.py --benchmark-only \
+        --benchmark-min-rounds=25 --benchmark-disable-gc
+
+NASA Rule 10 Compliant: All functions ≤60 LOC
+"""
+
+import os
+import pytest
+
+from src.stores.kv_store import KVStore
+
+# Absolute latency numbers are hardware-dependent and flake on shared CI
+# runners. Local performance benchmarks, not a CI correctness gate.
+pytestmark = pytest.mark.skipif(
+    os.getenv("CI") is not None,
+    reason="hardware-dependent performance benchmark; not a CI correctness gate",
+)
+
+PRELOADED_ROWS = 10_000
+BATCH_ROWS = 1_000
+ROUNDS = 25
+WARMUP_ROUNDS = 5
+
+
+def _rows(count: int, prefix: str = "key"):
+    """Build (key, value) pairs spread over 10 key prefixes."""
+    return [(f"{prefix}{i % 10}:{i:06d}", f"value-{i}") for i in range(count)]
+
+
+@pytest.fixture(scope="module")
+def preloaded_store():
+    """In-memory store preloaded with PRELOADED_ROWS keys."""
+    store = KVStore(":memory:")
+    store.set_many(_rows(PRELOADED_ROWS))
+    yield store
+    store.close()
+
+
+def test_kv_set_benchmark(benchmark):
+    """Single-row upsert latency."""
+    store = KVStore(":memory:")
+    try:
+        result = benchmark.pedantic(
+            store.set,
+            args=("coding_style", "functional"),
+            iterations=1000,
+            rounds=ROUNDS,
+            warmup_rounds=WARMUP_ROUNDS,
+        )
+    finally:
+        store.close()
+
+    assert result is True
+    assert benchmark.stats["mean"] < 0.002  # <2ms write target
+
+
+def test_kv_get_benchmark(benchmark, preloaded_store):
+    """Primary-key lookup latency on a 10k-row store."""
+    result = benchmark.pedantic(
+        preloaded_store.get,
+        args=("key5:000005",),
+        iterations=1000,
+        rounds=ROUNDS,
+        warmup_rounds=WARMUP_ROUNDS,
+    )
+
+    assert result == "value-5"
+    assert benchmark.stats["mean"] < 0.001  # <1ms lookup target
+
+
+def test_kv_list_keys_prefix_benchmark(benchmark, preloaded_store):
+    """Prefix listing (index range scan) on a 10k-row store."""
+    result = benchmark.pedantic(
+        preloaded_store.list_keys,
+        kwargs={"prefix": "key3:"},
+        iterations=10,
+        rounds=ROUNDS,
+        warmup_rounds=WARMUP_ROUNDS,
+    )
+
+    assert len(result) == PRELOADED_ROWS // 10
+
+
+def test_kv_set_many_benchmark(benchmark):
+    """Batched upsert of BATCH_ROWS rows into a fresh 10k-row store."""
+    stores = []
+    batch = _rows(BATCH_ROWS, prefix="batch")
+
+    def setup():
+        # Fresh DB per round so every round inserts rather than updates.
+        store = KVStore(":memory:")
+        store.set_many(_rows(PRELOADED_ROWS))
+        stores.append(store)
+        return (store, batch), {}
+
+    try:
+        benchmark.pedantic(
+            lambda store, pairs: store.set_many(pairs),
+            setup=setup,
+            rounds=ROUNDS,
+            warmup_rounds=WARMUP_ROUNDS,
+        )
+        assert stores[-1].count() == PRELOADED_ROWS + BATCH_ROWS
+    finally:
+        for store in stores:
+            store.close()
@@ -0,0 +1,43 @@
+"""
+Lightweight test doubles shared by unit tests.
+
+FakeEntityService stands in for the spaCy-backed EntityService in tests
+that only need *some* deterministic entity extractor (normalization, node
+matching, retrieval plumbing, error handling). Tests that validate NER
+semantics keep using the real EntityService.
+
+FakeGraphQueryEngine stands in for GraphQueryEngine where tests stub PPR /
+multi-hop results themselves; every method returns an empty result.
+"""
+
+import re
+from typing import Any, Dict, List, Tuple
+
+_CAPITALIZED_RE = re.compile(r"\b[A-Z][A-Za-z]+\b")
+_STOPWORDS = frozenset({"A", "An", "The", "What", "Who", "Which", "Where", "When"})
+
+
+class FakeEntityService:
+    """Deterministic regex extractor: capitalized tokens become ORG entities."""
+
+    def extract_entities(self, text: str) -> List[Dict[str, Any]]:
+        if not text or not text.strip():
+            return []
+        return [
+            {"text": m.group(), "type": "ORG", "start": m.start(), "end": m.end()}
+            for m in _CAPITALIZED_RE.finditer(text)
+            if m.group() not in _STOPWORDS
+        ]
+
+
+class FakeGraphQueryEngine:
+    """GraphQueryEngine double: empty PPR scores, hops and rankings."""
+
+    def personalized_pagerank(self, *args: Any, **kwargs: Any) -> Dict[str, float]:
+        return {}
+
+    def multi_hop_search(self, *args: Any, **kwargs: Any) -> Dict[str, List[Any]]:
+        return {"entities": [], "paths": []}
+
+    def rank_chunks_by_ppr(self, *args: Any, **kwargs: Any) -> List[Tuple[str, float]]:
+        return []
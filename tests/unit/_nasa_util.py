@@ -0,0 +1,54 @@
+"""
+NASA Rule 10 (function length) checks shared by unit tests.
+
+Each source file (or class) is read and parsed once per test session,
+however many tests check it.
+"""
+
+import ast
+import functools
+import inspect
+import textwrap
+from pathlib import Path
+from typing import Dict
+
+NASA_RULE_10_MAX_LOC = 60
+
+
+@functools.lru_cache(maxsize=None)
+def parse_file(path: str) -> ast.Module:
+    """Parse a source file (cached by path)."""
+    return ast.parse(Path(path).read_text(encoding="utf-8"))
+
+
+def check_rule10(path: str, limit: int = NASA_RULE_10_MAX_LOC) -> None:
+    """Assert every function/method in path spans at most limit lines."""
+    for node in ast.walk(parse_file(path)):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            func_lines = node.end_lineno - node.lineno + 1
+            assert (
+                func_lines <= limit
+            ), f"{node.name} exceeds {limit} LOC ({func_lines})"
+
+
+@functools.lru_cache(maxsize=None)
+def method_loc(cls: type) -> Dict[str, int]:
+    """Line count of every function defined in cls's own source (cached).
+
+    Nested functions sharing a name report the longest one.
+    """
+    tree = ast.parse(textwrap.dedent(inspect.getsource(cls)))
+    lengths: Dict[str, int] = {}
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            length = node.end_lineno - node.lineno + 1
+            lengths[node.name] = max(length, lengths.get(node.name, 0))
+    return lengths
+
+
+def check_class_rule10(cls: type, limit: int = NASA_RULE_10_MAX_LOC) -> None:
+    """Assert every method in cls's own source spans at most limit lines."""
+    for name, length in method_loc(cls).items():
+        assert length <= limit, (
+            f"Method {name} has {length} LOC " f"(violates NASA Rule 10: <={limit} LOC)"
+        )
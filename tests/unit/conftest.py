@@ -5,6 +5,8 @@ Test configuration for unit tests.
 import sys
 import types
 
+import pytest
+
 # Mock spacy before any src imports that transitively depend on it.
 # spacy is an optional heavy dependency not installed in CI.
 if "spacy" not in sys.modules:
@@ -24,3 +26,11 @@ if "spacy" not in sys.modules:
         m = types.ModuleType(submod)
         m.__spec__ = importlib.machinery.ModuleSpec(submod, None)
         sys.modules[submod] = m
+
+
+@pytest.fixture(scope="session")
+def detector():
+    """Shared ModeDetector; it holds no per-query state."""
+    from src.modes.mode_detector import ModeDetector
+
+    return ModeDetector()
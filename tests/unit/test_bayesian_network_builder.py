@@ -10,6 +10,7 @@ import pytest
 import networkx as nx
 from src.bayesian.network_builder import NetworkBuilder
 from pgmpy.models import BayesianNetwork
+from tests.unit._nasa_util import check_rule10
 
 
 class TestNetworkBuilder:
@@ -253,12 +254,4 @@ class TestNetworkBuilder:
 # NASA Rule 10 Compliance Check
 def test_nasa_rule_10_compliance():
     """Verify all NetworkBuilder methods are ≤60 LOC."""
-    import ast
-
-    with open("src/bayesian/network_builder.py", "r", encoding="utf-8") as f:
-        tree = ast.parse(f.read())
-
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            func_lines = node.end_lineno - node.lineno + 1
-            assert func_lines <= 60, f"{node.name} exceeds 60 LOC ({func_lines})"
+    check_rule10("src/bayesian/network_builder.py")
@@ -1,22 +1,51 @@
-"""F9: vectorized pairwise cosine must match the per-pair calculation exactly."""
+"""F9: vectorized candidate pairs must match the per-pair calculation exactly."""
 import numpy as np
 
 from src.memory.consolidation import ConsolidationMixin
 
 
-def test_pairwise_matches_per_pair():
+def _reference_cosine(embs) -> np.ndarray:
+    """Plain NumPy N x N cosine matrix (no blocking) as a test oracle."""
+    E = np.asarray(embs, dtype=float)
+    En = E / np.linalg.norm(E, axis=1)[:, None]
+    return En @ En.T
+
+
+def test_candidate_pairs_match_per_pair():
     rng = np.random.default_rng(0)
     embs = rng.normal(size=(6, 8)).tolist()
     c = ConsolidationMixin.__new__(ConsolidationMixin)
-    m = ConsolidationMixin._pairwise_cosine(embs)
-    for i in range(len(embs)):
-        for j in range(len(embs)):
-            expected = c._calculate_similarity(embs[i], embs[j])
-            assert abs(float(m[i, j]) - expected) < 1e-9
+    # Cosine is >= -1, so this threshold keeps every i < j pair
+    pairs = ConsolidationMixin._candidate_pairs(embs, -1.0)
+    assert [(i, j) for i, j, _ in pairs] == [
+        (i, j) for i in range(6) for j in range(i + 1, 6)
+    ]
+    for i, j, sim in pairs:
+        assert abs(sim - c._calculate_similarity(embs[i], embs[j])) < 1e-9
 
 
 def test_zero_norm_row_is_zero_similarity():
     embs = [[0.0, 0.0, 0.0], [1.0, 2.0, 3.0]]
-    m = ConsolidationMixin._pairwise_cosine(embs)
-    assert float(m[0, 1]) == 0.0
-    assert float(m[1, 0]) == 0.0
+    pairs = ConsolidationMixin._candidate_pairs(embs, 0.0)
+    assert pairs == [(0, 1, 0.0)]
+
+
+def test_candidate_pairs_upper_triangle_row_major():
+    embs = [[1.0, 0.0], [1.0, 0.0], [0.0, 1.0], [1.0, 0.01]]
+    pairs = ConsolidationMixin._candidate_pairs(embs, 0.95)
+    assert [(i, j) for i, j, _ in pairs] == [(0, 1), (0, 3), (1, 3)]
+    assert all(sim >= 0.95 for _, _, sim in pairs)
+
+
+def test_candidate_pairs_blocked_matches_full_matrix():
+    rng = np.random.default_rng(1)
+    embs = rng.normal(size=(50, 4))
+    full = _reference_cosine(embs)
+    expected = [
+        (i, j) for i in range(50) for j in range(i + 1, 50) if full[i, j] >= 0.5
+    ]
+    for block_rows in (1, 7, 50, 64):
+        pairs = ConsolidationMixin._candidate_pairs(embs, 0.5, block_rows)
+        assert [(i, j) for i, j, _ in pairs] == expected
+        for i, j, sim in pairs:
+            assert abs(sim - full[i, j]) < 1e-9
@@ -52,6 +52,13 @@ class TestInitialization:
         service = EntityService(model_name="en_core_web_sm")
         assert service.nlp is not None
 
+    @pytest.mark.skipif(not HAS_SPACY, reason="spaCy model not available")
+    def test_initialization_ner_only_pipeline(self):
+        """Test disabled components are dropped while NER is kept."""
+        service = EntityService(spacy_disable=EntityService.NER_ONLY_DISABLE)
+        assert "ner" in service.nlp.pipe_names
+        assert "parser" not in service.nlp.pipe_names
+
 
 class TestExtractEntities:
     """Test suite for extracting entities."""
@@ -276,6 +283,40 @@ class TestDeduplicateEntities:
         assert deduplicated == []
 
 
+class TestExtractCache:
+    """Test suite for memoized entity extraction."""
+
+    def test_repeat_extraction_hits_cache(self, entity_service):
+        """Test repeated text is served from the cache."""
+        text = "Barack Obama lives in Washington."
+
+        first = entity_service.extract_entities(text)
+        second = entity_service.extract_entities(text)
+
+        assert first == second
+        assert entity_service._extract_cached.cache_info().hits == 1
+
+    def test_mutating_result_does_not_poison_cache(self, entity_service):
+        """Test callers get copies, not the cached entity dicts."""
+        text = "Barack Obama lives in Washington."
+
+        first = entity_service.extract_entities(text)
+        expected = [dict(ent) for ent in first]
+        for ent in first:
+            ent["type"] = "MUTATED"
+        first.clear()
+
+        assert entity_service.extract_entities(text) == expected
+
+    def test_replacing_model_clears_cache(self, entity_service):
+        """Test assigning a new pipeline invalidates cached results."""
+        entity_service.extract_entities("Barack Obama lives in Washington.")
+
+        entity_service.nlp = entity_service.nlp
+
+        assert entity_service._extract_cached.cache_info().currsize == 0
+
+
 class TestBatchExtract:
     """Test suite for batch entity extraction."""
 
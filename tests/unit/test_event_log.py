@@ -11,6 +11,7 @@ import tempfile
 import os
 from datetime import datetime, timedelta
 from src.stores.event_log import EventLog, EventType
+from tests.unit._nasa_util import check_rule10
 
 
 class TestEventLog:
@@ -133,12 +134,4 @@ class TestEventLog:
 # NASA Rule 10 Compliance Check
 def test_nasa_rule_10_compliance():
     """Verify all EventLog methods are ≤60 LOC."""
-    import ast
-
-    with open("src/stores/event_log.py", "r", encoding="utf-8") as f:
-        tree = ast.parse(f.read())
-
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            func_lines = node.end_lineno - node.lineno + 1
-            assert func_lines <= 60, f"{node.name} exceeds 60 LOC ({func_lines})"
+    check_rule10("src/stores/event_log.py")
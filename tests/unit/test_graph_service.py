@@ -388,6 +388,23 @@ class TestNodeOperations:
 
         assert count == 6
 
+    def test_has_node(self, populated_graph):
+        """Test node existence check tracks removals."""
+        assert populated_graph.has_node("obama") is True
+        assert populated_graph.has_node("nonexistent") is False
+
+        populated_graph.remove_node("obama")
+        assert populated_graph.has_node("obama") is False
+
+    def test_reset_clears_graph(self, populated_graph):
+        """Test reset empties nodes and edges for every component."""
+        populated_graph.reset()
+
+        assert populated_graph.get_node_count() == 0
+        assert populated_graph.get_edge_count() == 0
+        assert populated_graph.add_entity_node("tesla", "ORG") is True
+        assert populated_graph.has_node("tesla") is True
+
     def test_get_edge_count(self, populated_graph):
         """Test getting edge count."""
         count = populated_graph.get_edge_count()
@@ -8,7 +8,9 @@ Target: 7 tests, ~70 LOC
 
 import pytest
 from datetime import datetime, timedelta
+from src.lifecycle import hotcold_classifier
 from src.lifecycle.hotcold_classifier import HotColdClassifier, LifecycleStage
+from tests.unit._nasa_util import check_rule10
 
 
 class TestHotColdClassifier:
@@ -33,6 +35,7 @@ class TestHotColdClassifier:
             created_at=now - timedelta(days=3),
             last_accessed=now,
             access_count=10,
+            now=now,
         )
 
         assert stage == LifecycleStage.ACTIVE
@@ -45,6 +48,7 @@ class TestHotColdClassifier:
             created_at=now - timedelta(days=15),
             last_accessed=now - timedelta(days=5),
             access_count=2,
+            now=now,
         )
 
         assert stage == LifecycleStage.DEMOTED
@@ -57,6 +61,7 @@ class TestHotColdClassifier:
             created_at=now - timedelta(days=60),
             last_accessed=now - timedelta(days=30),
             access_count=1,
+            now=now,
         )
 
         assert stage == LifecycleStage.ARCHIVED
@@ -79,12 +84,63 @@ class TestHotColdClassifier:
             },
         ]
 
-        classifications = classifier.classify_batch(chunks)
+        classifications = classifier.classify_batch(chunks, now=now)
 
         assert len(classifications) == 2
         assert classifications["chunk-1"] == LifecycleStage.ACTIVE
         assert classifications["chunk-2"] == LifecycleStage.DEMOTED
 
+    def test_classify_batch_matches_classify_chunk(self, classifier):
+        """Test vectorized batch agrees with the scalar path on edge cases."""
+        now = datetime.now()
+        chunks = [
+            {
+                "chunk_id": f"chunk-{age}-{count}",
+                "created_at": now - timedelta(days=age, hours=1),
+                "last_accessed": now,
+                "access_count": count,
+            }
+            for age in (0, 6, 7, 29, 30, 31, 90)
+            for count in (0, 1, 3, 5, 20)
+        ]
+
+        classifications = classifier.classify_batch(chunks, now=now)
+
+        for chunk in chunks:
+            assert classifications[chunk["chunk_id"]] == classifier.classify_chunk(
+                **chunk, now=now
+            ), chunk["chunk_id"]
+
+    def test_classify_batch_reads_clock_once(self, classifier, monkeypatch):
+        """Test one datetime.now() call serves the whole batch."""
+        calls = []
+        real_now = datetime.now()
+
+        class CountingDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                calls.append(tz)
+                return real_now
+
+        monkeypatch.setattr(hotcold_classifier, "datetime", CountingDatetime)
+        chunks = [
+            {
+                "chunk_id": f"chunk-{i}",
+                "created_at": real_now - timedelta(days=i),
+                "last_accessed": real_now,
+                "access_count": i,
+            }
+            for i in range(50)
+        ]
+
+        classifier.classify_batch(chunks)
+
+        assert len(calls) == 1
+
+    def test_classify_batch_empty(self, classifier):
+        """Test batch classification of no chunks."""
+        assert classifier.classify_batch([]) == {}
+
     def test_get_indexing_strategy_active(self, classifier):
         """Test indexing strategy for active chunks."""
         strategy = classifier.get_indexing_strategy(LifecycleStage.ACTIVE)
@@ -114,12 +170,4 @@ class TestHotColdClassifier:
 # NASA Rule 10 Compliance Check
 def test_nasa_rule_10_compliance():
     """Verify all HotColdClassifier methods are ≤60 LOC."""
-    import ast
-
-    with open("src/lifecycle/hotcold_classifier.py", "r", encoding="utf-8") as f:
-        tree = ast.parse(f.read())
-
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            func_lines = node.end_lineno - node.lineno + 1
-            assert func_lines <= 60, f"{node.name} exceeds 60 LOC ({func_lines})"
+    check_rule10("src/lifecycle/hotcold_classifier.py")
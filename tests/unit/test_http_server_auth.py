@@ -1,12 +1,34 @@
 """Auth regression tests for Memory MCP HTTP tool routes."""
 
 import importlib
-import sys
 from types import SimpleNamespace
 
 import pytest
 
 
+@pytest.fixture(scope="module")
+def http_server():
+    """Import the HTTP server module once per test module.
+
+    Importing it registers every FastAPI route, so tests that only need
+    different auth settings patch the module-level values via _configure()
+    instead of re-executing the module.
+    """
+    return importlib.import_module("src.mcp.http_server")
+
+
+def _configure(
+    monkeypatch: pytest.MonkeyPatch,
+    module,
+    *,
+    key: str = "",
+    allow_unauthenticated: bool = False,
+):
+    monkeypatch.setattr(module, "MCP_API_KEY", key)
+    monkeypatch.setattr(module, "ALLOW_UNAUTHENTICATED_TOOLS", allow_unauthenticated)
+    return module
+
+
 def _reload_http_server(
     monkeypatch: pytest.MonkeyPatch,
     *,
@@ -14,6 +36,7 @@ def _reload_http_server(
     alias: bool = False,
     allow_unauthenticated: bool = False,
 ):
+    """Re-execute the module so its import-time env resolution runs again."""
     monkeypatch.delenv("MCP_API_KEY", raising=False)
     monkeypatch.delenv("MEMORY_MCP_API_KEY", raising=False)
     monkeypatch.delenv("MEMORY_MCP_ALLOW_UNAUTHENTICATED_TOOLS", raising=False)
@@ -24,13 +47,13 @@ def _reload_http_server(
         env_name = "MEMORY_MCP_API_KEY" if alias else "MCP_API_KEY"
         monkeypatch.setenv(env_name, key)
 
-    sys.modules.pop("src.mcp.http_server", None)
-    module = importlib.import_module("src.mcp.http_server")
-    return importlib.reload(module)
+    return importlib.reload(importlib.import_module("src.mcp.http_server"))
 
 
-def test_tool_auth_fails_closed_without_api_key(monkeypatch: pytest.MonkeyPatch):
-    module = _reload_http_server(monkeypatch, key=None)
+def test_tool_auth_fails_closed_without_api_key(
+    monkeypatch: pytest.MonkeyPatch, http_server
+):
+    module = _configure(monkeypatch, http_server)
 
     assert not module._is_authorized_tool_request("")
     assert not module._is_authorized_tool_request("anything")
@@ -42,25 +65,24 @@ def test_tool_auth_can_be_explicitly_disabled(monkeypatch: pytest.MonkeyPatch):
     assert module._is_authorized_tool_request("")
 
 
-def test_http_bind_host_defaults_to_loopback(monkeypatch: pytest.MonkeyPatch):
-    module = _reload_http_server(monkeypatch, key=None)
+def test_http_bind_host_defaults_to_loopback(
+    monkeypatch: pytest.MonkeyPatch, http_server
+):
+    monkeypatch.delenv("MEMORY_MCP_HTTP_HOST", raising=False)
 
-    assert module._get_http_bind_host() == "127.0.0.1"
+    assert http_server._get_http_bind_host() == "127.0.0.1"
 
 
-def test_http_bind_host_can_be_explicitly_overridden(monkeypatch: pytest.MonkeyPatch):
-    module = _reload_http_server(monkeypatch, key=None)
+def test_http_bind_host_can_be_explicitly_overridden(
+    monkeypatch: pytest.MonkeyPatch, http_server
+):
     monkeypatch.setenv("MEMORY_MCP_HTTP_HOST", "0.0.0.0")
 
-    assert module._get_http_bind_host() == "0.0.0.0"
+    assert http_server._get_http_bind_host() == "0.0.0.0"
 
 
-def test_http_metadata_normalization_drops_uppercase_aliases(
-    monkeypatch: pytest.MonkeyPatch,
-):
-    module = _reload_http_server(monkeypatch, key="test-key")
-
-    metadata = module._normalize_metadata(
+def test_http_metadata_normalization_drops_uppercase_aliases(http_server):
+    metadata = http_server._normalize_metadata(
         {
             "WHO": "codex",
             "WHEN": "2026-06-15T12:00:00Z",
@@ -85,8 +107,8 @@ def test_tool_auth_uses_primary_or_alias_env(monkeypatch: pytest.MonkeyPatch):
     assert module.MCP_API_KEY == "alias-key"
 
 
-def test_extract_tool_api_key_prefers_explicit_header(monkeypatch: pytest.MonkeyPatch):
-    module = _reload_http_server(monkeypatch, key="test-key")
+def test_extract_tool_api_key_prefers_explicit_header(http_server):
+    module = http_server
     bearer = SimpleNamespace(credentials="bearer-key")
 
     assert module._extract_tool_api_key(bearer, "header-key") == "header-key"
@@ -96,9 +118,9 @@ def test_extract_tool_api_key_prefers_explicit_header(monkeypatch: pytest.Monkey
 
 @pytest.mark.asyncio
 async def test_require_tool_api_key_rejects_missing_or_wrong_token(
-    monkeypatch: pytest.MonkeyPatch,
+    monkeypatch: pytest.MonkeyPatch, http_server
 ):
-    module = _reload_http_server(monkeypatch, key="test-key")
+    module = _configure(monkeypatch, http_server, key="test-key")
 
     with pytest.raises(module.HTTPException) as missing_exc:
         await module.require_tool_api_key(None, None)
@@ -112,9 +134,9 @@ async def test_require_tool_api_key_rejects_missing_or_wrong_token(
 
 @pytest.mark.asyncio
 async def test_require_tool_api_key_accepts_matching_token(
-    monkeypatch: pytest.MonkeyPatch,
+    monkeypatch: pytest.MonkeyPatch, http_server
 ):
-    module = _reload_http_server(monkeypatch, key="test-key")
+    module = _configure(monkeypatch, http_server, key="test-key")
 
     bearer = SimpleNamespace(credentials="test-key")
     await module.require_tool_api_key(bearer, None)
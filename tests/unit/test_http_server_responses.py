@@ -0,0 +1,62 @@
+"""Response serialization and route side-effect tests for Memory MCP HTTP."""
+
+import asyncio
+import importlib
+import json
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from src.services import entity_service
+
+
+@pytest.fixture(scope="module")
+def http_server():
+    """Import the HTTP server module once per test module."""
+    return importlib.import_module("src.mcp.http_server")
+
+
+def test_app_renders_responses_with_orjson(http_server):
+    assert http_server.app.router.default_response_class is (
+        http_server._ORJSONResponse
+    )
+
+
+def test_orjson_response_matches_stdlib_json(http_server):
+    content = {
+        "results": [{"text": "ünïcode", "score": 0.5, "metadata": {"tier": 1}}],
+        "count": 1,
+        "ok": True,
+        "missing": None,
+    }
+
+    body = http_server._ORJSONResponse(content).body
+
+    assert json.loads(body) == content
+
+
+def test_orjson_response_handles_int_keys_and_numpy(http_server):
+    content = {1: "one", "scores": np.array([0.5, 0.25]), "n": np.int64(3)}
+
+    body = http_server._ORJSONResponse(content).body
+
+    assert json.loads(body) == {"1": "one", "scores": [0.5, 0.25], "n": 3}
+
+
+def test_consolidate_entities_clears_search_cache(http_server, monkeypatch):
+    graph_service = Mock(graph=object())
+    processor = Mock()
+    consolidator = Mock()
+    consolidator.consolidate_all.return_value = {"merged": 1}
+    monkeypatch.setattr(http_server, "get_graph_service", lambda: graph_service)
+    monkeypatch.setattr(http_server, "_nexus_processor", processor)
+    monkeypatch.setattr(
+        entity_service, "EntityConsolidator", lambda **kwargs: consolidator
+    )
+
+    result = asyncio.run(http_server.consolidate_entities())
+
+    assert result == {"merged": 1}
+    graph_service.save_graph.assert_called_once_with()
+    processor.clear_result_cache.assert_called_once_with()
@@ -10,10 +10,9 @@ from src.stores.kv_store import KVStore
 
 
 @pytest.fixture
-def kv_store(tmp_path):
-    """KV store instance with temporary database."""
-    db_path = tmp_path / "test_kv.db"
-    store = KVStore(str(db_path))
+def kv_store():
+    """KV store instance with in-memory database (no disk I/O)."""
+    store = KVStore(":memory:")
     yield store
     store.close()
 
@@ -28,6 +27,42 @@ def test_kv_store_initialization(tmp_path):
     store.close()
 
 
+def test_kv_store_on_disk_uses_wal_normal_sync(tmp_path):
+    """Test on-disk connections run WAL with synchronous=NORMAL."""
+    store = KVStore(str(tmp_path / "test.db"))
+    conn = store._get_connection()
+
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+    store.close()
+
+
+def test_kv_store_in_memory_creates_no_file(tmp_path, monkeypatch):
+    """Test ':memory:' store never touches the filesystem."""
+    monkeypatch.chdir(tmp_path)
+    store = KVStore(":memory:")
+    store.set("key1", "value1")
+
+    assert store.in_memory is True
+    assert store.get("key1") == "value1"
+    assert list(tmp_path.iterdir()) == []
+    store.close()
+
+
+def test_kv_store_in_memory_shared_across_threads(kv_store):
+    """Test every thread-local connection sees the same in-memory database."""
+    import threading
+
+    kv_store.set("key1", "value1")
+    seen = []
+    worker = threading.Thread(target=lambda: seen.append(kv_store.get("key1")))
+    worker.start()
+    worker.join()
+
+    assert seen == ["value1"]
+
+
 def test_kv_set_and_get(kv_store):
     """Test setting and getting values."""
     kv_store.set("key1", "value1")
@@ -75,9 +110,7 @@ def test_kv_list_keys_empty(kv_store):
 
 def test_kv_list_keys_with_data(kv_store):
     """Test listing all keys."""
-    kv_store.set("key1", "value1")
-    kv_store.set("key2", "value2")
-    kv_store.set("key3", "value3")
+    kv_store.set_many([("key1", "value1"), ("key2", "value2"), ("key3", "value3")])
 
     keys = kv_store.list_keys()
     assert sorted(keys) == ["key1", "key2", "key3"]
@@ -85,9 +118,7 @@ def test_kv_list_keys_with_data(kv_store):
 
 def test_kv_list_keys_with_prefix(kv_store):
     """Test listing keys with prefix filter."""
-    kv_store.set("user:1", "alice")
-    kv_store.set("user:2", "bob")
-    kv_store.set("session:1", "active")
+    kv_store.set_many([("user:1", "alice"), ("user:2", "bob"), ("session:1", "active")])
 
     user_keys = kv_store.list_keys(prefix="user:")
     assert sorted(user_keys) == ["user:1", "user:2"]
@@ -96,6 +127,120 @@ def test_kv_list_keys_with_prefix(kv_store):
     assert session_keys == ["session:1"]
 
 
+def test_kv_list_keys_prefix_is_literal(kv_store):
+    """Test prefix matching treats LIKE wildcards as plain characters."""
+    kv_store.set_many([("a%b:1", "x"), ("axb:1", "y"), ("a_c", "z"), ("abc", "w")])
+
+    assert kv_store.list_keys(prefix="a%") == ["a%b:1"]
+    assert kv_store.list_keys(prefix="a_") == ["a_c"]
+
+
+def test_kv_list_keys_prefix_boundaries(kv_store):
+    """Test range bounds include the prefix itself and exclude its successor."""
+    kv_store.set_many([("user", "0"), ("user:", "1"), ("user:9", "2"), ("user;", "3")])
+
+    assert kv_store.list_keys(prefix="user:") == ["user:", "user:9"]
+
+
+def explain(store, sql, params=()):
+    """Return the EXPLAIN QUERY PLAN detail lines for sql."""
+    cursor = store._get_connection().execute("EXPLAIN QUERY PLAN " + sql, params)
+    return [row[3] for row in cursor]
+
+
+def _assert_single_indexed_select(kv_store, call):
+    """Assert call() issues one SELECT, planned as an index range search."""
+    conn = kv_store._get_connection()
+    statements = []
+    conn.set_trace_callback(statements.append)
+    try:
+        call()
+    finally:
+        conn.set_trace_callback(None)
+
+    selects = [sql for sql in statements if sql.lstrip().startswith("SELECT")]
+    assert len(selects) == 1
+    plan = explain(kv_store, selects[0])
+    assert any(line.startswith("SEARCH") and "INDEX" in line for line in plan), plan
+
+
+def test_kv_list_keys_prefix_uses_index(kv_store):
+    """Test prefix listing is planned as an index range search, not a scan."""
+    _assert_single_indexed_select(kv_store, lambda: kv_store.list_keys(prefix="user:"))
+
+
+def test_kv_count_keys_prefix_uses_index(kv_store):
+    """Test prefix counting is planned as an index range search, not a scan."""
+    _assert_single_indexed_select(
+        kv_store,
+        lambda: kv_store.count_keys(prefix="user:", exclude_suffix=":metadata"),
+    )
+
+
+def test_kv_count_keys(kv_store):
+    """Test count_keys applies prefix and suffix exclusion."""
+    kv_store.set_many(
+        [
+            ("archived:c1", "s1"),
+            ("archived:c1:metadata", "{}"),
+            ("archived:c2", "s2"),
+            ("rehydratable:r1", "s3"),
+        ]
+    )
+
+    assert kv_store.count_keys() == 4
+    assert kv_store.count_keys("archived:") == 3
+    assert kv_store.count_keys("archived:", exclude_suffix=":metadata") == 2
+    assert kv_store.count_keys("missing:") == 0
+
+
+def test_kv_scan_items_pages_by_suffix(kv_store):
+    """Test scan_items walks every page and filters suffix in SQLite."""
+    kv_store.set_many(
+        [(f"archived:c{i:02d}", f"s{i}") for i in range(7)]
+        + [(f"archived:c{i:02d}:metadata", f"m{i}") for i in range(7)]
+    )
+    kv_store.set("archived:old:metadata", "gone", ttl=-1)
+
+    scanned = list(kv_store.scan_items("archived:", ":metadata", page_size=3))
+
+    assert scanned == [(f"archived:c{i:02d}:metadata", f"m{i}") for i in range(7)]
+    assert len(list(kv_store.scan_items("archived:", page_size=7))) == 14
+
+
+def test_kv_set_many_overwrites_and_serializes(kv_store):
+    """Test set_many upserts existing keys and JSON-encodes dicts."""
+    kv_store.set("key1", "old")
+
+    assert kv_store.set_many([("key1", "new"), ("cfg", {"a": 1})]) is True
+    assert kv_store.get("key1") == "new"
+    assert kv_store.get_json("cfg") == {"a": 1}
+
+
+def test_kv_store_observations_batch(kv_store):
+    """Test store_observations writes every row in one call."""
+    obs = [
+        {
+            "observation_id": f"obs-{i}",
+            "session_id": "sess-1",
+            "obs_type": "tool_use",
+            "concept": "implementation",
+            "tool_name": "Read",
+            "content": f"content-{i}",
+            "created_at": f"2026-02-0{i + 1}T10:00:00Z",
+        }
+        for i in range(3)
+    ]
+
+    assert kv_store.store_observations(obs) is True
+    results = kv_store.get_observations(session_id="sess-1")
+    assert sorted(r["content"] for r in results) == [
+        "content-0",
+        "content-1",
+        "content-2",
+    ]
+
+
 def test_kv_get_json(kv_store):
     """Test getting value as JSON dict."""
     data = {"name": "Alice", "age": 30}
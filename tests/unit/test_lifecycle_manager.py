@@ -9,10 +9,25 @@ Tests 4-stage lifecycle with rekindling:
 """
 
 import json
+import math
+import numpy as np
+import orjson
 import pytest
-from unittest.mock import Mock, patch, mock_open
+from unittest.mock import ANY, Mock, patch, mock_open
 from datetime import datetime, timedelta
-from src.memory.lifecycle_manager import MemoryLifecycleManager
+from src.memory.lifecycle_manager import (
+    MemoryLifecycleManager,
+    STAGE_STATS_TTL_SECONDS,
+)
+from src.memory.stage_transitions import UPDATE_BATCH_SIZE
+from tests.unit._nasa_util import check_class_rule10
+
+
+def _archived_metadata_json(file_path: str) -> str:
+    """Archived metadata as _archive_chunks_batch stores it."""
+    return orjson.dumps(
+        {"file_path": file_path, "stage": "archived"}, option=orjson.OPT_SORT_KEYS
+    ).decode()
 
 
 class TestLifecycleManagerInitialization:
@@ -54,61 +69,66 @@ class TestDemotion:
         mock_kv_store = Mock()
         return MemoryLifecycleManager(mock_indexer, mock_kv_store)
 
-    def test_demote_stale_chunks(self, manager):
-        """Test demotion of chunks >7 days old."""
-        # Mock stale chunks
-        cutoff = (datetime.now() - timedelta(days=7)).isoformat()
+    @pytest.mark.parametrize(
+        "ids,threshold,expected",
+        [
+            (["chunk1", "chunk2", "chunk3"], 7, 3),
+            (["chunk1"], 14, 1),
+            ([], 7, 0),
+        ],
+        ids=["stale", "custom-threshold", "preserves-recent"],
+    )
+    def test_demote(self, manager, ids, threshold, expected):
+        """Test stale chunks are demoted in one batched update per threshold."""
+        last_accessed = (datetime.now() - timedelta(days=threshold)).isoformat()
         manager.vector_indexer.collection.get.return_value = {
-            "ids": ["chunk1", "chunk2", "chunk3"],
+            "ids": ids,
             "metadatas": [
-                {"stage": "active", "last_accessed": cutoff},
-                {"stage": "active", "last_accessed": cutoff},
-                {"stage": "active", "last_accessed": cutoff},
+                {"stage": "active", "last_accessed": last_accessed} for _ in ids
             ],
         }
 
-        # Demote
-        count = manager.demote_stale_chunks(threshold_days=7)
-
-        # Verify
-        assert count == 3
-        assert manager.vector_indexer.collection.update.call_count == 3
-
-        # Check first update call
-        call_args = manager.vector_indexer.collection.update.call_args_list[0]
-        assert call_args[1]["ids"] == ["chunk1"]
-        assert call_args[1]["metadatas"][0]["stage"] == "demoted"
-        assert call_args[1]["metadatas"][0]["score_multiplier"] == 0.5
-
-    def test_demote_threshold_configurable(self, manager):
-        """Test custom demotion threshold."""
-        manager.vector_indexer.collection.get.return_value = {
-            "ids": ["chunk1"],
-            "metadatas": [{"stage": "active"}],
-        }
-
-        # Use custom threshold (14 days)
-        count = manager.demote_stale_chunks(threshold_days=14)
-
-        # Verify query used 14 days
-        call_args = manager.vector_indexer.collection.get.call_args
-        where_clause = call_args[1]["where"]  # noqa: F841
-        cutoff_14 = (datetime.now() - timedelta(days=14)).isoformat()  # noqa: F841
-
-        assert count == 1
-
-    def test_demote_preserves_recent(self, manager):
-        """Test recent chunks are not demoted."""
-        # Mock no stale chunks
+        count = manager.demote_stale_chunks(threshold_days=threshold)
+
+        assert count == expected
+
+        # Query used a numeric epoch cutoff `threshold` days back
+        where_clause = manager.vector_indexer.collection.get.call_args[1]["where"]
+        cutoff_ts = where_clause["$and"][1]["last_accessed_ts"]["$lt"]
+        expected_ts = (datetime.utcnow() - timedelta(days=threshold)).timestamp()
+        assert isinstance(cutoff_ts, float)
+        assert abs(cutoff_ts - expected_ts) < 60
+
+        # Nothing stale, nothing written; otherwise one update carries every chunk
+        update = manager.vector_indexer.collection.update
+        if not ids:
+            update.assert_not_called()
+            return
+        update.assert_called_once()
+        assert update.call_args[1]["ids"] == ids
+        for metadata in update.call_args[1]["metadatas"]:
+            assert metadata["stage"] == "demoted"
+            assert metadata["score_multiplier"] == 0.5
+            assert metadata["last_accessed"] == last_accessed
+
+    def test_demote_filters_in_chroma(self, manager):
+        """Test the stale predicate is pushed to Chroma, metadatas only."""
         manager.vector_indexer.collection.get.return_value = {
             "ids": [],
             "metadatas": [],
         }
 
-        count = manager.demote_stale_chunks(threshold_days=7)
+        manager.demote_stale_chunks(threshold_days=7)
 
-        assert count == 0
-        assert manager.vector_indexer.collection.update.call_count == 0
+        manager.vector_indexer.collection.get.assert_called_once_with(
+            where={
+                "$and": [
+                    {"stage": "active"},
+                    {"last_accessed_ts": {"$lt": ANY}},
+                ]
+            },
+            include=["metadatas"],
+        )
 
     def test_demote_batch_performance(self, manager):
         """Test demotion of 1000 chunks completes quickly."""
@@ -127,9 +147,30 @@ class TestDemotion:
         elapsed_ms = (time.time() - start) * 1000  # noqa: F841
 
         assert count == 1000
+        # Updates are batched: ceil(1000 / UPDATE_BATCH_SIZE) calls, not 1000
+        expected_calls = math.ceil(1000 / UPDATE_BATCH_SIZE)
+        update = manager.vector_indexer.collection.update
+        assert update.call_count == expected_calls
+        assert sum(len(c[1]["ids"]) for c in update.call_args_list) == 1000
         # Performance target: <100ms for 1000 chunks
         # Note: In production with real DB, may be slower
 
+    def test_demote_batch_failure_not_counted(self, manager):
+        """Test a failed batch update is logged and excluded from the count."""
+        chunk_ids = [f"chunk{i}" for i in range(UPDATE_BATCH_SIZE + 1)]
+        manager.vector_indexer.collection.get.return_value = {
+            "ids": chunk_ids,
+            "metadatas": [{"stage": "active"} for _ in chunk_ids],
+        }
+        manager.vector_indexer.collection.update.side_effect = [
+            Exception("chroma unavailable"),
+            None,
+        ]
+
+        count = manager.demote_stale_chunks()
+
+        assert count == 1
+
 
 class TestArchival:
     """Test suite for archival (Demoted → Archived)."""
@@ -160,8 +201,24 @@ class TestArchival:
 
         # Verify
         assert count == 2
-        assert manager.kv_store.set.call_count == 4  # 2 summaries + 2 metadata
-        assert manager.vector_indexer.collection.delete.call_count == 2
+        # 2 summaries + 2 metadata in one KV write, one vector-store delete
+        manager.kv_store.set_many.assert_called_once()
+        pairs = manager.kv_store.set_many.call_args[0][0]
+        assert [key for key, _ in pairs] == [
+            "archived:chunk1",
+            "archived:chunk1:metadata",
+            "archived:chunk2",
+            "archived:chunk2:metadata",
+        ]
+        manager.vector_indexer.collection.delete.assert_called_once_with(
+            ids=["chunk1", "chunk2"]
+        )
+
+        # One archival timestamp per sweep, shared by every chunk
+        metadata_writes = [
+            json.loads(value) for key, value in pairs if key.endswith(":metadata")
+        ]
+        assert len({m["archived_at_ts"] for m in metadata_writes}) == 1
 
     def test_archive_compression(self, manager):
         """A document larger than the summary budget is compressed to <= the
@@ -181,8 +238,7 @@ class TestArchival:
         count = manager.archive_demoted_chunks()
 
         # Verify summary is compressed
-        call_args = manager.kv_store.set.call_args_list[0]
-        summary = call_args[0][1]  # Second argument is the summary
+        summary = manager.kv_store.set_many.call_args[0][0][0][1]
 
         assert len(summary) <= SUMMARY_MAX_LEN
         assert len(summary) < len(long_text)
@@ -236,8 +292,7 @@ class TestArchival:
         count = manager.archive_demoted_chunks()
 
         # Verify KV store called with archived key
-        call_args = manager.kv_store.set.call_args_list[0]
-        key = call_args[0][0]
+        key = manager.kv_store.set_many.call_args[0][0][0][0]
 
         assert key == "archived:chunk1"
         assert count == 1
@@ -271,9 +326,31 @@ class TestArchival:
         # Use custom threshold (60 days)
         count = manager.archive_demoted_chunks(threshold_days=60)
 
-        # Verify query used 60 days
+        # Verify query filtered in Chroma with a 60-day numeric cutoff and
+        # skipped embeddings (only documents are summarized)
+        call_args = manager.vector_indexer.collection.get.call_args
+        stage, demoted = call_args[1]["where"]["$and"]
+        cutoff_60 = (datetime.utcnow() - timedelta(days=60)).timestamp()
+
+        assert stage == {"stage": "demoted"}
+        assert abs(demoted["demoted_at_ts"]["$lt"] - cutoff_60) < 60
+        assert call_args[1]["include"] == ["documents", "metadatas"]
         assert count == 1
 
+    def test_archive_keeps_vector_chunks_when_kv_write_fails(self, manager):
+        """Test chunks are not deleted if their summaries were not stored."""
+        manager.vector_indexer.collection.get.return_value = {
+            "ids": ["chunk1"],
+            "documents": ["Text"],
+            "metadatas": [{"stage": "demoted"}],
+        }
+        manager.kv_store.set_many.return_value = False
+
+        count = manager.archive_demoted_chunks()
+
+        assert count == 0
+        manager.vector_indexer.collection.delete.assert_not_called()
+
 
 class TestRehydration:
     """Test suite for rehydration (Archived → Active)."""
@@ -287,37 +364,36 @@ class TestRehydration:
 
     def test_make_rehydratable(self, manager):
         """Test making archived chunks rehydratable (>90 days)."""
-        # Mock archived keys
-        manager.kv_store.list_keys.return_value = [
-            "archived:chunk1",
-            "archived:chunk1:metadata",
-            "archived:chunk2",
-            "archived:chunk2:metadata",
-        ]
-
-        manager.kv_store.get.side_effect = lambda key: (
-            "Summary 1"
-            if key == "archived:chunk1"
-            else "archived_at: 2024-01-01"
-            if key == "archived:chunk1:metadata"
-            else "Summary 2"
-            if key == "archived:chunk2"
-            else "archived_at: 2024-01-01"
+        # Mock archived metadata scan (legacy non-JSON metadata)
+        manager.kv_store.scan_items.return_value = iter(
+            [
+                ("archived:chunk1:metadata", "archived_at: 2024-01-01"),
+                ("archived:chunk2:metadata", "archived_at: 2024-01-01"),
+            ]
         )
+        manager.kv_store.get.side_effect = {
+            "archived:chunk1": "Summary 1",
+            "archived:chunk2": "Summary 2",
+        }.get
 
         count = manager.make_rehydratable(threshold_days=90)
 
-        # Verify chunks moved to rehydratable
+        # Verify chunks moved to rehydratable in one KV write
         assert count == 2
-        assert manager.kv_store.set.call_count >= 2  # At least 2 rehydratable keys
+        manager.kv_store.scan_items.assert_called_once_with("archived:", ":metadata")
+        pairs = manager.kv_store.set_many.call_args[0][0]
+        assert ("rehydratable:chunk1", "Summary 1") in pairs
+        assert ("rehydratable:chunk2", "Summary 2") in pairs
+        assert manager.kv_store.delete.call_count == 4
 
     def test_rekindle_archived(self, manager):
         """Test rekindling archived chunk."""
-        # Mock archived chunk
+        # Mock archived chunk (metadata stored as JSON by archival)
+        metadata = _archived_metadata_json("/path/to/file.md")
         manager.kv_store.get.side_effect = lambda key: (
             "Summary of chunk"
             if key == "archived:chunk1"
-            else "file_path: /path/to/file.md"
+            else metadata
             if key == "archived:chunk1:metadata"
             else None
         )
@@ -337,9 +413,30 @@ class TestRehydration:
         assert call_args[1]["metadatas"][0]["stage"] == "active"
         assert call_args[1]["metadatas"][0]["score_multiplier"] == 1.0
 
+    def test_rekindle_passes_float32_embeddings(self, manager):
+        """Test the fallback embedding reaches the indexer as a float32 matrix."""
+        metadata = _archived_metadata_json("/path/to/file.md")
+        manager.kv_store.get.side_effect = lambda key: (
+            "Summary"
+            if key == "archived:chunk1"
+            else metadata
+            if key == "archived:chunk1:metadata"
+            else None
+        )
+        query_embedding = np.array([0.1, 0.2, 0.3], dtype=np.float64)
+
+        with patch("builtins.open", mock_open(read_data="Full text")):
+            assert manager.rekindle_archived(query_embedding, "chunk1") is True
+
+        embeddings = manager.vector_indexer.index_chunks.call_args[1]["embeddings"]
+        assert isinstance(embeddings, np.ndarray)
+        assert embeddings.dtype == np.float32
+        assert embeddings.flags["C_CONTIGUOUS"]
+        np.testing.assert_allclose(embeddings, [[0.1, 0.2, 0.3]], rtol=1e-6)
+
     def test_rekindle_rehydratable(self, manager):
         """Test rekindling from rehydratable stage."""
-        # Mock rehydratable chunk
+        # Mock rehydratable chunk (legacy non-JSON metadata string)
         manager.kv_store.get.side_effect = lambda key: (
             "Summary"
             if key == "rehydratable:chunk1"
@@ -355,10 +452,11 @@ class TestRehydration:
 
     def test_rekindle_file_not_found(self, manager):
         """Test rekindling when file missing."""
+        metadata = _archived_metadata_json("/nonexistent/file.md")
         manager.kv_store.get.side_effect = lambda key: (
             "Summary"
             if key == "archived:chunk1"
-            else "file_path: /nonexistent/file.md"
+            else metadata
             if key == "archived:chunk1:metadata"
             else None
         )
@@ -371,10 +469,11 @@ class TestRehydration:
 
     def test_rekindle_promotes_to_active(self, manager):
         """Test rekindling promotes chunk to active stage."""
+        archived = _archived_metadata_json("/path/to/file.md")
         manager.kv_store.get.side_effect = lambda key: (
             "Summary"
             if key == "archived:chunk1"
-            else "file_path: /path/to/file.md, stage: archived"
+            else archived
             if key == "archived:chunk1:metadata"
             else None
         )
@@ -392,6 +491,7 @@ class TestRehydration:
         assert metadata["stage"] == "active"
         assert metadata["score_multiplier"] == 1.0
         assert "rekindled_at" in metadata
+        assert metadata["file_path"] == "/path/to/file.md"
 
     def test_rekindle_sets_valid_last_accessed_ts(self, manager):
         """E4: rekindling must not drop last_accessed_ts to missing/None.
@@ -488,7 +588,9 @@ class TestRehydration:
         assert success is True
         mock_embedder.encode_single.assert_called_once_with("Full text from file")
         call_args = mock_indexer.index_chunks.call_args
-        assert call_args[1]["embeddings"] == [[0.9, 0.8, 0.7]]
+        embeddings = call_args[1]["embeddings"]
+        assert embeddings.dtype == np.float32
+        np.testing.assert_allclose(embeddings, [[0.9, 0.8, 0.7]], rtol=1e-6)
 
     def test_rekindle_missing_metadata_does_not_read_default_path(self, manager):
         """E8: when a chunk's metadata is absent, rekindle must fail honestly,
@@ -517,6 +619,28 @@ class TestRehydration:
         ), "rekindle silently read the fabricated /default/path.md on a parse miss"
         manager.vector_indexer.index_chunks.assert_not_called()
 
+    def test_rekindle_reads_source_file_once_until_modified(self, manager, tmp_path):
+        """Test repeated reads of one source file hit the cache until it changes."""
+        import os
+        from src.memory import lifecycle_manager
+
+        source = tmp_path / "doc.md"
+        source.write_text("version one")
+
+        with patch.object(
+            lifecycle_manager, "_read_text", wraps=lifecycle_manager._read_text
+        ) as read:
+            assert manager._read_full_text(str(source)) == "version one"
+            assert manager._read_full_text(str(source)) == "version one"
+            assert read.call_count == 1
+
+            source.write_text("version two")
+            stat = source.stat()
+            os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+            assert manager._read_full_text(str(source)) == "version two"
+            assert read.call_count == 2
+
     def test_rekindle_with_json_metadata_reads_real_file(self, manager, tmp_path):
         """E8: the PRODUCTION metadata format is json.dumps(...) (see
         _archive_chunks_batch). Rekindle must resolve file_path from that JSON
@@ -543,6 +667,37 @@ class TestRehydration:
         assert indexed_chunk["file_path"] == str(real_file)
         assert indexed_chunk["text"] == "FULL DOCUMENT TEXT"
 
+    def test_rekindle_many_batches_reads_and_indexing(self, tmp_path):
+        """Test several chunks are rekindled with one embed/index/update call."""
+        store = {}
+        for name in ("a", "b", "c"):
+            source = tmp_path / f"{name}.md"
+            source.write_text(f"text {name}")
+            store[f"archived:{name}"] = f"Summary {name}"
+            store[f"archived:{name}:metadata"] = _archived_metadata_json(str(source))
+        store["archived:orphan"] = "Summary without metadata"
+
+        mock_embedder = Mock()
+        mock_embedder.encode.return_value = [[0.1], [0.2], [0.3]]
+        manager = MemoryLifecycleManager(Mock(), Mock(), mock_embedder)
+        manager.kv_store.get.side_effect = store.get
+
+        rekindled = manager.rekindle_many([0.9], ["a", "b", "orphan", "c", "a"])
+
+        assert rekindled == ["a", "b", "c"]
+        mock_embedder.encode.assert_called_once_with(["text a", "text b", "text c"])
+        mock_embedder.encode_single.assert_not_called()
+        manager.vector_indexer.index_chunks.assert_called_once()
+        index_kwargs = manager.vector_indexer.index_chunks.call_args[1]
+        assert [c["id"] for c in index_kwargs["chunks"]] == ["a", "b", "c"]
+        np.testing.assert_allclose(
+            index_kwargs["embeddings"], [[0.1], [0.2], [0.3]], rtol=1e-6
+        )
+        update_kwargs = manager.vector_indexer.collection.update.call_args[1]
+        assert update_kwargs["ids"] == ["a", "b", "c"]
+        assert {m["stage"] for m in update_kwargs["metadatas"]} == {"active"}
+        manager.kv_store.delete.assert_any_call("archived:b:metadata")
+
 
 class TestConsolidation:
     """Test suite for consolidation (merge similar chunks)."""
@@ -579,6 +734,58 @@ class TestConsolidation:
         assert manager.vector_indexer.collection.update.call_count >= 1
         assert manager.vector_indexer.collection.delete.call_count >= 1
 
+    def test_consolidate_fetches_contents_for_candidates_only(self, manager):
+        """Test the scan pulls embeddings only; documents only for candidates."""
+        manager.vector_indexer.collection.get.side_effect = [
+            {
+                "ids": ["chunk1", "chunk2", "chunk3"],
+                "embeddings": [[1.0, 0.0], [1.0, 0.0], [0.0, 1.0]],
+            },
+            {
+                "ids": ["chunk1", "chunk2"],
+                "documents": ["Text A", "Text A again"],
+                "metadatas": [{"stage": "active"}, {"stage": "active"}],
+            },
+        ]
+
+        count = manager.consolidate_similar(threshold=0.95)
+
+        scan, contents = manager.vector_indexer.collection.get.call_args_list
+        assert scan[1] == {"where": {"stage": "active"}, "include": ["embeddings"]}
+        assert contents[1] == {
+            "ids": ["chunk1", "chunk2"],
+            "include": ["documents", "metadatas"],
+        }
+        assert count == 1
+
+    def test_consolidate_merges_cluster_once(self, manager):
+        """Test chunks absorbed into one anchor are merged in a single update."""
+        manager.vector_indexer.collection.get.return_value = {
+            "ids": ["chunk1", "chunk2", "chunk3"],
+            "documents": ["Text A", "Text B", "Text C"],
+            "embeddings": [[1.0, 0.0], [1.0, 0.0], [1.0, 0.0]],
+            "metadatas": [
+                {"score": 0.5, "tags": ["a"], "last_accessed": "2024-01-01"},
+                {"score": 0.9, "tags": ["b"], "last_accessed": "2024-03-01"},
+                {"score": 0.7, "tags": ["a", "c"], "last_accessed": "2024-02-01"},
+            ],
+        }
+
+        count = manager.consolidate_similar(threshold=0.95)
+
+        assert count == 2
+        update = manager.vector_indexer.collection.update
+        update.assert_called_once()
+        assert update.call_args[1]["ids"] == ["chunk1"]
+        assert update.call_args[1]["documents"] == ["Text A\n\nText B\n\nText C"]
+        merged = update.call_args[1]["metadatas"][0]
+        assert sorted(merged["tags"]) == ["a", "b", "c"]
+        assert merged["score"] == 0.9
+        assert merged["last_accessed"] == "2024-03-01"
+        manager.vector_indexer.collection.delete.assert_called_once_with(
+            ids=["chunk2", "chunk3"]
+        )
+
     def test_consolidate_accepts_numpy_embeddings(self, manager):
         """Chroma returns ndarray embeddings; consolidation must not truth-test them."""
         import numpy as np
@@ -708,15 +915,8 @@ class TestStatistics:
             {"ids": ["d1", "d2"]},  # demoted
         ]
 
-        # Mock KV store keys
-        manager.kv_store.list_keys.return_value = [
-            "archived:c1",
-            "archived:c1:metadata",
-            "archived:c2",
-            "archived:c2:metadata",
-            "rehydratable:r1",
-            "rehydratable:r1:metadata",
-        ]
+        # Mock KV store counts (archived, rehydratable)
+        manager.kv_store.count_keys.side_effect = [2, 1]
 
         stats = manager.get_stage_stats()
 
@@ -727,25 +927,45 @@ class TestStatistics:
         assert stats["rehydratable"] == 1
         assert stats["total"] == 8
 
+        # Counting fetches ids only, and never lists the KV keyspace
+        for call in manager.vector_indexer.collection.get.call_args_list:
+            assert call[1]["include"] == []
+        manager.kv_store.count_keys.assert_any_call(
+            "archived:", exclude_suffix=":metadata"
+        )
+        manager.kv_store.list_keys.assert_not_called()
+
+    def test_get_stage_stats_memoized_until_ttl(self, manager, monkeypatch):
+        """Test repeated stats calls reuse counts until the TTL lapses."""
+        from src.memory import lifecycle_manager
+
+        now = [1000.0]
+        monkeypatch.setattr(lifecycle_manager.time, "monotonic", lambda: now[0])
+        manager.vector_indexer.collection.get.return_value = {"ids": ["a1"]}
+        manager.kv_store.count_keys.return_value = 0
+
+        first = manager.get_stage_stats()
+        first["total"] = -1  # callers get copies
+        assert manager.get_stage_stats()["total"] == 2
+        assert manager.vector_indexer.collection.get.call_count == 2
+
+        now[0] += STAGE_STATS_TTL_SECONDS
+        manager.get_stage_stats()
+        assert manager.vector_indexer.collection.get.call_count == 4
+
+    def test_get_stage_stats_invalidated_by_mutation(self, manager):
+        """Test a guarded mutation drops the memoized stats."""
+        manager.vector_indexer.collection.get.return_value = {"ids": []}
+        manager.kv_store.count_keys.return_value = 0
+        manager.kv_store.cleanup_expired.return_value = 0
+
+        manager.get_stage_stats()
+        manager.cleanup_expired()
+        manager.get_stage_stats()
+
+        assert manager.kv_store.count_keys.call_count == 4
+
 
 def test_nasa_rule_10_compliance():
     """Test all methods ≤60 LOC."""
-    import ast
-    import inspect
-    from src.memory.lifecycle_manager import MemoryLifecycleManager
-
-    # Get source code
-    source = inspect.getsource(MemoryLifecycleManager)
-    tree = ast.parse(source)
-
-    # Find all methods
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef):
-            # Calculate LOC
-            length = node.end_lineno - node.lineno + 1
-
-            # Check NASA Rule 10 (≤60 LOC)
-            assert length <= 60, (
-                f"Method {node.name} has {length} LOC "
-                f"(violates NASA Rule 10: ≤60 LOC)"
-            )
+    check_class_rule10(MemoryLifecycleManager)
@@ -134,6 +134,36 @@ class TestMemoryCacheTTL:
         assert removed == 2
         assert len(cache._cache) == 0
 
+    def test_cleanup_keeps_reset_and_unexpired_entries(self, cache):
+        """Test cleanup skips keys re-set with a longer TTL or deleted."""
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
+        cache.set("key3", "value3")
+        cache.set("key1", "value1b", ttl_seconds=5)  # re-set, still valid
+        cache.delete("key3")
+
+        time.sleep(1.5)
+
+        assert cache.cleanup_expired() == 1
+        assert cache.get("key1") == "value1b"
+        assert cache.get("key2") is None
+
+    def test_expiry_heap_stays_bounded(self, cache):
+        """Test repeated overwrites do not grow the expiry heap unboundedly."""
+        for i in range(1000):
+            cache.set("key1", f"value{i}")
+
+        assert len(cache._expiry_heap) <= 2 * len(cache._cache) + 64
+
+    def test_entries_are_slotted_monotonic_deadlines(self, cache):
+        """Test entries carry no __dict__ and expire on the monotonic clock."""
+        before = time.monotonic()
+        cache.set("key1", "value1")
+        entry = cache._cache["key1"]
+
+        assert not hasattr(entry, "__dict__")
+        assert before + 1 <= entry.expires_at <= time.monotonic() + 1
+
 
 class TestMemoryCacheLRU:
     """Test suite for LRU eviction."""
@@ -4,19 +4,140 @@ Unit tests for Mode Detector.
 Tests pattern-based mode detection and confidence scoring.
 """
 
+import numpy as np
 import pytest
-from src.modes.mode_detector import ModeDetector
 from src.modes.mode_profile import EXECUTION, PLANNING, BRAINSTORMING
 
 
+# Test dataset: (query, expected_mode)
+TEST_DATASET = [
+    # Execution queries (33)
+    ("What is X?", "execution"),
+    ("What are the steps?", "execution"),
+    ("How do I configure this?", "execution"),
+    ("How to install dependencies?", "execution"),
+    ("Show me the code", "execution"),
+    ("Get the latest version", "execution"),
+    ("Find all occurrences", "execution"),
+    ("Fetch user data", "execution"),
+    ("Tell me about NASA Rule 10", "execution"),
+    ("Explain the concept", "execution"),
+    ("Describe the architecture", "execution"),
+    ("What is the difference?", "execution"),
+    ("How do I debug this?", "execution"),
+    ("Show me examples", "execution"),
+    ("Get test results", "execution"),
+    ("Find the bug", "execution"),
+    ("Tell me the status", "execution"),
+    ("Explain how it works", "execution"),
+    ("What are the requirements?", "execution"),
+    ("How do I run tests?", "execution"),
+    ("Show me the logs", "execution"),
+    ("Get performance metrics", "execution"),
+    ("Find memory leaks", "execution"),
+    ("What is the error?", "execution"),
+    ("Describe the problem", "execution"),
+    ("Tell me what failed", "execution"),
+    ("How to fix this?", "execution"),
+    ("What are the symptoms?", "execution"),
+    ("Show me stack trace", "execution"),
+    ("Get error details", "execution"),
+    ("Find root cause", "execution"),
+    ("What is causing slowness?", "execution"),
+    ("Explain the failure", "execution"),
+    # Planning queries (33)
+    ("What should I do first?", "planning"),
+    ("How can I improve this?", "planning"),
+    ("How should I proceed?", "planning"),
+    ("What are the options for deployment?", "planning"),
+    ("Compare React and Vue", "planning"),
+    ("Which is better: REST or GraphQL?", "planning"),
+    ("Should I use TypeScript?", "planning"),
+    ("When should I refactor?", "planning"),
+    ("What if I chose a different approach?", "planning"),
+    ("What should I prioritize?", "planning"),
+    ("How can I optimize performance?", "planning"),
+    ("What are the trade-offs?", "planning"),
+    ("Should I migrate now?", "planning"),
+    ("What should I test first?", "planning"),
+    ("How can I reduce complexity?", "planning"),
+    ("Which database should I use?", "planning"),
+    ("What should I focus on?", "planning"),
+    ("How can I scale this?", "planning"),
+    ("What are the risks?", "planning"),
+    ("Should I add caching?", "planning"),
+    ("What if I need more features?", "planning"),
+    ("How should I structure this?", "planning"),
+    ("What are the best practices?", "planning"),
+    ("Should I split this module?", "planning"),
+    ("How can I make this testable?", "planning"),
+    ("What should I document?", "planning"),
+    ("Which pattern should I use?", "planning"),
+    ("How can I improve maintainability?", "planning"),
+    ("What are the alternatives?", "planning"),
+    ("Should I use a framework?", "planning"),
+    ("How should I handle errors?", "planning"),
+    ("What are the pros and cons?", "planning"),
+    ("Which approach is more scalable?", "planning"),
+    # Brainstorming queries (34)
+    ("What if we used microservices?", "brainstorming"),
+    ("Could we explore event sourcing?", "brainstorming"),
+    ("Imagine unlimited compute resources", "brainstorming"),
+    ("Explore all possible architectures", "brainstorming"),
+    ("What are all the ways to solve this?", "brainstorming"),
+    ("What other technologies could we use?", "brainstorming"),
+    ("List all possible optimizations", "brainstorming"),
+    ("Brainstorm deployment strategies", "brainstorming"),
+    ("Ideas for improving user experience", "brainstorming"),
+    ("What if we rewrote everything?", "brainstorming"),
+    ("Could we use machine learning?", "brainstorming"),
+    ("Imagine we had no constraints", "brainstorming"),
+    ("Explore creative solutions", "brainstorming"),
+    ("What are all possible features?", "brainstorming"),
+    ("What other approaches exist?", "brainstorming"),
+    ("List all potential issues", "brainstorming"),
+    ("Brainstorm test scenarios", "brainstorming"),
+    ("What if we started over?", "brainstorming"),
+    ("Could we automate everything?", "brainstorming"),
+    ("What are all the edge cases?", "brainstorming"),
+    ("Explore unconventional ideas", "brainstorming"),
+    ("What if performance wasn't a concern?", "brainstorming"),
+    ("Could we build this differently?", "brainstorming"),
+    ("Imagine perfect conditions", "brainstorming"),
+    ("What are all the risks?", "brainstorming"),
+    ("List all potential benefits", "brainstorming"),
+    ("Brainstorm integration points", "brainstorming"),
+    ("What other use cases exist?", "brainstorming"),
+    ("Could we extend this further?", "brainstorming"),
+    ("What if we had more time?", "brainstorming"),
+    ("Explore all variations", "brainstorming"),
+    ("What are all the dependencies?", "brainstorming"),
+    ("List all possible improvements", "brainstorming"),
+    ("Brainstorm monitoring strategies", "brainstorming"),
+]
+
+# Queries the pattern detector misroutes to execution: "what are" is an
+# execution pattern and these carry no other planning/brainstorming cue, or
+# (for "Which approach...") nothing matches and detection falls back.
+KNOWN_MISSES = {
+    "What are the options for deployment?",
+    "What are the trade-offs?",
+    "What are the risks?",
+    "What are the best practices?",
+    "What are the alternatives?",
+    "What are the pros and cons?",
+    "Which approach is more scalable?",
+    "What are all the ways to solve this?",
+    "What are all possible features?",
+    "What are all the edge cases?",
+    "What are all the risks?",
+    "What are all the dependencies?",
+}
+
+
 class TestModeDetection:
     """Test suite for mode detection."""
 
-    @pytest.fixture
-    def detector(self):
-        """Create mode detector instance."""
-        return ModeDetector()
-
     def test_detect_execution_mode_what_is(self, detector):
         """Test execution mode detection for 'What is X?' pattern."""
         profile, confidence = detector.detect("What is NASA Rule 10?")
@@ -86,11 +207,6 @@ class TestModeDetection:
 class TestDetectionConfidence:
     """Test suite for confidence scoring."""
 
-    @pytest.fixture
-    def detector(self):
-        """Create mode detector instance."""
-        return ModeDetector()
-
     def test_high_confidence_multiple_patterns(self, detector):
         """Test high confidence when multiple patterns match."""
         # Query with multiple execution patterns
@@ -123,134 +239,62 @@ class TestDetectionConfidence:
         assert profile == EXECUTION
         assert confidence == 0.5
 
+    def test_overlapping_patterns_counted_separately(self, detector):
+        """Test overlapping patterns each count toward confidence."""
+        # "what should" and "should i" overlap on "should"
+        assert detector._score_planning_patterns("what should i do") == 1.0
+        assert detector._score_planning_patterns("should we") == 0.0
+        assert detector._score_brainstorming_patterns("imagine") == 0.85
+
+    def test_repeated_query_served_from_cache(self, detector):
+        """Test case/whitespace variants of a query share one cache entry."""
+        from src.modes.mode_detector import _classify
+
+        _classify.cache_clear()
+        first = detector.detect("What should I do about caching?")
+        second = detector.detect("  what should i do about CACHING?  ")
+
+        assert first == second
+        info = _classify.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
 
 class TestDetectionAccuracy:
     """Test suite for overall detection accuracy."""
 
-    @pytest.fixture
-    def detector(self):
-        """Create mode detector instance."""
-        return ModeDetector()
-
     def test_detection_accuracy(self, detector):
         """Test detection accuracy on 100-query dataset."""
-        # Test dataset: (query, expected_mode)
-        test_dataset = [
-            # Execution queries (33)
-            ("What is X?", "execution"),
-            ("What are the steps?", "execution"),
-            ("How do I configure this?", "execution"),
-            ("How to install dependencies?", "execution"),
-            ("Show me the code", "execution"),
-            ("Get the latest version", "execution"),
-            ("Find all occurrences", "execution"),
-            ("Fetch user data", "execution"),
-            ("Tell me about NASA Rule 10", "execution"),
-            ("Explain the concept", "execution"),
-            ("Describe the architecture", "execution"),
-            ("What is the difference?", "execution"),
-            ("How do I debug this?", "execution"),
-            ("Show me examples", "execution"),
-            ("Get test results", "execution"),
-            ("Find the bug", "execution"),
-            ("Tell me the status", "execution"),
-            ("Explain how it works", "execution"),
-            ("What are the requirements?", "execution"),
-            ("How do I run tests?", "execution"),
-            ("Show me the logs", "execution"),
-            ("Get performance metrics", "execution"),
-            ("Find memory leaks", "execution"),
-            ("What is the error?", "execution"),
-            ("Describe the problem", "execution"),
-            ("Tell me what failed", "execution"),
-            ("How to fix this?", "execution"),
-            ("What are the symptoms?", "execution"),
-            ("Show me stack trace", "execution"),
-            ("Get error details", "execution"),
-            ("Find root cause", "execution"),
-            ("What is causing slowness?", "execution"),
-            ("Explain the failure", "execution"),
-            # Planning queries (33)
-            ("What should I do first?", "planning"),
-            ("How can I improve this?", "planning"),
-            ("How should I proceed?", "planning"),
-            ("What are the options for deployment?", "planning"),
-            ("Compare React and Vue", "planning"),
-            ("Which is better: REST or GraphQL?", "planning"),
-            ("Should I use TypeScript?", "planning"),
-            ("When should I refactor?", "planning"),
-            ("What if I chose a different approach?", "planning"),
-            ("What should I prioritize?", "planning"),
-            ("How can I optimize performance?", "planning"),
-            ("What are the trade-offs?", "planning"),
-            ("Should I migrate now?", "planning"),
-            ("What should I test first?", "planning"),
-            ("How can I reduce complexity?", "planning"),
-            ("Which database should I use?", "planning"),
-            ("What should I focus on?", "planning"),
-            ("How can I scale this?", "planning"),
-            ("What are the risks?", "planning"),
-            ("Should I add caching?", "planning"),
-            ("What if I need more features?", "planning"),
-            ("How should I structure this?", "planning"),
-            ("What are the best practices?", "planning"),
-            ("Should I split this module?", "planning"),
-            ("How can I make this testable?", "planning"),
-            ("What should I document?", "planning"),
-            ("Which pattern should I use?", "planning"),
-            ("How can I improve maintainability?", "planning"),
-            ("What are the alternatives?", "planning"),
-            ("Should I use a framework?", "planning"),
-            ("How should I handle errors?", "planning"),
-            ("What are the pros and cons?", "planning"),
-            ("Which approach is more scalable?", "planning"),
-            # Brainstorming queries (34)
-            ("What if we used microservices?", "brainstorming"),
-            ("Could we explore event sourcing?", "brainstorming"),
-            ("Imagine unlimited compute resources", "brainstorming"),
-            ("Explore all possible architectures", "brainstorming"),
-            ("What are all the ways to solve this?", "brainstorming"),
-            ("What other technologies could we use?", "brainstorming"),
-            ("List all possible optimizations", "brainstorming"),
-            ("Brainstorm deployment strategies", "brainstorming"),
-            ("Ideas for improving user experience", "brainstorming"),
-            ("What if we rewrote everything?", "brainstorming"),
-            ("Could we use machine learning?", "brainstorming"),
-            ("Imagine we had no constraints", "brainstorming"),
-            ("Explore creative solutions", "brainstorming"),
-            ("What are all possible features?", "brainstorming"),
-            ("What other approaches exist?", "brainstorming"),
-            ("List all potential issues", "brainstorming"),
-            ("Brainstorm test scenarios", "brainstorming"),
-            ("What if we started over?", "brainstorming"),
-            ("Could we automate everything?", "brainstorming"),
-            ("What are all the edge cases?", "brainstorming"),
-            ("Explore unconventional ideas", "brainstorming"),
-            ("What if performance wasn't a concern?", "brainstorming"),
-            ("Could we build this differently?", "brainstorming"),
-            ("Imagine perfect conditions", "brainstorming"),
-            ("What are all the risks?", "brainstorming"),
-            ("List all potential benefits", "brainstorming"),
-            ("Brainstorm integration points", "brainstorming"),
-            ("What other use cases exist?", "brainstorming"),
-            ("Could we extend this further?", "brainstorming"),
-            ("What if we had more time?", "brainstorming"),
-            ("Explore all variations", "brainstorming"),
-            ("What are all the dependencies?", "brainstorming"),
-            ("List all possible improvements", "brainstorming"),
-            ("Brainstorm monitoring strategies", "brainstorming"),
-        ]
-
-        correct = 0
-        for query, expected_mode in test_dataset:
-            profile, confidence = detector.detect(query)
-            if profile.name == expected_mode:
-                correct += 1
-
-        accuracy = correct / len(test_dataset)
+        queries, expected = zip(*TEST_DATASET)
+        detected = [detector.detect(query)[0].name for query in queries]
+
+        correct = int(np.sum(np.asarray(detected) == np.asarray(expected)))
+        accuracy = correct / len(TEST_DATASET)
 
         # Target: ≥85% accuracy
         assert accuracy >= 0.85, (
             f"Detection accuracy {accuracy:.1%} below 85% target "
-            f"({correct}/{len(test_dataset)} correct)"
+            f"({correct}/{len(TEST_DATASET)} correct)"
         )
+
+    @pytest.mark.parametrize(
+        "query,expected_mode",
+        [
+            pytest.param(
+                query,
+                expected_mode,
+                marks=pytest.mark.xfail(
+                    strict=True,
+                    reason="known pattern-detector miss; remove from "
+                    "KNOWN_MISSES once it passes",
+                )
+                if query in KNOWN_MISSES
+                else (),
+            )
+            for query, expected_mode in TEST_DATASET
+        ],
+    )
+    def test_detects_expected_mode(self, detector, query, expected_mode):
+        """Test each dataset query individually (reports specific misses)."""
+        profile, _ = detector.detect(query)
+
+        assert profile.name == expected_mode
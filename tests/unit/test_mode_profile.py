@@ -4,12 +4,15 @@ Unit tests for Mode Profile.
 Tests mode configuration, validation, and predefined profiles.
 """
 
+from dataclasses import fields
+
 import pytest
 from src.modes.mode_profile import (
     ModeProfile,
     EXECUTION,
     PLANNING,
     BRAINSTORMING,
+    PROFILES,
     get_profile,
 )
 
@@ -169,3 +172,17 @@ class TestPredefinedProfiles:
         """Test get_profile raises error for unknown mode."""
         with pytest.raises(ValueError, match="Unknown mode: invalid"):
             get_profile("invalid")
+
+    def test_profiles_are_slotted_and_registry_read_only(self):
+        """Test profiles carry no __dict__ and the registry rejects writes."""
+        assert not hasattr(EXECUTION, "__dict__")
+        with pytest.raises(TypeError):
+            PROFILES["execution"] = PLANNING
+
+    def test_predefined_profiles_pass_validation(self):
+        """Test unchecked predefined profiles equal validated constructions."""
+        for profile in PROFILES.values():
+            rebuilt = ModeProfile(
+                **{f.name: getattr(profile, f.name) for f in fields(profile)}
+            )
+            assert rebuilt == profile
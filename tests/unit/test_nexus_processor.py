@@ -10,19 +10,37 @@ Tests the 5.5-step SOP pipeline:
 5. Compress - Curated core pattern
 """
 
+import threading
+import time
+
+import numpy as np
 import pytest
+from typing import Any, Dict, List, Optional
 from unittest.mock import Mock
+from src.nexus import processor as processor_module
 from src.nexus.processor import NexusProcessor
+from tests.unit._nasa_util import check_class_rule10
 
 
-class TestNexusProcessor:
-    """Test suite for NexusProcessor class."""
+# Shared compression inputs, built once per module (strings are immutable)
+_CHUNK_TEXTS = tuple(f"chunk {i}" for i in range(100))
+_TEN_WORD_TEXT = " ".join(f"word{j}" for j in range(10))
+_HUNDRED_WORD_TEXT = " ".join(f"word{j}" for j in range(100))
 
-    @pytest.fixture
-    def mock_vector_indexer(self):
-        """Mock VectorIndexer."""
-        indexer = Mock()
-        indexer.search_similar.return_value = [
+
+def _orthogonal_rows(texts: List[str]) -> np.ndarray:
+    """One (N, d) float32 batch of orthogonal rows."""
+    return np.eye(len(texts), max(len(texts), 3), dtype=np.float32)
+
+
+class StubVectorIndexer:
+    """VectorIndexer stub: search_similar() returns the canned results."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.results = [
             {
                 "document": "Test chunk 1",
                 "distance": 0.2,  # similarity = 0.8
@@ -36,13 +54,19 @@ class TestNexusProcessor:
                 "id": "vec-2",
             },
         ]
-        return indexer
 
-    @pytest.fixture
-    def mock_graph_query_engine(self):
-        """Mock GraphQueryEngine."""
-        engine = Mock()
-        engine.retrieve_multi_hop.return_value = [
+    def search_similar(self, query_embedding: Any, top_k: int) -> List[Dict]:
+        return self.results
+
+
+class StubGraphQueryEngine:
+    """GraphQueryEngine stub: retrieve_multi_hop() returns the canned results."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.results = [
             {
                 "text": "Graph chunk 1",
                 "ppr_score": 0.9,
@@ -56,42 +80,84 @@ class TestNexusProcessor:
                 "chunk_id": "graph-2",
             },
         ]
-        return engine
 
-    @pytest.fixture
-    def mock_probabilistic_query_engine(self):
-        """Mock ProbabilisticQueryEngine."""
-        engine = Mock()
-        engine.query_conditional.return_value = {
-            "results": {"var1": {0: 0.7, 1: 0.3, "entropy": 0.88}}
-        }
-        return engine
+    def retrieve_multi_hop(self, query: str, top_k: int, max_hops: int) -> List[Dict]:
+        return self.results
 
-    @pytest.fixture
-    def mock_embedding_pipeline(self):
-        """Mock EmbeddingPipeline returning N distinct orthogonal embeddings for N texts."""
-        pipeline = Mock()
-        pipeline.encode.side_effect = lambda texts: [
-            [1.0 if j == i else 0.0 for j in range(max(len(texts), 3))]
-            for i in range(len(texts))
-        ]
-        return pipeline
 
-    @pytest.fixture
-    def processor(
-        self,
-        mock_vector_indexer,
-        mock_graph_query_engine,
-        mock_probabilistic_query_engine,
-        mock_embedding_pipeline,
-    ):
-        """Create NexusProcessor with mocked dependencies."""
-        return NexusProcessor(
-            vector_indexer=mock_vector_indexer,
-            graph_query_engine=mock_graph_query_engine,
-            probabilistic_query_engine=mock_probabilistic_query_engine,
-            embedding_pipeline=mock_embedding_pipeline,
-        )
+class StubProbabilisticQueryEngine:
+    """ProbabilisticQueryEngine stub: query_conditional() returns the result."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.result = {"results": {"var1": {0: 0.7, 1: 0.3, "entropy": 0.88}}}
+
+    def query_conditional(self, **kwargs: Any) -> Optional[Dict]:
+        return self.result
+
+
+class StubEmbeddingPipeline:
+    """EmbeddingPipeline stub: encode() records each batch and applies encoder."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.encoder = _orthogonal_rows
+        self.calls: List[List[str]] = []
+
+    def encode(self, texts: List[str]) -> Any:
+        self.calls.append(list(texts))
+        return self.encoder(texts)
+
+
+@pytest.fixture(scope="module")
+def processor():
+    """Create NexusProcessor with stubbed tier services."""
+    processor = NexusProcessor(
+        vector_indexer=StubVectorIndexer(),
+        graph_query_engine=StubGraphQueryEngine(),
+        probabilistic_query_engine=StubProbabilisticQueryEngine(),
+        embedding_pipeline=StubEmbeddingPipeline(),
+    )
+    yield processor
+    processor.close()
+
+
+@pytest.fixture
+def make_processor():
+    """Factory for per-test NexusProcessors; their recall pools are closed."""
+    created: List[NexusProcessor] = []
+
+    def make(**kwargs: Any) -> NexusProcessor:
+        created.append(NexusProcessor(**kwargs))
+        return created[-1]
+
+    yield make
+    for processor in created:
+        processor.close()
+
+
+class TestNexusProcessor:
+    """Test suite for NexusProcessor class.
+
+    The stubs and processor are module-scoped. Tests patch processor
+    attributes through monkeypatch; _restore_shared_state resets the stubs
+    and empties the caches after every test.
+    """
+
+    @pytest.fixture(autouse=True)
+    def _restore_shared_state(self, processor):
+        """Reset stub reconfiguration and drop cached embeddings/results."""
+        yield
+        processor.vector_indexer.reset()
+        processor.graph_query_engine.reset()
+        processor.probabilistic_query_engine.reset()
+        processor.embedding_pipeline.reset()
+        processor._embedding_cache.clear()
+        processor.clear_result_cache()
 
     def test_initialization(self, processor):
         """Test processor initialization."""
@@ -112,7 +178,135 @@ class TestNexusProcessor:
         assert "hipporag" in tiers
         # Bayesian may be None (timeout), so optional
 
-    def test_bayesian_var_state_rows_never_appear_in_results(self, processor):
+    def test_process_reuses_recent_result(self, processor):
+        """Test a repeated request is served from the result cache."""
+        first = processor.process("test query", mode="planning")
+        encodes = len(processor.embedding_pipeline.calls)
+        second = processor.process("test query", mode="planning")
+
+        assert len(processor.embedding_pipeline.calls) == encodes
+        assert second["pipeline_stats"] == {"cache_hit": True}
+        assert second["core"] == first["core"]
+        second["core"][0]["score"] = -1.0
+        assert processor.process("test query", mode="planning")["core"] == first["core"]
+
+    def test_process_result_cache_expires(self, processor, monkeypatch):
+        """Test cached results are not reused past their TTL."""
+        monkeypatch.setattr(processor_module, "RESULT_CACHE_TTL_SECONDS", 0.0)
+
+        processor.process("test query")
+        result = processor.process("test query")
+
+        assert "cache_hit" not in result["pipeline_stats"]
+
+    def test_memory_store_then_search_sees_new_memory(self, processor):
+        """Test a memory stored within the result-cache TTL is searchable."""
+        from src.mcp.request_router import handle_memory_store
+        from src.mcp.service_wiring import NexusSearchTool
+
+        def ingest(text: str, metadata: Dict, source: str) -> Dict:
+            processor.vector_indexer.results.append(
+                {
+                    "document": text,
+                    "distance": 0.05,
+                    "metadata": {"file_path": "/docs/new.md"},
+                    "id": "vec-new",
+                }
+            )
+            return {"success": True, "metadata": metadata, "chunk_ids": ["vec-new"]}
+
+        tool = NexusSearchTool.__new__(NexusSearchTool)
+        tool.__dict__.update(
+            config={},
+            _nexus_processor=processor,
+            _ingestion_service=Mock(ingest=ingest),
+        )
+        processor.process("test query")
+
+        stored = handle_memory_store(
+            {
+                "text": "Freshly stored memory",
+                "metadata": {
+                    "who": "test-agent",
+                    "when": "2026-01-13T12:00:00",
+                    "project": "test-project",
+                    "why": "testing",
+                },
+            },
+            tool,
+        )
+        result = processor.process("test query")
+
+        assert stored["isError"] is False
+        assert "cache_hit" not in result["pipeline_stats"]
+        texts = [c["text"] for c in result["core"] + result["extended"]]
+        assert "Freshly stored memory" in texts
+
+    def test_recall_bounds_each_tier_to_top_k(self, processor, monkeypatch):
+        """Test a tier that over-returns is cut to its top_k best scores."""
+        rows = [
+            {"text": f"g{i}", "score": (i % 7) / 7, "tier": "hipporag", "id": f"g{i}"}
+            for i in range(30)
+        ]
+        monkeypatch.setattr(processor, "_query_hipporag_tier", lambda q, k: list(rows))
+
+        results = processor.recall("test query", top_k=5)
+
+        graph = [r for r in results if r["tier"] == "hipporag"]
+        assert [r["id"] for r in graph] == ["g6", "g13", "g20", "g27", "g5"]
+
+    def test_recall_skips_slow_bayesian_tier(self, processor, monkeypatch):
+        """Test recall returns the other tiers when Bayesian exceeds its wait."""
+        gate = threading.Event()
+        monkeypatch.setattr(processor_module, "RECALL_BAYESIAN_TIMEOUT_S", 0.05)
+        monkeypatch.setattr(
+            processor, "_query_bayesian_tier", lambda q, k: gate.wait(5) and []
+        )
+
+        try:
+            results = processor.recall("test query", top_k=10)
+        finally:
+            gate.set()
+
+        tiers = set(r["tier"] for r in results)
+        assert tiers == {"vector", "hipporag"}
+
+    def test_bayesian_stragglers_do_not_block_fast_tiers(self, processor, monkeypatch):
+        """Test abandoned Bayesian queries never hold vector/HippoRAG workers."""
+        gate = threading.Event()
+        monkeypatch.setattr(processor_module, "RECALL_BAYESIAN_TIMEOUT_S", 0.05)
+        monkeypatch.setattr(
+            processor, "_query_bayesian_tier", lambda q, k: gate.wait(5) and []
+        )
+
+        start = time.perf_counter()
+        try:
+            # Saturate the Bayesian pool, then recall once more with it full
+            for _ in range(processor_module.BAYESIAN_POOL_WORKERS + 1):
+                results = processor.recall("test query", top_k=10)
+                assert {r["tier"] for r in results} == {"vector", "hipporag"}
+        finally:
+            gate.set()
+
+        assert time.perf_counter() - start < 2.0
+
+    def test_close_releases_recall_workers(self):
+        """Test close() is idempotent and recall is unavailable afterwards."""
+        owned = NexusProcessor(
+            vector_indexer=StubVectorIndexer(),
+            graph_query_engine=StubGraphQueryEngine(),
+            probabilistic_query_engine=StubProbabilisticQueryEngine(),
+            embedding_pipeline=StubEmbeddingPipeline(),
+        )
+        owned.close()
+        owned.close()
+
+        with pytest.raises(RuntimeError):
+            owned.recall("test query")
+
+    def test_bayesian_var_state_rows_never_appear_in_results(
+        self, processor, monkeypatch
+    ):
         """D7: Bayesian VAR=state rows contribute signal through recall/fusion
         but must never surface as document results."""
         real_doc = {
@@ -130,9 +324,13 @@ class TestNexusProcessor:
             "metadata": {"variable": "Tesla", "state": "true"},
         }
 
-        processor._query_vector_tier = lambda q, k: [dict(real_doc)]
-        processor._query_hipporag_tier = lambda q, k: []
-        processor._query_bayesian_tier = lambda q, k: [dict(bayes_row)]
+        monkeypatch.setattr(
+            processor, "_query_vector_tier", lambda q, k: [dict(real_doc)]
+        )
+        monkeypatch.setattr(processor, "_query_hipporag_tier", lambda q, k: [])
+        monkeypatch.setattr(
+            processor, "_query_bayesian_tier", lambda q, k: [dict(bayes_row)]
+        )
 
         # The Bayesian row contributes to recall (signal present).
         recalled = processor.recall("Tesla")
@@ -146,7 +344,7 @@ class TestNexusProcessor:
         # The real document is still returned (not over-filtered).
         assert any(d.get("id") == "doc1" for d in docs)
 
-    def test_real_doc_with_bayesian_id_survives(self, processor):
+    def test_real_doc_with_bayesian_id_survives(self, processor, monkeypatch):
         """D7: ids are caller-stable data, not a reserved namespace. A real
         document recalled from the vector tier whose id happens to start with
         'bayesian_' is NOT a pseudo-row (source_tiers == ['vector'], no
@@ -159,16 +357,18 @@ class TestNexusProcessor:
             "id": "bayesian_real_doc",
             "metadata": {},
         }
-        processor._query_vector_tier = lambda q, k: [dict(real_doc)]
-        processor._query_hipporag_tier = lambda q, k: []
-        processor._query_bayesian_tier = lambda q, k: []
+        monkeypatch.setattr(
+            processor, "_query_vector_tier", lambda q, k: [dict(real_doc)]
+        )
+        monkeypatch.setattr(processor, "_query_hipporag_tier", lambda q, k: [])
+        monkeypatch.setattr(processor, "_query_bayesian_tier", lambda q, k: [])
 
         result = processor.process(query="bayesian", mode="execution", top_k=10)
         docs = result["core"] + result["extended"]
         assert any(d.get("id") == "bayesian_real_doc" for d in docs)
         assert "Bayesian methods explained" in [d.get("text", "") for d in docs]
 
-    def test_pseudo_docs_filtered_before_rerank(self, processor):
+    def test_pseudo_docs_filtered_before_rerank(self, processor, monkeypatch):
         """D7: pseudo-rows are not documents, so they must be removed AFTER rank
         and BEFORE rerank - otherwise they consume rerank slots and distort the
         reranker's stats/scoring. Assert the reranker never sees the pseudo-row."""
@@ -186,9 +386,13 @@ class TestNexusProcessor:
             "id": "bayesian_Tesla_true",
             "metadata": {"variable": "Tesla", "state": "true"},
         }
-        processor._query_vector_tier = lambda q, k: [dict(real_doc)]
-        processor._query_hipporag_tier = lambda q, k: []
-        processor._query_bayesian_tier = lambda q, k: [dict(bayes_row)]
+        monkeypatch.setattr(
+            processor, "_query_vector_tier", lambda q, k: [dict(real_doc)]
+        )
+        monkeypatch.setattr(processor, "_query_hipporag_tier", lambda q, k: [])
+        monkeypatch.setattr(
+            processor, "_query_bayesian_tier", lambda q, k: [dict(bayes_row)]
+        )
 
         seen = {}
 
@@ -200,8 +404,8 @@ class TestNexusProcessor:
             def merge_scores(self, reranked, hybrid_weight, rerank_weight):
                 return reranked
 
-        processor.reranker = FakeReranker()
-        processor.rerank_enabled = True
+        monkeypatch.setattr(processor, "reranker", FakeReranker())
+        monkeypatch.setattr(processor, "rerank_enabled", True)
 
         processor.process(query="Tesla", mode="execution", top_k=10)
 
@@ -284,6 +488,10 @@ class TestNexusProcessor:
 
         # Should keep first occurrence of duplicate
         assert len(deduplicated) == 2
+        # Survivors of the exact-duplicate pass are embedded in one batch
+        assert processor.embedding_pipeline.calls == [
+            ["this is a test", "completely different content"]
+        ]
         assert deduplicated[0]["text"] == "this is a test"
         assert deduplicated[1]["text"] == "completely different content"
 
@@ -327,7 +535,7 @@ class TestNexusProcessor:
     def test_compress_execution_mode(self, processor):
         """Test compression in execution mode (5 core + 0 extended)."""
         ranked_results = [
-            {"text": f"chunk {i}", "score": 1.0 - i * 0.1} for i in range(10)
+            {"text": _CHUNK_TEXTS[i], "score": 1.0 - i * 0.1} for i in range(10)
         ]
 
         result = processor.compress(
@@ -341,7 +549,7 @@ class TestNexusProcessor:
     def test_compress_planning_mode(self, processor):
         """Test compression in planning mode (5 core + 15 extended)."""
         ranked_results = [
-            {"text": f"chunk {i}", "score": 1.0 - i * 0.05} for i in range(30)
+            {"text": _CHUNK_TEXTS[i], "score": 1.0 - i * 0.05} for i in range(30)
         ]
 
         result = processor.compress(ranked_results, mode="planning", token_budget=10000)
@@ -353,7 +561,7 @@ class TestNexusProcessor:
     def test_compress_brainstorming_mode(self, processor):
         """Test compression in brainstorming mode (5 core + 25 extended)."""
         ranked_results = [
-            {"text": f"chunk {i}", "score": 1.0 - i * 0.03} for i in range(40)
+            {"text": _CHUNK_TEXTS[i], "score": 1.0 - i * 0.03} for i in range(40)
         ]
 
         result = processor.compress(
@@ -368,8 +576,7 @@ class TestNexusProcessor:
         """Test token budget truncates extended results."""
         # Create chunks with known token counts (10 tokens each)
         ranked_results = [
-            {"text": " ".join([f"word{j}" for j in range(10)]), "score": 1.0 - i * 0.05}
-            for i in range(30)
+            {"text": _TEN_WORD_TEXT, "score": 1.0 - i * 0.05} for i in range(30)
         ]
 
         # Set token budget to allow only core (5 chunks * 10 tokens = 50 tokens)
@@ -382,12 +589,41 @@ class TestNexusProcessor:
         assert len(result["extended"]) <= 1
         assert result["token_count"] <= 60
 
+    @pytest.mark.parametrize("token_budget", [40, 55])
+    def test_token_budget_drops_extended_when_none_fits(self, processor, token_budget):
+        """Test extended is emptied, not passed through, when nothing fits."""
+        ranked_results = [
+            {"text": _TEN_WORD_TEXT, "score": 1.0 - i * 0.05} for i in range(30)
+        ]
+
+        result = processor.compress(
+            ranked_results, mode="planning", token_budget=token_budget
+        )
+
+        assert len(result["core"]) == 5
+        assert result["extended"] == []
+        assert result["token_count"] == 50
+
+    def test_token_budget_keeps_longest_fitting_prefix(self, processor):
+        """Test extended stops at the first result that overflows the budget."""
+        lengths = [1] * 5 + [3, 4, 2, 1, 5]
+        ranked_results = [
+            {"text": " ".join(["w"] * n), "score": 1.0 - i * 0.05}
+            for i, n in enumerate(lengths)
+        ]
+
+        result = processor.compress(ranked_results, mode="planning", token_budget=14)
+
+        # 5 core + 3 + 4 = 12; adding 2 -> 14 fits; adding 1 -> 15 overflows
+        assert len(result["extended"]) == 3
+        assert result["token_count"] == 14
+
     def test_empty_results(self, processor):
         """Test handling of empty results."""
         # Mock empty results from all tiers
-        processor.vector_indexer.search_similar.return_value = []
-        processor.graph_query_engine.retrieve_multi_hop.return_value = []
-        processor.probabilistic_query_engine.query_conditional.return_value = None
+        processor.vector_indexer.results = []
+        processor.graph_query_engine.results = []
+        processor.probabilistic_query_engine.result = None
 
         result = processor.process("test query")
 
@@ -398,7 +634,7 @@ class TestNexusProcessor:
     def test_single_tier_results(self, processor):
         """Test when one tier returns empty."""
         # Mock graph tier returning empty
-        processor.graph_query_engine.retrieve_multi_hop.return_value = []
+        processor.graph_query_engine.results = []
 
         results = processor.recall("test query", top_k=10)
 
@@ -419,10 +655,7 @@ class TestNexusProcessor:
 
     def test_compression_ratio(self, processor):
         """Test compression ratio calculation."""
-        ranked_results = [
-            {"text": " ".join([f"word{j}" for j in range(100)]), "score": 0.9}
-            for i in range(50)
-        ]
+        ranked_results = [{"text": _HUNDRED_WORD_TEXT, "score": 0.9} for i in range(50)]
 
         result = processor.compress(
             ranked_results, mode="execution", token_budget=10000
@@ -434,7 +667,7 @@ class TestNexusProcessor:
 
     def test_mode_invalid(self, processor):
         """Test default to execution mode for invalid mode."""
-        ranked_results = [{"text": f"chunk {i}", "score": 1.0} for i in range(10)]
+        ranked_results = [{"text": _CHUNK_TEXTS[i], "score": 1.0} for i in range(10)]
 
         result = processor.compress(
             ranked_results, mode="invalid_mode", token_budget=10000
@@ -469,6 +702,55 @@ class TestNexusProcessor:
         # All chunks should remain (similarity <0.95)
         assert len(deduplicated) == 3
 
+    def test_dedup_single_unique_text_skips_encoding(self, processor):
+        """Test exact duplicates of one text never reach the embedder."""
+        candidates = [
+            {"text": "same", "score": s, "tier": "vector"} for s in (0.9, 0.5)
+        ]
+
+        assert processor.deduplicate(candidates) == [candidates[0]]
+        assert processor.embedding_pipeline.calls == []
+
+    def test_dedup_embeddings_reused_across_calls(self, processor):
+        """Test only unseen texts reach encode() on later dedup calls."""
+        first = [{"text": t, "score": 0.5, "tier": "vector"} for t in ("a", "b")]
+        second = [{"text": t, "score": 0.5, "tier": "vector"} for t in ("b", "c")]
+
+        processor.deduplicate(first)
+        processor.deduplicate(second)
+
+        assert processor.embedding_pipeline.calls == [["a", "b"], ["c"]]
+
+    def test_embedding_cache_evicts_least_recently_used(self, processor, monkeypatch):
+        """Test the embedding cache stays within embedding_cache_size."""
+        monkeypatch.setattr(processor, "embedding_cache_size", 2)
+
+        processor._encode_cached(["a", "b"])
+        processor._encode_cached(["a"])  # refreshes "a"
+        processor._encode_cached(["c"])  # evicts "b"
+        processor._encode_cached(["a", "b"])
+
+        assert processor.embedding_pipeline.calls == [["a", "b"], ["c"], ["b"]]
+
+    def test_text_cosine_encodes_both_texts_in_one_batch(self, processor):
+        """Test pairwise text similarity makes a single encode() call."""
+        assert processor._calculate_cosine_similarity("alpha", "beta") == 0.0
+        assert processor.embedding_pipeline.calls == [["alpha", "beta"]]
+
+    def test_near_duplicates_compared_against_kept_only(self, processor):
+        """Test greedy keep-first: a dropped chunk cannot knock out later ones."""
+        processor.embedding_pipeline.encoder = lambda texts: [
+            [1.0, 0.0],  # a
+            [0.99, 0.14],  # b: ~0.99 to a -> dropped
+            [0.9, 0.436],  # c: ~0.95 to b, ~0.90 to a -> kept
+            [0.0, 0.0],  # d: zero vector never matches
+        ]
+        candidates = [{"text": t, "score": 0.5, "tier": "vector"} for t in "abcd"]
+
+        deduplicated = processor.deduplicate(candidates)
+
+        assert [c["text"] for c in deduplicated] == ["a", "c", "d"]
+
 
 class TestNexusProcessorRerank:
     """MEM-QWEN-003: Tests for Step 4.5 reranker integration."""
@@ -499,12 +781,11 @@ class TestNexusProcessorRerank:
 
     @pytest.fixture
     def mock_embedding_pipeline(self):
-        """Mock EmbeddingPipeline returning N distinct orthogonal embeddings for N texts."""
+        """Mock EmbeddingPipeline: one (N, d) float32 batch of orthogonal rows."""
         pipeline = Mock()
-        pipeline.encode.side_effect = lambda texts: [
-            [1.0 if j == i else 0.0 for j in range(max(len(texts), 3))]
-            for i in range(len(texts))
-        ]
+        pipeline.encode.side_effect = lambda texts: np.eye(
+            len(texts), max(len(texts), 3), dtype=np.float32
+        )
         return pipeline
 
     @pytest.fixture
@@ -543,7 +824,7 @@ class TestNexusProcessorRerank:
         mock_reranker,
     ):
         """Create NexusProcessor with reranker."""
-        return NexusProcessor(
+        processor = NexusProcessor(
             vector_indexer=mock_vector_indexer,
             graph_query_engine=mock_graph_query_engine,
             probabilistic_query_engine=mock_probabilistic_query_engine,
@@ -551,6 +832,8 @@ class TestNexusProcessorRerank:
             reranker=mock_reranker,
             rerank_enabled=True,
         )
+        yield processor
+        processor.close()
 
     @pytest.fixture
     def processor_without_reranker(
@@ -561,7 +844,7 @@ class TestNexusProcessorRerank:
         mock_embedding_pipeline,
     ):
         """Create NexusProcessor without reranker."""
-        return NexusProcessor(
+        processor = NexusProcessor(
             vector_indexer=mock_vector_indexer,
             graph_query_engine=mock_graph_query_engine,
             probabilistic_query_engine=mock_probabilistic_query_engine,
@@ -569,6 +852,8 @@ class TestNexusProcessorRerank:
             reranker=None,
             rerank_enabled=False,
         )
+        yield processor
+        processor.close()
 
     def test_initialization_with_reranker(self, processor_with_reranker, mock_reranker):
         """Test processor initializes with reranker."""
@@ -588,9 +873,10 @@ class TestNexusProcessorRerank:
         mock_probabilistic_query_engine,
         mock_embedding_pipeline,
         mock_reranker,
+        make_processor,
     ):
         """Test custom rerank_top_k parameter."""
-        processor = NexusProcessor(
+        processor = make_processor(
             vector_indexer=mock_vector_indexer,
             graph_query_engine=mock_graph_query_engine,
             probabilistic_query_engine=mock_probabilistic_query_engine,
@@ -636,6 +922,7 @@ class TestNexusProcessorRerank:
         mock_graph_query_engine,
         mock_probabilistic_query_engine,
         mock_embedding_pipeline,
+        make_processor,
     ):
         """Test rerank_top_k limits documents sent to reranker."""
         # Create mock reranker that tracks input count
@@ -651,7 +938,7 @@ class TestNexusProcessorRerank:
         reranker.rerank.side_effect = track_input
         reranker.merge_scores.return_value = []
 
-        processor = NexusProcessor(
+        processor = make_processor(
             vector_indexer=mock_vector_indexer,
             graph_query_engine=mock_graph_query_engine,
             probabilistic_query_engine=mock_probabilistic_query_engine,
@@ -667,7 +954,7 @@ class TestNexusProcessorRerank:
         assert len(input_counts) == 1
         assert input_counts[0] <= 10
 
-    def test_process_uses_rlm_adapter(self):
+    def test_process_uses_rlm_adapter(self, make_processor):
         """Test RLM adapter bypasses standard pipeline when enabled."""
         adapter = Mock()
         adapter.explore.return_value = {
@@ -679,7 +966,7 @@ class TestNexusProcessorRerank:
             "rlm_stats": {},
         }
 
-        processor = NexusProcessor(rlm_adapter=adapter)
+        processor = make_processor(rlm_adapter=adapter)
         result = processor.process("test query", use_rlm=True)
 
         adapter.explore.assert_called_once()
@@ -706,9 +993,10 @@ class TestNexusProcessorRerank:
         mock_probabilistic_query_engine,
         mock_embedding_pipeline,
         mock_reranker,
+        make_processor,
     ):
         """Test reranker is skipped when rerank_enabled=False even with reranker present."""
-        processor = NexusProcessor(
+        processor = make_processor(
             vector_indexer=mock_vector_indexer,
             graph_query_engine=mock_graph_query_engine,
             probabilistic_query_engine=mock_probabilistic_query_engine,
@@ -725,24 +1013,7 @@ class TestNexusProcessorRerank:
 
 def test_nasa_rule_10_compliance():
     """Test all methods ≤60 LOC."""
-    import ast
-    import inspect
-    from src.nexus.processor import NexusProcessor
-
-    # Get source code
-    source = inspect.getsource(NexusProcessor)
-    tree = ast.parse(source)
-
-    # Find all methods
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef):
-            # Calculate LOC
-            length = node.end_lineno - node.lineno + 1
-
-            # Check NASA Rule 10 (≤60 LOC)
-            assert (
-                length <= 60
-            ), f"Method {node.name} has {length} LOC (violates NASA Rule 10: ≤60 LOC)"
+    check_class_rule10(NexusProcessor)
 
 
 class TestLostInMiddleMitigation:
@@ -753,7 +1024,11 @@ class TestLostInMiddleMitigation:
         """Create a basic processor for testing mitigation."""
         from src.nexus.processing_utils import LostInMiddleMitigation
 
-        return NexusProcessor(lost_in_middle_mitigation=LostInMiddleMitigation.EDGES)
+        processor = NexusProcessor(
+            lost_in_middle_mitigation=LostInMiddleMitigation.EDGES
+        )
+        yield processor
+        processor.close()
 
     @pytest.fixture
     def sample_results(self):
@@ -924,7 +1199,7 @@ class TestLostInMiddleMitigation:
         weights = processor.get_position_weights(0)
         assert weights == []
 
-    def test_mitigation_in_process_pipeline(self):
+    def test_mitigation_in_process_pipeline(self, make_processor):
         """Test mitigation is applied in full process pipeline."""
         from src.nexus.processing_utils import LostInMiddleMitigation
         from unittest.mock import Mock
@@ -942,7 +1217,7 @@ class TestLostInMiddleMitigation:
         mock_bayesian = Mock()
         mock_bayesian.query_conditional.return_value = None
 
-        processor = NexusProcessor(
+        processor = make_processor(
             vector_indexer=mock_vector,
             graph_query_engine=mock_graph,
             probabilistic_query_engine=mock_bayesian,
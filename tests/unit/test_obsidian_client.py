@@ -4,33 +4,49 @@ Tests for ObsidianMCPClient (Week 7)
 Tests portable vault synchronization.
 """
 
+import shutil
+
 import pytest
 from src.mcp.obsidian_client import ObsidianMCPClient
 
 
-@pytest.fixture
-def mock_vault(tmp_path):
-    """Create mock Obsidian vault."""
-    vault = tmp_path / "vault"
-    vault.mkdir()
+MOCK_VAULT_FILES = {
+    "note1.md": b"# Note 1\nContent of note 1",
+    "note2.md": b"# Note 2\nContent of note 2",
+    "subfolder/note3.md": b"# Note 3\nNested note",
+}
 
-    # Create test files
-    (vault / "note1.md").write_text("# Note 1\nContent of note 1")
-    (vault / "note2.md").write_text("# Note 2\nContent of note 2")
 
-    subdir = vault / "subfolder"
-    subdir.mkdir()
-    (subdir / "note3.md").write_text("# Note 3\nNested note")
+@pytest.fixture(scope="module")
+def mock_vault(tmp_path_factory):
+    """Create mock Obsidian vault (once per module; treat as read-only)."""
+    vault = tmp_path_factory.mktemp("obsidian") / "vault"
+    for rel_path, content in MOCK_VAULT_FILES.items():
+        note = vault / rel_path
+        note.parent.mkdir(parents=True, exist_ok=True)
+        note.write_bytes(content)
 
     return vault
 
 
 @pytest.fixture
+def mutable_vault(mock_vault, tmp_path):
+    """Private copy of the mock vault for tests that write into it."""
+    return shutil.copytree(mock_vault, tmp_path / "vault")
+
+
+@pytest.fixture(scope="module")
 def client(mock_vault):
-    """Obsidian MCP client instance."""
+    """Obsidian MCP client instance over the shared read-only vault."""
     return ObsidianMCPClient(vault_path=str(mock_vault))
 
 
+@pytest.fixture
+def mutable_client(mutable_vault):
+    """Obsidian MCP client instance over a private vault copy."""
+    return ObsidianMCPClient(vault_path=str(mutable_vault))
+
+
 def test_client_initialization(mock_vault):
     """Test client initializes correctly."""
     client = ObsidianMCPClient(vault_path=str(mock_vault))
@@ -49,12 +65,12 @@ def test_sync_vault(client):
     assert result["errors"] == []
 
 
-def test_sync_vault_with_file_extensions(client, mock_vault):
+def test_sync_vault_with_file_extensions(mutable_client, mutable_vault):
     """Test syncing with specific file extensions."""
     # Create a non-md file
-    (mock_vault / "config.json").write_text('{"key": "value"}')
+    (mutable_vault / "config.json").write_text('{"key": "value"}')
 
-    result = client.sync_vault(file_extensions=[".md"])
+    result = mutable_client.sync_vault(file_extensions=[".md"])
 
     assert result["files_synced"] == 3  # Only .md files
 
@@ -70,7 +86,7 @@ def test_get_vault_stats(client):
     assert stats["last_modified"] is not None
 
 
-def test_export_to_vault(client, mock_vault):
+def test_export_to_vault(mutable_client, mutable_vault):
     """Test exporting memories to vault."""
     chunks = [
         {
@@ -83,13 +99,13 @@ def test_export_to_vault(client, mock_vault):
         },
     ]
 
-    result = client.export_to_vault(chunks, "exported.md")
+    result = mutable_client.export_to_vault(chunks, "exported.md")
 
     assert result["success"] is True
     assert result["chunks_exported"] == 2
 
     # Verify file was created
-    exported_file = mock_vault / "exported.md"
+    exported_file = mutable_vault / "exported.md"
     assert exported_file.exists()
 
     content = exported_file.read_text()
@@ -97,9 +113,9 @@ def test_export_to_vault(client, mock_vault):
     assert "Memory 2" in content
 
 
-def test_export_to_vault_empty_chunks(client):
+def test_export_to_vault_empty_chunks(mutable_client):
     """Test exporting empty chunk list."""
-    result = client.export_to_vault([])
+    result = mutable_client.export_to_vault([])
 
     assert result["success"] is True
     assert result["chunks_exported"] == 0
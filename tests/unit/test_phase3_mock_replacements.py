@@ -7,13 +7,36 @@ Tests that mock implementations have been replaced with real code:
 - B1.6: Bayesian CPD uses informed estimation (not random.choice)
 """
 
-import sys
-from pathlib import Path
 import pytest
 import inspect
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+SEMANTIC_CHUNKER_PY = "src/chunking/semantic_chunker.py"
+OBSIDIAN_CLIENT_PY = "src/mcp/obsidian_client.py"
+NETWORK_BUILDER_PY = "src/bayesian/network_builder.py"
+
+
+@pytest.fixture(scope="session")
+def src_cache():
+    """Method sources and full-file sources, read once per session.
+
+    inspect.getsource goes through linecache, so each file is read from disk
+    once and both the method and whole-module entries share those lines.
+    """
+    from src.bayesian import network_builder
+    from src.chunking import semantic_chunker
+    from src.mcp import obsidian_client
+
+    methods = (
+        semantic_chunker.SemanticChunker._split_into_chunks,
+        obsidian_client.ObsidianMCPClient._sync_file,
+        network_builder.NetworkBuilder.estimate_cpds,
+        network_builder.NetworkBuilder._generate_informed_data,
+    )
+    cache = {method.__qualname__: inspect.getsource(method) for method in methods}
+    cache[SEMANTIC_CHUNKER_PY] = inspect.getsource(semantic_chunker)
+    cache[OBSIDIAN_CLIENT_PY] = inspect.getsource(obsidian_client)
+    cache[NETWORK_BUILDER_PY] = inspect.getsource(network_builder)
+    return cache
 
 
 class TestSemanticChunkerRealImplementation:
@@ -48,11 +71,9 @@ class TestSemanticChunkerRealImplementation:
         ), "Missing boundary detection"
         assert hasattr(chunker, "_merge_sentences_into_chunks"), "Missing chunk merger"
 
-    def test_no_todo_in_split_chunks(self):
+    def test_no_todo_in_split_chunks(self, src_cache):
         """Verify TODO comment has been removed from _split_into_chunks."""
-        from src.chunking.semantic_chunker import SemanticChunker
-
-        source = inspect.getsource(SemanticChunker._split_into_chunks)
+        source = src_cache["SemanticChunker._split_into_chunks"]
 
         # The old TODO should be gone
         assert (
@@ -97,11 +118,9 @@ class TestObsidianClientRealImplementation:
         assert hasattr(obsidian_client, "_get_embedder"), "Missing embedder loader"
         assert hasattr(obsidian_client, "_get_indexer"), "Missing indexer loader"
 
-    def test_sync_file_uses_real_chunker(self):
+    def test_sync_file_uses_real_chunker(self, src_cache):
         """Verify _sync_file method uses real chunker, not mock."""
-        from src.mcp.obsidian_client import ObsidianMCPClient
-
-        source = inspect.getsource(ObsidianMCPClient._sync_file)
+        source = src_cache["ObsidianMCPClient._sync_file"]
 
         # Check for real implementation markers
         assert "_get_chunker()" in source, "Not using real chunker"
@@ -129,23 +148,19 @@ class TestBayesianCPDRealImplementation:
             builder, "_generate_informed_data"
         ), "Missing informed data generator"
 
-    def test_no_random_choice_in_estimate_cpds(self):
+    def test_no_random_choice_in_estimate_cpds(self, src_cache):
         """Verify random.choice is not used in CPD estimation."""
-        from src.bayesian.network_builder import NetworkBuilder
-
         # Check estimate_cpds source
-        source = inspect.getsource(NetworkBuilder.estimate_cpds)
+        source = src_cache["NetworkBuilder.estimate_cpds"]
 
         # Should NOT have random.choice in the main method
         assert (
             "random.choice" not in source
         ), "estimate_cpds still uses random.choice - not replaced with informed estimation"
 
-    def test_informed_data_uses_graph_structure(self):
+    def test_informed_data_uses_graph_structure(self, src_cache):
         """Verify _generate_informed_data uses graph structure."""
-        from src.bayesian.network_builder import NetworkBuilder
-
-        source = inspect.getsource(NetworkBuilder._generate_informed_data)
+        source = src_cache["NetworkBuilder._generate_informed_data"]
 
         # Check for graph-aware generation
         assert (
@@ -160,26 +175,17 @@ class TestBayesianCPDRealImplementation:
 class TestMockCodeRemovalVerification:
     """Verify all specified mock code has been removed."""
 
-    def test_semantic_chunker_todo_removed(self):
+    def test_semantic_chunker_todo_removed(self, src_cache):
         """B2.1: Verify TODO removed from semantic_chunker.py line 116."""
-        chunker_path = (
-            Path(__file__).parent.parent.parent
-            / "src"
-            / "chunking"
-            / "semantic_chunker.py"
-        )
-        content = chunker_path.read_text(encoding="utf-8")
+        content = src_cache[SEMANTIC_CHUNKER_PY]
 
         assert (
             "TODO: Implement Max-Min semantic chunking" not in content
         ), "B2.1 TODO still present at line 116"
 
-    def test_obsidian_mock_removed(self):
+    def test_obsidian_mock_removed(self, src_cache):
         """B1.1: Verify mock return removed from obsidian_client.py line 167."""
-        obsidian_path = (
-            Path(__file__).parent.parent.parent / "src" / "mcp" / "obsidian_client.py"
-        )
-        content = obsidian_path.read_text(encoding="utf-8")
+        content = src_cache[OBSIDIAN_CLIENT_PY]
 
         assert (
             "For Week 7, we return mock success" not in content
@@ -189,31 +195,22 @@ class TestMockCodeRemovalVerification:
             "chunks = max(1, len(content) // 500)" not in content
         ), "B1.1 mock chunk estimation still present"
 
-    def test_bayesian_random_removed(self):
+    def test_bayesian_random_removed(self, src_cache):
         """B1.6: Verify random.choice removed from network_builder.py estimate_cpds."""
-        builder_path = (
-            Path(__file__).parent.parent.parent
-            / "src"
-            / "bayesian"
-            / "network_builder.py"
-        )
-        content = builder_path.read_text(encoding="utf-8")
+        content = src_cache[NETWORK_BUILDER_PY]
 
         # Check that the old pattern is gone from estimate_cpds
         # The old code had: row[node] = random.choice(states) in estimate_cpds
         # Now it's in _generate_informed_data but uses np.random with probabilities
 
-        # Read just the estimate_cpds method
-        import re
-
-        estimate_cpds_match = re.search(
-            r"def estimate_cpds\(.*?\n(?:.*?\n)*?(?=\n    def |\nclass |\Z)",
-            content,
-            re.MULTILINE,
-        )
-
-        if estimate_cpds_match:
-            estimate_cpds_content = estimate_cpds_match.group(0)
+        # Read just the estimate_cpds method: up to the next method or class
+        start = content.find("def estimate_cpds(")
+        if start != -1:
+            ends = (
+                content.find(marker, start) for marker in ("\n    def ", "\nclass ")
+            )
+            end = min((i for i in ends if i != -1), default=len(content))
+            estimate_cpds_content = content[start:end]
             assert (
                 "random.choice" not in estimate_cpds_content
             ), "B1.6 random.choice still in estimate_cpds method"
@@ -9,12 +9,12 @@ Tests:
   6. Tool registry includes detail param in vector_search schema
 """
 
-from datetime import datetime, timedelta
-from unittest.mock import MagicMock
+from datetime import datetime
 
 import pytest
 
 # Module under test
+from src.mcp import request_router
 from src.mcp.request_router import (
     _format_result_compact,
     _format_result_full,
@@ -80,66 +80,86 @@ class TestProgressiveDisclosure:
 # --- KVStore Date Filter Tests ---
 
 
+@pytest.fixture(scope="module")
+def shared_store():
+    """One in-memory KVStore (no file, no fsync) shared across the module."""
+    s = KVStore(":memory:")
+    yield s
+    s.close()
+
+
 class TestKVStoreDateFilters:
     """Test after/before filters on get_observations."""
 
     @pytest.fixture
-    def store(self, tmp_path):
-        db = str(tmp_path / "test_obs.db")
-        s = KVStore(db)
-        yield s
-        s.close()
-
-    def _insert_obs(self, store, created_at, content="test", project="proj"):
-        """Helper to insert an observation with a specific timestamp."""
-        obs = {
-            "observation_id": f"obs-{created_at}",
-            "session_id": "sess-1",
-            "obs_type": "tool_use",
-            "concept": "implementation",
-            "tool_name": "Read",
-            "content": content,
-            "metadata": "{}",
-            "who": "test",
-            "project": project,
-            "why": "testing",
-            "entities": "[]",
-            "created_at": created_at,
-        }
-        store.store_observation(obs)
+    def store(self, shared_store):
+        """The shared store with the observations table emptied."""
+        with shared_store._transaction() as cursor:
+            cursor.execute("DELETE FROM observations")
+        return shared_store
+
+    def _insert_obs(self, store, rows, project="proj"):
+        """Helper to insert (created_at, content) observations in one batch."""
+        assert store.store_observations(
+            {
+                "observation_id": f"obs-{created_at}",
+                "session_id": "sess-1",
+                "obs_type": "tool_use",
+                "concept": "implementation",
+                "tool_name": "Read",
+                "content": content,
+                "metadata": "{}",
+                "who": "test",
+                "project": project,
+                "why": "testing",
+                "entities": "[]",
+                "created_at": created_at,
+            }
+            for created_at, content in rows
+        )
 
     def test_after_filter(self, store):
-        self._insert_obs(store, "2026-02-04T10:00:00Z", "old")
-        self._insert_obs(store, "2026-02-05T10:00:00Z", "new")
+        self._insert_obs(
+            store,
+            [("2026-02-04T10:00:00Z", "old"), ("2026-02-05T10:00:00Z", "new")],
+        )
 
         results = store.get_observations(after="2026-02-05T00:00:00Z")
         assert len(results) == 1
         assert results[0]["content"] == "new"
 
     def test_before_filter(self, store):
-        self._insert_obs(store, "2026-02-04T10:00:00Z", "old")
-        self._insert_obs(store, "2026-02-05T10:00:00Z", "new")
+        self._insert_obs(
+            store,
+            [("2026-02-04T10:00:00Z", "old"), ("2026-02-05T10:00:00Z", "new")],
+        )
 
         results = store.get_observations(before="2026-02-04T23:59:59Z")
         assert len(results) == 1
         assert results[0]["content"] == "old"
 
     def test_after_and_before_combined(self, store):
-        self._insert_obs(store, "2026-02-03T10:00:00Z", "too-old")
-        self._insert_obs(store, "2026-02-04T10:00:00Z", "in-range")
-        self._insert_obs(store, "2026-02-05T10:00:00Z", "too-new")
+        days = [(3, "too-old"), (4, "in-range"), (5, "too-new")]
+        self._insert_obs(
+            store, [(f"2026-02-{day:02d}T10:00:00Z", tag) for day, tag in days]
+        )
 
         results = store.get_observations(
             after="2026-02-04T00:00:00Z",
             before="2026-02-04T23:59:59Z",
         )
+        assert {r["content"] for r in results} == {"in-range"}
         assert len(results) == 1
-        assert results[0]["content"] == "in-range"
 
     def test_no_filters_returns_all(self, store):
-        self._insert_obs(store, "2026-02-03T10:00:00Z", "a")
-        self._insert_obs(store, "2026-02-04T10:00:00Z", "b")
-        self._insert_obs(store, "2026-02-05T10:00:00Z", "c")
+        self._insert_obs(
+            store,
+            [
+                ("2026-02-03T10:00:00Z", "a"),
+                ("2026-02-04T10:00:00Z", "b"),
+                ("2026-02-05T10:00:00Z", "c"),
+            ],
+        )
 
         results = store.get_observations()
         assert len(results) == 3
@@ -148,32 +168,30 @@ class TestKVStoreDateFilters:
 # --- Tool Registry Tests ---
 
 
+@pytest.fixture(scope="module")
+def tools_by_name():
+    """Tool definitions built once and indexed by tool name."""
+    return {t["name"]: t for t in get_tool_definitions()}
+
+
 class TestToolRegistryPhase3:
     """Test that Phase 3 tool definitions are correct."""
 
-    def test_vector_search_has_detail_param(self):
-        tools = get_tool_definitions()
-        vs = next(t for t in tools if t["name"] == "vector_search")
-        props = vs["inputSchema"]["properties"]
+    def test_vector_search_has_detail_param(self, tools_by_name):
+        props = tools_by_name["vector_search"]["inputSchema"]["properties"]
         assert "detail" in props
         assert props["detail"]["enum"] == ["compact", "full"]
         assert props["detail"]["default"] == "full"
 
-    def test_unified_search_has_detail_param(self):
-        tools = get_tool_definitions()
-        us = next(t for t in tools if t["name"] == "unified_search")
-        props = us["inputSchema"]["properties"]
+    def test_unified_search_has_detail_param(self, tools_by_name):
+        props = tools_by_name["unified_search"]["inputSchema"]["properties"]
         assert "detail" in props
 
-    def test_observation_timeline_tool_exists(self):
-        tools = get_tool_definitions()
-        names = [t["name"] for t in tools]
-        assert "observation_timeline" in names
+    def test_observation_timeline_tool_exists(self, tools_by_name):
+        assert "observation_timeline" in tools_by_name
 
-    def test_observation_timeline_schema(self):
-        tools = get_tool_definitions()
-        ot = next(t for t in tools if t["name"] == "observation_timeline")
-        props = ot["inputSchema"]["properties"]
+    def test_observation_timeline_schema(self, tools_by_name):
+        props = tools_by_name["observation_timeline"]["inputSchema"]["properties"]
         assert "project" in props
         assert "obs_type" in props
         assert "session_id" in props
@@ -188,14 +206,39 @@ class TestToolRegistryPhase3:
 # --- Timeline Handler Tests ---
 
 
+class _StubKVStore:
+    """KVStore stand-in: returns canned observations, records the filters."""
+
+    def __init__(self, observations):
+        self._observations = observations
+        self.last_kwargs = None
+
+    def get_observations(self, **kwargs):
+        self.last_kwargs = kwargs
+        return self._observations
+
+
+class _StubTool:
+    """NexusSearchTool stand-in exposing only kv_store."""
+
+    def __init__(self, observations):
+        self.kv_store = _StubKVStore(observations)
+
+
+class _FixedUtcDatetime(datetime):
+    """datetime whose utcnow() is pinned, for exact cutoff assertions."""
+
+    @classmethod
+    def utcnow(cls):
+        return cls(2026, 2, 5, 12, 0, 0)
+
+
 class TestObservationTimeline:
     """Test the observation_timeline handler."""
 
     def _make_mock_tool(self, observations):
-        """Create a mock NexusSearchTool with kv_store.get_observations."""
-        tool = MagicMock()
-        tool.kv_store.get_observations.return_value = observations
-        return tool
+        """Create a stub NexusSearchTool with kv_store.get_observations."""
+        return _StubTool(observations)
 
     def test_empty_observations(self):
         tool = self._make_mock_tool([])
@@ -255,19 +298,16 @@ class TestObservationTimeline:
             },
             tool,
         )
-        call_kwargs = tool.kv_store.get_observations.call_args
-        assert call_kwargs.kwargs["project"] == "myproj"
-        assert call_kwargs.kwargs["obs_type"] == "error"
-        assert call_kwargs.kwargs["session_id"] == "s-1"
-        assert call_kwargs.kwargs["limit"] == 10
-
-    def test_hours_back_computes_after(self):
+        call_kwargs = tool.kv_store.last_kwargs
+        assert call_kwargs["project"] == "myproj"
+        assert call_kwargs["obs_type"] == "error"
+        assert call_kwargs["session_id"] == "s-1"
+        assert call_kwargs["limit"] == 10
+
+    def test_hours_back_computes_after(self, monkeypatch):
+        monkeypatch.setattr(request_router, "datetime", _FixedUtcDatetime)
         tool = self._make_mock_tool([])
         handle_observation_timeline({"hours_back": 48}, tool)
-        call_kwargs = tool.kv_store.get_observations.call_args
-        after_str = call_kwargs.kwargs["after"]
-        # Should be ~48h ago
-        after_dt = datetime.fromisoformat(after_str.rstrip("Z"))
-        expected = datetime.utcnow() - timedelta(hours=48)
-        # Allow 5 second tolerance
-        assert abs((after_dt - expected).total_seconds()) < 5
+        after_str = tool.kv_store.last_kwargs["after"]
+        # Exactly 48h before the fixed clock
+        assert datetime.fromisoformat(after_str) == datetime(2026, 2, 3, 12, 0, 0)
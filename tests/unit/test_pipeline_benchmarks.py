@@ -8,50 +8,71 @@ Validates that:
 """
 
 import time
+
+import numpy as np
 import pytest
 from unittest.mock import MagicMock
-from src.nexus.processor import NexusProcessor
+
+# Shared read-only (n, 384) float32 embeddings; deduplicate() takes ndarrays.
+_RNG = np.random.default_rng(42)
+_RAND_EMB_50 = _RNG.random((50, 384), dtype=np.float32)
+_EYE_EMB_10 = np.eye(10, 384, dtype=np.float32)
+_SAME_EMB_5 = np.repeat(_RAND_EMB_50[:1], 5, axis=0)
+for _emb in (_RAND_EMB_50, _EYE_EMB_10, _SAME_EMB_5):
+    _emb.setflags(write=False)
 
 
 @pytest.fixture
 def processor():
-    """NexusProcessor with mocked backends."""
+    """NexusProcessor with spec'd mock backends; tests set encode.return_value."""
+    # Imported here so collecting this module does not pull in pgmpy/chromadb.
+    from src.bayesian.probabilistic_query_engine import ProbabilisticQueryEngine
+    from src.indexing.embedding_pipeline import EmbeddingPipeline
+    from src.indexing.vector_indexer import VectorIndexer
+    from src.nexus.processor import NexusProcessor
+    from src.services.graph_query_engine import GraphQueryEngine
+
     p = NexusProcessor(
-        vector_indexer=MagicMock(),
-        graph_query_engine=MagicMock(),
-        probabilistic_query_engine=MagicMock(),
-        embedding_pipeline=MagicMock(),
+        vector_indexer=MagicMock(spec=VectorIndexer),
+        graph_query_engine=MagicMock(spec=GraphQueryEngine),
+        probabilistic_query_engine=MagicMock(spec=ProbabilisticQueryEngine),
+        embedding_pipeline=MagicMock(spec=EmbeddingPipeline),
         reranker=None,
         rerank_enabled=False,
     )
     return p
 
 
+@pytest.fixture(scope="module")
+def stage_processor():
+    """Backend-free NexusProcessor shared by the stateless scoring/filter tests."""
+    from src.nexus.processor import NexusProcessor
+
+    return NexusProcessor(reranker=None, rerank_enabled=False)
+
+
 class TestDedupPerformance:
     """Verify dedup scales linearly after P0-1 fix."""
 
     def _make_candidates(self, n):
         """Generate n unique candidate dicts."""
+        scores = (0.8 - np.arange(n, dtype=np.float64) * 0.001).tolist()
         return [
             {
                 "id": f"doc_{i}",
                 "text": f"unique document number {i} with distinct content",
                 "metadata": {},
-                "score": 0.8 - (i * 0.001),
+                "score": score,
                 "tier": "vector",
             }
-            for i in range(n)
+            for i, score in enumerate(scores)
         ]
 
     def test_dedup_small_batch(self, processor):
         """Dedup 50 items completes quickly."""
         candidates = self._make_candidates(50)
         # Mock embedding pipeline for batch encode
-        import numpy as np
-
-        processor.embedding_pipeline.encode = MagicMock(
-            return_value=np.random.rand(50, 384).tolist()
-        )
+        processor.embedding_pipeline.encode.return_value = _RAND_EMB_50
         start = time.perf_counter()
         result = processor.deduplicate(candidates)
         elapsed = time.perf_counter() - start
@@ -61,23 +82,16 @@ class TestDedupPerformance:
     def test_dedup_preserves_unique_items(self, processor):
         """All unique items survive dedup."""
         candidates = self._make_candidates(10)
-        import numpy as np
-
         # Use identity-like embeddings so no two are similar
-        embeddings = np.eye(10, 384).tolist()
-        processor.embedding_pipeline.encode = MagicMock(return_value=embeddings)
+        processor.embedding_pipeline.encode.return_value = _EYE_EMB_10
         result = processor.deduplicate(candidates)
         assert len(result) == 10
 
     def test_dedup_removes_duplicates(self, processor):
         """Near-identical items get deduplicated."""
         candidates = self._make_candidates(5)
-        import numpy as np
-
-        # Make all embeddings nearly identical
-        base = np.random.rand(384)
-        embeddings = [base.tolist()] * 5
-        processor.embedding_pipeline.encode = MagicMock(return_value=embeddings)
+        # Make all embeddings identical
+        processor.embedding_pipeline.encode.return_value = _SAME_EMB_5
         result = processor.deduplicate(candidates)
         assert len(result) == 1, f"Expected 1 after dedup, got {len(result)}"
 
@@ -85,29 +99,25 @@ class TestDedupPerformance:
 class TestHybridScoring:
     """Verify _calculate_hybrid_score is consistent."""
 
-    def test_default_weights(self, processor):
+    @pytest.mark.parametrize(
+        "vector, graph, bayesian, expected",
+        [
+            (1.0, 1.0, 1.0, 1.0),  # default weights: 0.4 + 0.4 + 0.2
+            (1.0, 0.0, 0.0, 0.4),  # only vector tier has score
+            (0.0, 0.0, 0.0, 0.0),  # all zeros gives zero
+        ],
+    )
+    def test_default_weights(self, stage_processor, vector, graph, bayesian, expected):
         """Default weights: vector=0.4, hipporag=0.4, bayesian=0.2."""
-        score = processor._calculate_hybrid_score(
-            vector_score=1.0, graph_score=1.0, bayesian_score=1.0
+        score = stage_processor._calculate_hybrid_score(
+            vector_score=vector, graph_score=graph, bayesian_score=bayesian
         )
-        assert abs(score - 1.0) < 0.001
-
-    def test_vector_only(self, processor):
-        """Only vector tier has score."""
-        score = processor._calculate_hybrid_score(
-            vector_score=1.0, graph_score=0.0, bayesian_score=0.0
-        )
-        assert abs(score - 0.4) < 0.001
-
-    def test_zero_scores(self, processor):
-        """All zeros gives zero."""
-        score = processor._calculate_hybrid_score(
-            vector_score=0.0, graph_score=0.0, bayesian_score=0.0
-        )
-        assert score == 0.0
+        assert abs(score - expected) < 0.001
 
     def test_custom_weights(self):
         """Custom weights are respected."""
+        from src.nexus.processor import NexusProcessor
+
         p = NexusProcessor(weights={"vector": 0.6, "hipporag": 0.3, "bayesian": 0.1})
         score = p._calculate_hybrid_score(
             vector_score=1.0, graph_score=0.0, bayesian_score=0.0
@@ -118,23 +128,19 @@ class TestHybridScoring:
 class TestFilterStage:
     """Verify filter stage thresholds."""
 
-    def test_filter_removes_low_confidence(self, processor):
-        """Items below threshold get filtered."""
-        candidates = [
-            {"id": "a", "text": "hi", "score": 0.1, "metadata": {}, "tier": "v"},
-            {"id": "b", "text": "hi", "score": 0.5, "metadata": {}, "tier": "v"},
-            {"id": "c", "text": "hi", "score": 0.9, "metadata": {}, "tier": "v"},
-        ]
-        result = processor.filter_by_confidence(candidates)
-        scores = [r["score"] for r in result]
-        assert all(s >= 0.3 for s in scores)
-        assert len(result) == 2
-
-    def test_filter_keeps_all_above_threshold(self, processor):
-        """All items above threshold survive."""
+    @pytest.mark.parametrize(
+        "scores, expected_len",
+        [
+            ([0.1, 0.5, 0.9], 2),  # items below threshold get filtered
+            ([0.5] * 20, 20),  # all items above threshold survive
+        ],
+    )
+    def test_filter_threshold(self, stage_processor, scores, expected_len):
+        """Only items at or above the 0.3 threshold survive."""
         candidates = [
-            {"id": f"d{i}", "text": "t", "score": 0.5, "metadata": {}, "tier": "v"}
-            for i in range(20)
+            {"id": f"d{i}", "text": "t", "score": score, "metadata": {}, "tier": "v"}
+            for i, score in enumerate(scores)
         ]
-        result = processor.filter_by_confidence(candidates)
-        assert len(result) == 20
+        result = stage_processor.filter_by_confidence(candidates)
+        assert all(r["score"] >= 0.3 for r in result)
+        assert len(result) == expected_len
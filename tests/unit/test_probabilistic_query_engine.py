@@ -10,6 +10,7 @@ import pytest
 from src.bayesian.probabilistic_query_engine import ProbabilisticQueryEngine
 from pgmpy.models import BayesianNetwork
 from pgmpy.factors.discrete import TabularCPD
+from tests.unit._nasa_util import check_rule10
 
 
 class TestProbabilisticQueryEngine:
@@ -209,12 +210,4 @@ class TestProbabilisticQueryEngine:
 # NASA Rule 10 Compliance Check
 def test_nasa_rule_10_compliance():
     """Verify all ProbabilisticQueryEngine methods are ≤60 LOC."""
-    import ast
-
-    with open("src/bayesian/probabilistic_query_engine.py", "r", encoding="utf-8") as f:
-        tree = ast.parse(f.read())
-
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            func_lines = node.end_lineno - node.lineno + 1
-            assert func_lines <= 60, f"{node.name} exceeds 60 LOC ({func_lines})"
+    check_rule10("src/bayesian/probabilistic_query_engine.py")
@@ -9,6 +9,7 @@ Target: 10 tests, ~100 LOC
 import pytest
 import numpy as np
 from src.clustering.raptor_clusterer import RAPTORClusterer
+from tests.unit._nasa_util import check_rule10
 
 
 class TestRAPTORClusterer:
@@ -173,12 +174,4 @@ class TestRAPTORClusterer:
 # NASA Rule 10 Compliance Check
 def test_nasa_rule_10_compliance():
     """Verify all RAPTORClusterer methods are ≤60 LOC."""
-    import ast
-
-    with open("src/clustering/raptor_clusterer.py", "r", encoding="utf-8") as f:
-        tree = ast.parse(f.read())
-
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            func_lines = node.end_lineno - node.lineno + 1
-            assert func_lines <= 60, f"{node.name} exceeds 60 LOC ({func_lines})"
+    check_rule10("src/clustering/raptor_clusterer.py")
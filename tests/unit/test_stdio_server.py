@@ -36,6 +36,47 @@ class TestLoadConfig:
             with pytest.raises(FileNotFoundError):
                 load_config()
 
+    def test_load_config_returns_independent_copies(self):
+        """Test cached config is copied, so caller mutations do not leak."""
+        first = load_config()
+        first.setdefault("storage", {})["data_dir"] = "/mutated"
+
+        assert load_config().get("storage", {}).get("data_dir") != "/mutated"
+
+    def test_load_config_parses_once_until_file_changes(self, tmp_path):
+        """Test YAML is parsed once per file version, re-parsed after edits."""
+        import os
+        import yaml
+
+        config_path = tmp_path / "memory-mcp.yaml"
+        config_path.write_text("storage:\n  data_dir: /a\n")
+
+        with patch("yaml.load", wraps=yaml.load) as parse:
+            assert load_config(config_path)["storage"]["data_dir"] == "/a"
+            assert load_config(config_path)["storage"]["data_dir"] == "/a"
+            assert parse.call_count == 1
+
+            config_path.write_text("storage:\n  data_dir: /b\n")
+            stat = config_path.stat()
+            os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+            assert load_config(config_path)["storage"]["data_dir"] == "/b"
+            assert parse.call_count == 2
+
+    def test_load_config_reparses_same_mtime_edit_with_new_size(self, tmp_path):
+        """Test an edit that keeps the mtime (coarse clocks) still re-parses."""
+        import os
+
+        config_path = tmp_path / "memory-mcp.yaml"
+        config_path.write_text("storage:\n  data_dir: /a\n")
+        stat = config_path.stat()
+        assert load_config(config_path)["storage"]["data_dir"] == "/a"
+
+        config_path.write_text("storage:\n  data_dir: /longer\n")
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert load_config(config_path)["storage"]["data_dir"] == "/longer"
+
 
 class TestHandleListTools:
     """Test suite for handle_list_tools function."""